@@ -0,0 +1,21 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmarks for the declarative runtime.
+
+The benchmarks follow the airspeed velocity (asv) conventions: each
+module defines classes with a ``setup`` method and ``time_*`` methods,
+optionally parametrized through ``params`` and ``param_names``. None of
+them require a toolkit, so they can be run headless either with asv::
+
+    asv run --config benchmarks/asv.conf.json
+
+or, without asv installed, with the bundled runner::
+
+    python -m benchmarks [pattern]
+
+"""
@@ -0,0 +1,85 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" A minimal runner for the benchmarks when asv is not available.
+
+Usage::
+
+    python -m benchmarks [-n REPEAT] [pattern]
+
+Only the benchmarks whose full name contains the pattern are run. The
+best time out of the repeats is reported for each parameter value.
+
+"""
+import argparse
+import importlib
+import itertools
+import os
+import timeit
+
+
+def iter_benchmarks():
+    """ Iterate over the benchmark classes of the package.
+
+    Yields
+    ------
+    name, cls : tuple
+        The full name and the benchmark class.
+
+    """
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(folder)):
+        if not (filename.startswith('bench_') and filename.endswith('.py')):
+            continue
+        modname = filename[:-3]
+        module = importlib.import_module(__package__ + '.' + modname)
+        for name in sorted(dir(module)):
+            cls = getattr(module, name)
+            if (isinstance(cls, type) and cls.__module__ == module.__name__
+                    and any(a.startswith('time_') for a in dir(cls))):
+                yield '%s.%s' % (modname, name), cls
+
+
+def run_benchmark(cls, method, params, repeat):
+    """ Run a single benchmark method and return the best time.
+
+    """
+    instance = cls()
+    if hasattr(instance, 'setup'):
+        instance.setup(*params)
+    try:
+        func = getattr(instance, method)
+        return min(timeit.repeat(lambda: func(*params), number=1,
+                                 repeat=repeat))
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*params)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('pattern', nargs='?', default='')
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, cls in iter_benchmarks():
+        params = getattr(cls, 'params', [])
+        if params and not isinstance(params[0], list):
+            params = [params]
+        for method in sorted(a for a in dir(cls) if a.startswith('time_')):
+            full_name = '%s.%s' % (name, method)
+            if args.pattern not in full_name:
+                continue
+            for values in itertools.product(*params):
+                best = run_benchmark(cls, method, values, args.repeat)
+                label = ', '.join(str(v) for v in values)
+                print('{:<60} {:>12} {:>10.3f}ms'.format(
+                    full_name, label, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmarks for parsing and compiling enaml sources.
+
+"""
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+
+
+def make_source(count):
+    """ Generate an enaml source with the given number of enamldefs.
+
+    """
+    lines = [
+        'from atom.api import Int',
+        'from enaml.core.declarative import Declarative',
+        '',
+    ]
+    for i in range(count):
+        lines.extend([
+            'enamldef Item%d(Declarative): item:' % i,
+            '    attr value : int = %d' % i,
+            '    attr double << value * 2',
+            '    event clicked',
+            '    clicked ::',
+            '        item.value += 1',
+            '    func total(other):',
+            '        return value + double + other',
+            '    Declarative:',
+            '        name = "child_%d"' % i,
+            '        attr mirror := item.value',
+            '',
+        ])
+    return '\n'.join(lines)
+
+
+class Parse(object):
+    """ Benchmark the enaml parser.
+
+    """
+    params = [10, 100]
+    param_names = ['enamldefs']
+
+    def setup(self, count):
+        self.source = make_source(count)
+
+    def time_parse(self, count):
+        parse(self.source, '<benchmark>')
+
+
+class Compile(object):
+    """ Benchmark the enaml compiler on an already parsed module.
+
+    """
+    params = [10, 100]
+    param_names = ['enamldefs']
+
+    def setup(self, count):
+        self.ast = parse(make_source(count), '<benchmark>')
+
+    def time_compile(self, count):
+        EnamlCompiler.compile(self.ast, '<benchmark>')
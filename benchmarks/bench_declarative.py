@@ -0,0 +1,188 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmarks for the instantiation and updates of declarative trees.
+
+"""
+from textwrap import dedent
+
+from .utils import compile_source
+
+
+TREE_SOURCE = dedent("""\
+from enaml.core.declarative import Declarative
+
+enamldef Leaf(Declarative):
+    attr value : int = 0
+    attr double << value * 2
+
+enamldef Branch(Declarative):
+    attr value : int = 0
+    Leaf:
+        value << parent.value
+    Leaf:
+        value << parent.value + 1
+    Leaf:
+        value << parent.value + 2
+
+enamldef Main(Declarative):
+    attr value : int = 0
+""")
+
+
+def build_tree(Main, Branch, count):
+    """ Build a tree with the given number of branches.
+
+    """
+    main = Main()
+    for i in range(count):
+        branch = Branch(main)
+        branch.value = i
+    return main
+
+
+class InstantiateTree(object):
+    """ Benchmark the instantiation of large enamldef trees.
+
+    """
+    params = [100, 1000]
+    param_names = ['branches']
+
+    def setup(self, count):
+        namespace = compile_source(TREE_SOURCE)
+        self.Main = namespace['Main']
+        self.Branch = namespace['Branch']
+
+    def time_instantiate(self, count):
+        build_tree(self.Main, self.Branch, count)
+
+    def time_instantiate_initialize(self, count):
+        build_tree(self.Main, self.Branch, count).initialize()
+
+
+SUBSCRIBE_SOURCE = dedent("""\
+from atom.api import Atom, Int
+from enaml.core.declarative import Declarative
+
+class Model(Atom):
+    a = Int()
+    b = Int()
+
+enamldef Observer(Declarative):
+    attr model
+    attr total << model.a + model.b
+    attr scaled << total * 2 if model.a % 2 else total
+
+enamldef Main(Declarative):
+    attr model = Model()
+""")
+
+
+class SubscriptionUpdates(object):
+    """ Benchmark the update throughput of the subscription operator.
+
+    Every change of the model re-evaluates the expressions through
+    the StandardTracedReadHandler, which retraces the dependencies.
+
+    """
+    params = [1, 100]
+    param_names = ['observers']
+
+    def setup(self, count):
+        namespace = compile_source(SUBSCRIBE_SOURCE)
+        self.main = main = namespace['Main']()
+        for i in range(count):
+            namespace['Observer'](main, model=main.model)
+        main.initialize()
+        # Evaluate the expressions once to hook up the subscriptions.
+        for child in main.children:
+            child.scaled
+
+    def time_updates(self, count):
+        model = self.main.model
+        for i in range(100):
+            model.a = i
+            model.b = i
+
+
+LOOPER_SOURCE = dedent("""\
+from enaml.core.api import Looper
+from enaml.core.declarative import Declarative
+
+enamldef Row(Declarative):
+    attr value
+
+enamldef Main(Declarative):
+    attr iterable = []
+    Looper:
+        iterable << parent.iterable
+        Row:
+            value = loop_item
+""")
+
+
+class LooperRefresh(object):
+    """ Benchmark the refresh of a looper over large iterables.
+
+    """
+    params = [100, 1000]
+    param_names = ['items']
+
+    def setup(self, count):
+        self.Main = compile_source(LOOPER_SOURCE)['Main']
+        self.items = list(range(count))
+        self.main = main = self.Main(iterable=self.items)
+        main.initialize()
+
+    def time_create(self, count):
+        main = self.Main(iterable=self.items)
+        main.initialize()
+
+    def time_reverse(self, count):
+        main = self.main
+        main.iterable = main.iterable[::-1]
+
+    def time_replace(self, count):
+        main = self.main
+        main.iterable = [i + 1 for i in main.iterable]
+
+    def time_append(self, count):
+        main = self.main
+        main.iterable = main.iterable + [len(main.iterable)]
+
+
+SCOPE_SOURCE = dedent("""\
+from enaml.core.declarative import Declarative
+
+enamldef Node(Declarative):
+    func lookup():
+        return value
+
+enamldef Main(Declarative):
+    attr value : int = 0
+""")
+
+
+class AncestorLookups(object):
+    """ Benchmark the lookups of the names provided by the ancestors of
+    the scope owner, which walk the parent chain on a cache miss.
+
+    """
+    params = [1, 10, 30]
+    param_names = ['depth']
+
+    def setup(self, depth):
+        namespace = compile_source(SCOPE_SOURCE)
+        node = namespace['Main']()
+        for i in range(depth):
+            node = namespace['Node'](node)
+        self.node = node
+
+    def time_lookups(self, depth):
+        lookup = self.node.lookup
+        for i in range(1000):
+            lookup()
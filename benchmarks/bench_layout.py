@@ -0,0 +1,119 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmarks for the constraints layout manager.
+
+"""
+from atom.api import List, Tuple, Typed
+
+from enaml.layout.api import hbox, vbox
+from enaml.layout.constrainable import (
+    ConstrainableMixin, ContentsConstrainableMixin
+)
+from enaml.layout.layout_manager import LayoutItem, LayoutManager
+
+
+class Box(ContentsConstrainableMixin):
+    """ A simple constrainable for the benchmark layout items.
+
+    """
+    pass
+
+
+class Item(LayoutItem):
+    """ A layout item which does not rely on a toolkit.
+
+    """
+    box = Typed(ConstrainableMixin)
+
+    user_constraints = List()
+
+    geometry = Tuple()
+
+    def constrainable(self):
+        return self.box
+
+    def constraints(self):
+        return self.user_constraints
+
+    def margins(self):
+        return ()
+
+    def size_hint(self):
+        return (40, 20)
+
+    def min_size(self):
+        return (-1, -1)
+
+    def max_size(self):
+        return (-1, -1)
+
+    def set_geometry(self, x, y, width, height):
+        self.geometry = (x, y, width, height)
+
+
+class RootItem(Item):
+    """ A root layout item with margins.
+
+    """
+    def margins(self):
+        return (10, 10, 10, 10)
+
+
+def make_items(count):
+    """ Create a root item and a grid like layout of items.
+
+    """
+    root = RootItem(box=Box())
+    items = [Item(box=ConstrainableMixin()) for i in range(count)]
+    rows = [hbox(*[i.box for i in items[j:j + 10]])
+            for j in range(0, count, 10)]
+    root.user_constraints = [vbox(*rows)]
+    return root, items
+
+
+class LayoutSetItems(object):
+    """ Benchmark the creation of the constraints system.
+
+    """
+    params = [10, 100]
+    param_names = ['items']
+
+    def setup(self, count):
+        self.root, self.items = make_items(count)
+        self.manager = LayoutManager(self.root)
+        self.manager.set_items(self.items)
+
+    def time_set_items(self, count):
+        LayoutManager(self.root).set_items(self.items)
+
+    def time_set_items_again(self, count):
+        self.manager.set_items(self.items)
+
+
+class LayoutResize(object):
+    """ Benchmark the resizing of a solved layout.
+
+    """
+    params = [10, 100]
+    param_names = ['items']
+
+    def setup(self, count):
+        root, items = make_items(count)
+        self.manager = LayoutManager(root)
+        self.manager.set_items(items)
+
+    def time_resize(self, count):
+        resize = self.manager.resize
+        for i in range(10):
+            resize(800 + i * 10, 600 + i * 10)
+
+    def time_size_queries(self, count):
+        manager = self.manager
+        manager.best_size()
+        manager.min_size()
+        manager.max_size()
@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmarks for the style sheet matching.
+
+"""
+from textwrap import dedent
+
+from enaml.styling import StyleCache
+
+from .utils import compile_source
+
+
+STYLE_SOURCE = dedent("""\
+from enaml.styling import Stylable, StyleSheet, Style, Setter
+
+enamldef Sheet(StyleSheet):
+    Style:
+        Setter:
+            field = 'color'
+            value = 'black'
+    Style:
+        element = 'Stylable'
+        Setter:
+            field = 'background'
+            value = 'white'
+    Style:
+        style_class = 'even'
+        Setter:
+            field = 'background'
+            value = 'gray'
+    Style:
+        element = 'Stylable'
+        style_class = 'odd, last'
+        Setter:
+            field = 'background'
+            value = 'red'
+    Style:
+        object_name = 'item_0, item_1'
+        pseudo_class = 'hover'
+        Setter:
+            field = 'color'
+            value = 'blue'
+
+enamldef Main(Stylable):
+    Sheet:
+        pass
+""")
+
+
+def clear_style_cache():
+    """ Clear the matching, index and translation caches of the style
+    cache.
+
+    """
+    StyleCache._item_style_sheets.clear()
+    StyleCache._item_styles.clear()
+    StyleCache._style_sheet_items.clear()
+    StyleCache._style_items.clear()
+    StyleCache._queried_items.clear()
+    StyleCache._toolkit_setters.clear()
+    StyleCache._toolkit_styles.clear()
+    StyleCache._style_sheet_indices.clear()
+
+
+class StyleQueries(object):
+    """ Benchmark the queries of the styles which apply to items.
+
+    """
+    params = [100, 1000]
+    param_names = ['items']
+
+    def setup(self, count):
+        namespace = compile_source(STYLE_SOURCE)
+        Stylable = namespace['Stylable']
+        self.main = main = namespace['Main']()
+        for i in range(count):
+            Stylable(
+                main, name='item_%d' % i,
+                style_class='even' if i % 2 == 0 else 'odd',
+            )
+        main.initialize()
+        self.items = [c for c in main.children if isinstance(c, Stylable)]
+        clear_style_cache()
+
+    def teardown(self, count):
+        clear_style_cache()
+
+    def time_cold_queries(self, count):
+        clear_style_cache()
+        styles = StyleCache.styles
+        for item in self.items:
+            styles(item)
+
+    def time_cached_queries(self, count):
+        styles = StyleCache.styles
+        for item in self.items:
+            styles(item)
@@ -0,0 +1,36 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Utility functions shared by the benchmarks.
+
+"""
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+
+
+def compile_source(source, filename='<benchmark>'):
+    """ Compile Enaml source code and return the resulting namespace.
+
+    Parameters
+    ----------
+    source : str
+        The Enaml source code string to compile.
+
+    filename : str, optional
+        The filename to use when compiling the code.
+
+    Returns
+    -------
+    result : dict
+        The namespace in which the compiled code was executed.
+
+    """
+    code = EnamlCompiler.compile(parse(source, filename), filename)
+    namespace = {}
+    exec_(code, namespace)
+    return namespace
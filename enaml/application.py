@@ -8,10 +8,11 @@
 from heapq import heappush, heappop
 from itertools import count
 from threading import Lock
+from time import time
 
 from atom.api import (
     Atom, Bool, Typed, ForwardTyped, Tuple, Dict, Callable, Value, List,
-    observe
+    Float, Int, observe
 )
 
 
@@ -115,6 +116,45 @@ class ScheduledTask(Atom):
         return self._result
 
 
+class ScheduleStats(Atom):
+    """ Counters which instrument the task queue of the Application.
+
+    """
+    #: The number of tasks currently waiting in the queue.
+    depth = Int()
+
+    #: The largest number of tasks which waited in the queue.
+    max_depth = Int()
+
+    #: The number of event loop wakeups used to run the tasks.
+    wakeups = Int()
+
+    #: The total number of executed tasks.
+    tasks = Int()
+
+    #: The total time, in seconds, the executed tasks spent waiting.
+    total_wait = Float()
+
+    #: The longest time, in seconds, a task spent waiting.
+    max_wait = Float()
+
+    def mean_wait(self):
+        """ Get the average time, in seconds, a task spent waiting.
+
+        """
+        if self.tasks == 0:
+            return 0.0
+        return self.total_wait / self.tasks
+
+    def reset(self):
+        """ Reset all of the counters to zero, except for the depth.
+
+        """
+        self.max_depth = self.depth
+        self.wakeups = self.tasks = 0
+        self.total_wait = self.max_wait = 0.0
+
+
 class ProxyResolver(Atom):
     """ An object which resolves requests for proxy objects.
 
@@ -168,9 +208,26 @@ class Application(Atom):
     #: The style sheet to apply to the entire application.
     style_sheet = ForwardTyped(StyleSheet)
 
+    #: The cache of the resolved proxy classes, keyed on the declaration
+    #: class. It is cleared when the resolver or its factories change.
+    _proxy_classes = Typed(dict, ())
+
+    #: The maximum time, in seconds, spent running scheduled tasks in a
+    #: single iteration of the event loop. The remaining tasks are run
+    #: on the next iterations, which lets the paint and input events be
+    #: processed in between. A value of zero, the default, disables the
+    #: limit.
+    schedule_budget = Float(0.0)
+
+    #: The counters which instrument the task queue.
+    schedule_stats = Typed(ScheduleStats, ())
+
     #: The task heap for application tasks.
     _task_heap = List()
 
+    #: Whether or not a drain of the task heap is posted or running.
+    _draining = Bool(False)
+
     #: The counter to break heap ties.
     _counter = Value(factory=count)
 
@@ -210,25 +267,52 @@ class Application(Atom):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _process_task(self, task):
-        """ Processes the given task, then dispatches the next task.
+    def _drain_tasks(self):
+        """ Run the scheduled tasks on the main gui thread.
+
+        The tasks are run in priority order until the heap is empty or
+        the schedule budget is spent, in which case the drain is posted
+        again to run the remaining tasks on a later event loop cycle.
+        The tasks scheduled while the drain is running are left to the
+        next drain, so that a task which schedules itself again does
+        not keep control away from the event loop.
 
         """
+        heap = self._task_heap
+        stats = self.schedule_stats
+        budget = self.schedule_budget
+        start = time()
+        stats.wakeups += 1
+        with self._heap_lock:
+            last = next(self._counter)
         try:
-            task._execute()
+            while True:
+                with self._heap_lock:
+                    if not heap or heap[0][1] > last:
+                        break
+                    priority, ignored, posted, task = heappop(heap)
+                    stats.depth = len(heap)
+                wait = time() - posted
+                stats.tasks += 1
+                stats.total_wait += wait
+                if wait > stats.max_wait:
+                    stats.max_wait = wait
+                task._execute()
+                if budget > 0 and time() - start >= budget:
+                    break
         finally:
-            self._next_task()
+            with self._heap_lock:
+                if heap:
+                    self.deferred_call(self._drain_tasks)
+                else:
+                    self._draining = False
 
-    def _next_task(self):
-        """ Pulls the next task off the heap and processes it on the
-        main gui thread.
+    @observe('resolver', 'resolver.factories')
+    def _clear_proxy_classes(self, change):
+        """ An observer which clears the cache of the proxy classes.
 
         """
-        heap = self._task_heap
-        with self._heap_lock:
-            if heap:
-                priority, ignored, task = heappop(heap)
-                self.deferred_call(self._process_task, task)
+        self._proxy_classes.clear()
 
     @observe('style_sheet.destroyed')
     def _clear_destroyed_style_sheet(self, change):
@@ -277,6 +361,29 @@ class Application(Atom):
         """
         raise NotImplementedError
 
+    def keyed_deferred_call(self, key, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the main event loop
+        thread, replacing the pending call with the same key.
+
+        This is meant for the calls which publish a value, where only
+        the latest value matters. The default implementation does not
+        coalesce the calls and defers to 'deferred_call'.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying the calls which replace each other.
+
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        args, kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        self.deferred_call(callback, *args, **kwargs)
+
     def timed_call(self, ms, callback, *args, **kwargs):
         """ Invoke a callable on the main event loop thread at a
         specified time in the future.
@@ -325,8 +432,9 @@ class Application(Atom):
     def resolve_proxy_class(self, declaration_class):
         """ Resolve the proxy implementation class for a declaration.
 
-        This can be reimplemented by Application subclasses if more
-        control is needed.
+        The resolved classes are cached per declaration class. This can
+        be reimplemented by Application subclasses if more control is
+        needed.
 
         Parameters
         ----------
@@ -341,13 +449,43 @@ class Application(Atom):
             if one could not be resolved.
 
         """
+        cls = self._proxy_classes.get(declaration_class)
+        if cls is not None:
+            return cls
         resolver = self.resolver
         for base in declaration_class.mro():
             name = base.__name__
             cls = resolver.resolve(name)
             if cls is not None:
+                self._proxy_classes[declaration_class] = cls
                 return cls
 
+    def preload_proxy_classes(self, declaration_classes):
+        """ Resolve and cache the proxy classes of declarations.
+
+        This can be called at startup to pay the cost of the proxy
+        resolution, including the toolkit imports, up front.
+
+        Parameters
+        ----------
+        declaration_classes : iterable
+            The ToolkitObject subclasses for which the proxy classes
+            should be resolved.
+
+        """
+        for declaration_class in declaration_classes:
+            self.resolve_proxy_class(declaration_class)
+
+    def clear_proxy_classes(self):
+        """ Clear the cache of the resolved proxy classes.
+
+        The cache is cleared automatically when the resolver or its
+        factories are replaced. This method should be called when
+        the factories dictionary is modified in place.
+
+        """
+        self._proxy_classes.clear()
+
     def create_proxy(self, declaration):
         """ Create the proxy object for the given declaration.
 
@@ -410,15 +548,23 @@ class Application(Atom):
             kwargs = {}
         task = ScheduledTask(callback, args, kwargs)
         heap = self._task_heap
+        stats = self.schedule_stats
         with self._heap_lock:
-            needs_start = len(heap) == 0
-            item = (-priority, next(self._counter), task)
+            item = (-priority, next(self._counter), time(), task)
             heappush(heap, item)
+            stats.depth = depth = len(heap)
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+            needs_start = not self._draining
+            self._draining = True
         if needs_start:
-            if self.is_main_thread():
-                self._next_task()
-            else:
-                self.deferred_call(self._next_task)
+            try:
+                self.deferred_call(self._drain_tasks)
+            except Exception:
+                # The drain was not posted, the next call must retry.
+                with self._heap_lock:
+                    self._draining = False
+                raise
         return task
 
     def has_pending_tasks(self):
@@ -473,6 +619,33 @@ def deferred_call(callback, *args, **kwargs):
     app.deferred_call(callback, *args, **kwargs)
 
 
+def keyed_deferred_call(key, callback, *args, **kwargs):
+    """ Invoke a callable on the next cycle of the main event loop
+    thread, replacing the pending call with the same key.
+
+    This is a convenience function for invoking the same method on the
+    current application instance. If an application instance does not
+    exist, a RuntimeError will be raised.
+
+    Parameters
+    ----------
+    key : hashable
+        The key identifying the calls which replace each other.
+
+    callback : callable
+        The callable object to execute at some point in the future.
+
+    args, kwargs
+        Any additional positional and keyword arguments to pass to
+        the callback.
+
+    """
+    app = Application.instance()
+    if app is None:
+        raise RuntimeError('Application instance does not exist')
+    app.keyed_deferred_call(key, callback, *args, **kwargs)
+
+
 def timed_call(ms, callback, *args, **kwargs):
     """ Invoke a callable on the main event loop thread at a specified
     time in the future.
@@ -5,6 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import os
 import sys
 import re
 import codecs
@@ -266,3 +267,20 @@ else:
         elif locs is None:
             locs = globs
         exec("""exec code in globs, locs""")
+
+
+# Atomic file replacement
+if IS_PY3:
+    from os import replace as replace_file
+
+else:
+    def replace_file(src, dst):
+        """Rename src to dst, overwriting dst if it exists.
+
+        The operation is atomic on POSIX systems. On Windows, the
+        destination is removed first since os.rename cannot overwrite.
+
+        """
+        if sys.platform == 'win32' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
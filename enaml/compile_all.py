@@ -7,10 +7,16 @@
 #------------------------------------------------------------------------------
 """ Command-line tool to compile .py and .enaml files.
 
+In addition to the options supported by the standard compileall module,
+the ``-j N`` or ``--workers N`` option can be used to compile the enaml
+files in N worker processes. A value of 0 uses one worker per cpu.
+
 """
 import os
 import sys
+import time
 import compileall
+import multiprocessing
 
 from enaml.compat import IS_PY3
 from enaml.core.import_hooks import EnamlImporter, make_file_info
@@ -27,17 +33,18 @@ def compile_enaml_file(fullname, ddir=None, force=0, rx=None, quiet=0,
     """
     fullname = os.path.abspath(fullname)
     importer = EnamlImporter(make_file_info(fullname))
-    if not quiet:
-        print('Compiling {}...'.format(fullname))
+    start = time.time()
     try:
         if force:
             importer.compile_code()
         else:
             importer.get_code()
+        if not quiet:
+            print('Compiled {} in {:.3f}s'.format(fullname,
+                                                 time.time() - start))
         return True if IS_PY3 else 1
     except Exception as e:
-        if quiet:
-            print('Compiling {}...'.format(fullname))
+        print('Compiling {}...'.format(fullname))
         print(str(e))
     # Failed
     return False if IS_PY3 else 0
@@ -69,6 +76,12 @@ def compile_file(fullname, ddir=None, force=0, rx=None, quiet=0,
             return compile_py_file(fullname, ddir, force, rx, quiet,
                                    *args, **kwargs)
         elif tail == '.enaml':
+            if _pool is not None:
+                _pending.append(_pool.apply_async(
+                    compile_enaml_file,
+                    (fullname, ddir, force, rx, quiet) + args, kwargs
+                ))
+                return True if IS_PY3 else 1
             return compile_enaml_file(fullname, ddir, force, rx, quiet,
                                       *args, **kwargs)
     return True if IS_PY3 else 1
@@ -79,8 +92,77 @@ if compileall.compile_file != compile_file:
     compileall.compile_file = compile_file
 
 
+#: The pool of worker processes used to compile the enaml files.
+_pool = None
+
+#: The pending results of the enaml files compiled in the pool.
+_pending = []
+
+
+def pop_workers(argv):
+    """ Remove the worker option from the command line arguments.
+
+    Parameters
+    ----------
+    argv : list
+        The list of command line arguments. It is modified in place.
+
+    Returns
+    -------
+    result : int or None
+        The requested number of workers or None if the option was not
+        given. A value of 0 means one worker per cpu.
+
+    """
+    workers = None
+    index = 1
+    while index < len(argv):
+        arg = argv[index]
+        if arg == '--':
+            break
+        if arg in ('-j', '--workers'):
+            if index + 1 >= len(argv):
+                raise ValueError('{} requires a value'.format(arg))
+            value = argv.pop(index + 1)
+        elif arg.startswith('--workers='):
+            value = arg[len('--workers='):]
+        elif arg.startswith('-j') and arg[2:].isdigit():
+            value = arg[2:]
+        else:
+            index += 1
+            continue
+        del argv[index]
+        workers = int(value)
+        if workers < 0:
+            raise ValueError('the number of workers cannot be negative')
+    return workers
+
+
 def main():
-    exit_status = int(not compileall.main())
+    global _pool
+    try:
+        workers = pop_workers(sys.argv)
+    except ValueError as e:
+        print('error: {}'.format(e))
+        sys.exit(2)
+    if workers is not None and workers != 1:
+        _pool = multiprocessing.Pool(workers or None)
+    start = time.time()
+    try:
+        success = compileall.main()
+        if _pool is not None:
+            _pool.close()
+            _pool.join()
+            for result in _pending:
+                success = result.get() and success
+    finally:
+        if _pool is not None:
+            _pool.terminate()
+            _pool = None
+        del _pending[:]
+    if workers is not None:
+        print('Compiled in {:.3f}s'.format(time.time() - start))
+    exit_status = int(not success)
     sys.exit(exit_status)
 
 
@@ -11,3 +11,5 @@ from .dynamic_template import DynamicTemplate
 from .include import Include
 from .looper import Looper
 from .object import Object
+from .standard_tracer import batch_updates
+from .view_pool import ViewPool
@@ -15,6 +15,7 @@ from atom.api import Str, Typed
 from ..compat import IS_PY3, USE_WORDCODE
 from . import byteplay as bp
 from .code_generator import CodeGenerator
+from .operators import CODE_GENERATORS, OPERATOR_CODE_KINDS
 from .enaml_ast import (
     AliasExpr, ASTVisitor, Binding, ChildDef, EnamlDef, StorageExpr, Template,
     TemplateInst, PythonExpression, PythonModule, FuncDef
@@ -470,6 +471,39 @@ def run_in_dynamic_scope(code, global_vars):
     rewrite_globals_access(code, global_vars)
 
 
+def load_operator_code(cg, code, operator):
+    """ Load the code for an operator binding onto the TOS.
+
+    The transformed code objects required by the default operators are
+    computed at compile time so that they are stored in the .enamlc
+    file, and no bytecode rewriting is needed when the module is loaded
+    from the cache. The value loaded is a 2-tuple of the original code
+    object and a tuple of (kind, code) pairs, which is the form expected
+    by the 'run_operator' helper. The code objects are stored as plain
+    constants so that their co_filename is updated with the module.
+
+    Parameters
+    ----------
+    cg : CodeGenerator
+        The code generator with which to write the code.
+
+    code : CodeType
+        The code object for the RHS expression.
+
+    operator : str
+        The operator string for the binding.
+
+    """
+    kinds = OPERATOR_CODE_KINDS.get(operator, ())
+    cg.load_const(code)
+    for kind in kinds:
+        cg.load_const(kind)
+        cg.load_const(CODE_GENERATORS[kind](code))
+        cg.build_tuple(2)
+    cg.build_tuple(len(kinds))
+    cg.build_tuple(2)
+
+
 def gen_child_def_node(cg, node, local_names):
     """ Generate the code to create the child def compiler node.
 
@@ -649,7 +683,7 @@ def gen_template_inst_binding(cg, node, index):
         cg.binary_subscr()
         cg.load_const(node.chain)
         cg.load_const(op_node.operator)
-        cg.load_const(code)
+        load_operator_code(cg, code, op_node.operator)
         cg.load_fast(F_GLOBALS)
         cg.call_function(6)
         cg.pop_top()
@@ -703,7 +737,7 @@ def gen_operator_binding(cg, node, index, name):
         cg.dup_top()
         cg.load_const(name)
         cg.load_const(node.operator)
-        cg.load_const(code)
+        load_operator_code(cg, code, node.operator)
         cg.load_fast(F_GLOBALS)
         cg.call_function(6)
         cg.pop_top()
@@ -19,7 +19,7 @@ from .declarative_function import DeclarativeFunction
 from .declarative_meta import patch_d_member
 from .enamldef_meta import EnamlDefMeta
 from .expression_engine import ExpressionEngine
-from .operators import __get_operators
+from .operators import __get_operators, precomputed_code
 from .template import Template
 from .funchelper import call_func
 
@@ -566,8 +566,10 @@ def run_operator(scope_node, node, name, op, code, f_globals):
     op : str
         The operator string which should be run to create the handlers.
 
-    code : CodeType
-        The code object for the RHS expression.
+    code : CodeType or tuple
+        The code object for the RHS expression. The compiler passes a
+        tuple of the code object and the precomputed code objects for
+        the default operators (see `load_operator_code`).
 
     f_globals : dict
         The globals dictionary to pass to the operator.
@@ -577,7 +579,12 @@ def run_operator(scope_node, node, name, op, code, f_globals):
     if op not in operators:
         raise TypeError("failed to load operator '%s'" % op)
     scope_key = scope_node.scope_key
-    pair = operators[op](code, scope_key, f_globals)
+    if isinstance(code, tuple):
+        code, generated = code
+        with precomputed_code(code, generated):
+            pair = operators[op](code, scope_key, f_globals)
+    else:
+        pair = operators[op](code, scope_key, f_globals)
     if isinstance(name, tuple):
         # The template inst binding with a single name will take this
         # path by using a length-1 name tuple. See bug #78.
@@ -5,6 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import threading
 from contextlib import contextmanager
 
 from atom.api import Atom, Bool, Str, Tuple, Typed, ForwardTyped
@@ -13,12 +14,23 @@ from atom.datastructures.api import sortedmap
 from .expression_engine import ExpressionEngine
 
 
-#: The private stack of active local scopes.
-__stack = []
+class _ScopeState(threading.local):
+    """ The thread local storage of the active local scopes.
 
+    Each thread has its own scope stack so that declarative hierarchies
+    can be instantiated from several threads at the same time.
 
-#: The private map of active local scopes.
-__map = {}
+    """
+    def __init__(self):
+        #: The stack of active local scopes.
+        self.stack = []
+
+        #: The map of active local scopes.
+        self.map = {}
+
+
+#: The private thread local state of the active local scopes.
+__state = _ScopeState()
 
 
 @contextmanager
@@ -26,7 +38,8 @@ def new_scope(key, seed=None):
     """ Create a new scope mapping and push it onto the stack.
 
     The currently active scope can be retrieved with 'peek_scope' and
-    a specific scope can be retrieved with 'fetch_scope'.
+    a specific scope can be retrieved with 'fetch_scope'. The scope
+    stack is local to the calling thread.
 
     Parameters
     ----------
@@ -47,11 +60,14 @@ def new_scope(key, seed=None):
         scope = seed.copy()
     else:
         scope = sortedmap()
-    __map[key] = scope
-    __stack.append(scope)
-    yield scope
-    __stack.pop()
-    del __map[key]
+    state = __state
+    state.map[key] = scope
+    state.stack.append(scope)
+    try:
+        yield scope
+    finally:
+        state.stack.pop()
+        del state.map[key]
 
 
 def peek_scope():
@@ -63,7 +79,7 @@ def peek_scope():
         The active scope mapping.
 
     """
-    return __stack[-1]
+    return __state.stack[-1]
 
 
 def fetch_scope(key):
@@ -80,7 +96,7 @@ def fetch_scope(key):
         The relevant local scope.
 
     """
-    return __map[key]
+    return __state.map[key]
 
 
 class CompilerNode(Atom):
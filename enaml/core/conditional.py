@@ -12,12 +12,27 @@ from .declarative import d_
 from .pattern import Pattern
 
 
+def _expand_items(items):
+    """ Yield the items along with the items of the nested patterns.
+
+    The items of a nested pattern live in the same parent, just before
+    the pattern, and are yielded in that order.
+
+    """
+    for item in items:
+        if isinstance(item, Pattern):
+            for sub_item in _expand_items(item.pattern_items()):
+                yield sub_item
+        yield item
+
+
 class Conditional(Pattern):
     """ A pattern object that represents conditional objects.
 
     When the `condition` attribute is True, the conditional will create
     its child items and insert them into its parent; when False, the old
-    items will be destroyed.
+    items will be destroyed, or detached from the parent when the
+    `keep_alive` attribute is True.
 
     """
     #: The condition variable. If this is True, a copy of the children
@@ -25,10 +40,22 @@ class Conditional(Pattern):
     #: be destroyed.
     condition = d_(Bool(True))
 
+    #: Whether or not to keep the items alive when the condition becomes
+    #: False. When True, the items are detached from the parent and the
+    #: updates of their bound expressions are suspended instead of being
+    #: destroyed. They are inserted back into the parent when the
+    #: condition becomes True again, which avoids recreating them.
+    keep_alive = d_(Bool(False))
+
     #: The list of items created by the conditional. This list should
     #: not be manipulated directly by user code.
     items = List()
 
+    #: The list of items detached by the conditional while the condition
+    #: is False and the items are kept alive. This list should not be
+    #: manipulated directly by user code.
+    _cached_items = List()
+
     #--------------------------------------------------------------------------
     # Lifetime API
     #--------------------------------------------------------------------------
@@ -39,6 +66,7 @@ class Conditional(Pattern):
 
         """
         super(Conditional, self).destroy()
+        self._destroy_cached_items()
         del self.items
 
     #--------------------------------------------------------------------------
@@ -54,6 +82,56 @@ class Conditional(Pattern):
         if change['type'] == 'update' and self.is_initialized:
             self.refresh_items()
 
+    def _observe_keep_alive(self, change):
+        """ A private observer for the `keep_alive` attribute.
+
+        The detached items are destroyed when they are no longer kept
+        alive.
+
+        """
+        if change['type'] == 'update' and not change['value']:
+            self._destroy_cached_items()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _destroy_cached_items(self):
+        """ Destroy the items detached by the conditional.
+
+        """
+        for item in self._cached_items:
+            if not item.is_destroyed:
+                item.destroy()
+        del self._cached_items
+
+    def _detach_items(self, items):
+        """ Detach the given items from the parent and keep them alive.
+
+        """
+        items = [item for item in items if not item.is_destroyed]
+        for item in _expand_items(items):
+            item.suspend_bindings()
+            item.set_parent(None)
+        self._cached_items = items
+
+    def _reattach_items(self):
+        """ Insert the detached items back into the parent.
+
+        Returns
+        -------
+        result : list
+            The list of the reattached items.
+
+        """
+        items = self._cached_items
+        del self._cached_items
+        expanded = list(_expand_items(items))
+        if len(expanded) > 0:
+            self.parent.insert_children(self, expanded)
+        for item in expanded:
+            item.resume_reattached()
+        return items
+
     #--------------------------------------------------------------------------
     # Pattern API
     #--------------------------------------------------------------------------
@@ -67,9 +145,20 @@ class Conditional(Pattern):
         """ Refresh the items of the pattern.
 
         This method destroys the old items and creates and initializes
-        the new items.
+        the new items. When the items are kept alive, the old items are
+        detached instead, and they are reused rather than creating new
+        items.
 
         """
+        if self.condition and self._cached_items:
+            self.items = self._reattach_items()
+            return
+
+        if not self.condition and self.keep_alive:
+            self._detach_items(self.items)
+            del self.items
+            return
+
         items = []
         if self.condition:
             for nodes, key, f_locals in self.pattern_nodes:
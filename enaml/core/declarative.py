@@ -69,6 +69,14 @@ def d_func(func):
 #: The flag indicating that the Declarative object has been initialized.
 INITIALIZED_FLAG = next(flag_generator)
 
+#: The flag indicating that the updates of the bound expressions of the
+#: Declarative object are suspended.
+SUSPENDED_FLAG = next(flag_generator)
+
+#: The storage key of the names of the expressions which were invalidated
+#: while the updates were suspended.
+SUSPENDED_KEY = '_[suspended]'
+
 
 class Declarative(with_metaclass(DeclarativeMeta, Object)):
     """ The most base class of the Enaml declarative objects.
@@ -92,6 +100,11 @@ class Declarative(with_metaclass(DeclarativeMeta, Object)):
     #: not be manipulated directly by user code.
     is_initialized = flag_property(INITIALIZED_FLAG)
 
+    #: A property which gets and sets the suspended flag. This should
+    #: not be manipulated directly by user code. Use 'suspend_bindings'
+    #: and 'resume_bindings' instead.
+    bindings_suspended = flag_property(SUSPENDED_FLAG)
+
     #: Storage space for the declarative runtime. This value should not
     #: be manipulated by user code.
     _d_storage = Typed(sortedmap, ())
@@ -128,6 +141,60 @@ class Declarative(with_metaclass(DeclarativeMeta, Object)):
         del self._d_engine
         super(Declarative, self).destroy()
 
+    def suspend_bindings(self):
+        """ Suspend the updates of the bound expressions of the subtree.
+
+        The subscription expressions of this object and its declarative
+        descendants are not evaluated while the updates are suspended.
+        The expressions invalidated in the meantime are evaluated when
+        'resume_bindings' is called.
+
+        """
+        for obj in self.traverse():
+            if isinstance(obj, Declarative):
+                obj.bindings_suspended = True
+
+    def resume_bindings(self):
+        """ Resume the updates of the bound expressions of the subtree.
+
+        The expressions which were invalidated while the updates were
+        suspended are evaluated once each.
+
+        """
+        for obj in self.traverse():
+            if isinstance(obj, Declarative) and obj.bindings_suspended:
+                obj.bindings_suspended = False
+                names = obj._d_storage.pop(SUSPENDED_KEY, None)
+                engine = obj._d_engine
+                if names and engine is not None:
+                    for name in names:
+                        engine.update(obj, name)
+
+    def resume_reattached(self):
+        """ Resume an object which is inserted back into a parent.
+
+        This is used by the objects which detach their items from the
+        parent, with the bindings suspended, instead of destroying them.
+        The default implementation resumes the bindings. Subclasses may
+        reimplement this method to restore their toolkit state.
+
+        """
+        self.resume_bindings()
+
+    def _d_suspended_update(self, name):
+        """ Record an expression invalidated while suspended.
+
+        This is called by the expression engine and should not be
+        called by user code.
+
+        """
+        storage = self._d_storage
+        names = storage.get(SUSPENDED_KEY)
+        if names is None:
+            names = storage[SUSPENDED_KEY] = []
+        if name not in names:
+            names.append(name)
+
     def child_added(self, child):
         """ An overridden child added event handler.
 
@@ -38,6 +38,26 @@ class ReadHandler(Atom):
         """
         raise NotImplementedError
 
+    def subscribes_to(self, identifier):
+        """ Get whether the expression subscribes to a scope value.
+
+        A handler which returns True is re-evaluated when the value of
+        the identifier in its local scope is changed by the runtime.
+        The default implementation returns False.
+
+        Parameters
+        ----------
+        identifier : str
+            The name of the scope value.
+
+        Returns
+        -------
+        result : bool
+            Whether the expression subscribes to the scope value.
+
+        """
+        return False
+
 
 class WriteHandler(Atom):
     """ A base class for defining expression write handlers.
@@ -225,7 +245,9 @@ class ExpressionEngine(Atom):
         expression and setting the value of the attribute. This method
         will not run the handler if its paired write handler is actively
         updating the owner attribute. This behavior protects against
-        feedback loops and saves useless computation.
+        feedback loops and saves useless computation. If the updates of
+        the owner are suspended, the update is recorded and run when the
+        updates are resumed.
 
         Parameters
         ----------
@@ -240,6 +262,9 @@ class ExpressionEngine(Atom):
         if handler is not None:
             pair = handler.read_pair
             if pair is not None:
+                if owner.bindings_suspended:
+                    owner._d_suspended_update(name)
+                    return
                 guards = self._guards
                 key = (owner, pair)
                 if key not in guards:
@@ -249,6 +274,27 @@ class ExpressionEngine(Atom):
                     finally:
                         guards.remove(key)
 
+    def update_readers(self, owner, identifier):
+        """ Update the attributes whose expression subscribes to an
+        identifier.
+
+        This is used to refresh the subscription expressions which
+        depend on a value of their local scope, which is not tracked.
+
+        Parameters
+        ----------
+        owner : Declarative
+            The declarative object which owns the engine.
+
+        identifier : str
+            The name of the scope value which has changed.
+
+        """
+        for name, handler in list(self._handlers.items()):
+            pair = handler.read_pair
+            if pair is not None and pair.reader.subscribes_to(identifier):
+                self.update(owner, name)
+
     def copy(self):
         """ Create a copy of the expression engine.
 
@@ -11,16 +11,16 @@ import os
 import io
 import struct
 import sys
+import threading
 import types
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict, namedtuple
 from zipfile import ZipFile
 
 
-from .enaml_compiler import EnamlCompiler, COMPILER_VERSION
-from .parser import parse
+from .compiler_version import COMPILER_VERSION
 from ..compat import (read_source, detect_encoding, update_code_co_filename,
-                      with_metaclass, exec_)
+                      with_metaclass, exec_, replace_file)
 
 
 # The magic number as symbols for the current Python interpreter. These
@@ -66,6 +66,54 @@ def make_file_info(src_path):
     return EnamlFileInfo(src_path, cache_path, cache_dir)
 
 
+#: The cache of directory listings used to locate Enaml modules. This
+#: maps a directory path to a 2-tuple of (mtime, entries).
+_directory_cache = {}
+
+
+def list_directory(path):
+    """ Get the set of entries in a directory.
+
+    The listing is cached and only refreshed when the modification
+    time of the directory changes, in the spirit of the stdlib
+    importlib FileFinder.
+
+    Parameters
+    ----------
+    path : string
+        The path of the directory. An empty string stands for the
+        current working directory.
+
+    Returns
+    -------
+    result : frozenset
+        The names of the entries in the directory. The set is empty if
+        the path does not exist or is not a directory.
+
+    """
+    path = path or os.getcwd()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return frozenset()
+    cached = _directory_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        entries = frozenset(os.listdir(path))
+    except OSError:
+        entries = frozenset()
+    _directory_cache[path] = (mtime, entries)
+    return entries
+
+
+def clear_directory_cache():
+    """ Clear the cache of directory listings.
+
+    """
+    _directory_cache.clear()
+
+
 class abstractclassmethod(classmethod):
     """ A backport of the Python 3's abc.abstractclassmethod.
 
@@ -237,13 +285,7 @@ class EnamlImporter(AbstractEnamlImporter):
         # We're looking inside a package and 'path' the package path
         if path is not None:
             modname = fullname.rsplit('.', 1)[-1]
-            leaf = ''.join((modname, os.path.extsep, 'enaml'))
-            for stem in path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            stems = path
 
         # We're trying a load a package
         elif '.' in fullname:
@@ -251,13 +293,28 @@ class EnamlImporter(AbstractEnamlImporter):
 
         # We're doing a direct import
         else:
-            leaf = fullname + os.path.extsep + 'enaml'
-            for stem in sys.path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            modname = fullname
+            stems = sys.path
+
+        leaf = ''.join((modname, os.path.extsep, 'enaml'))
+        cache_leaf = ''.join(
+            (modname, '.', MAGIC_TAG, os.path.extsep, 'enamlc')
+        )
+        for stem in stems:
+            entries = list_directory(stem)
+            if leaf in entries or (
+                    CACHEDIR in entries and cache_leaf in
+                    list_directory(os.path.join(stem, CACHEDIR))):
+                return cls(make_file_info(os.path.join(stem, leaf)))
+
+    @classmethod
+    def invalidate_caches(cls):
+        """ Clear the cache of directory listings.
+
+        This is called by importlib.invalidate_caches on Python 3.
+
+        """
+        clear_directory_cache()
 
     def __init__(self, file_info):
         """ Initialize an importer object.
@@ -309,14 +366,34 @@ class EnamlImporter(AbstractEnamlImporter):
         file_info : EnamlFileInfo
             The file info object for the file.
 
+        The file is written to a temporary file which is then renamed,
+        so that concurrent builds and imports never see a partially
+        written cache file.
+
         """
+        cache_dir = file_info.cache_dir
+        cache_path = file_info.cache_path
+        tmp_path = '%s.%d.%d.tmp' % (
+            cache_path, os.getpid(), threading.current_thread().ident
+        )
         try:
-            if not os.path.exists(file_info.cache_dir):
-                os.mkdir(file_info.cache_dir)
-            with open(file_info.cache_path, 'w+b') as cache_file:
-                cache_file.write(MAGIC)
-                cache_file.write(struct.pack('i', ts))
-                marshal.dump(code, cache_file)
+            if not os.path.exists(cache_dir):
+                try:
+                    os.mkdir(cache_dir)
+                except OSError:
+                    # The directory may have been created concurrently.
+                    if not os.path.isdir(cache_dir):
+                        raise
+            try:
+                with open(tmp_path, 'wb') as cache_file:
+                    cache_file.write(MAGIC)
+                    cache_file.write(struct.pack('i', ts))
+                    marshal.dump(code, cache_file)
+                replace_file(tmp_path, cache_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
         except (OSError, IOError):
             pass
 
@@ -368,6 +445,10 @@ class EnamlImporter(AbstractEnamlImporter):
             path to the module as a string.
 
         """
+        # The parser and the compiler are imported on demand so that an
+        # application served from up-to-date caches never loads them.
+        from .enaml_compiler import EnamlCompiler
+        from .parser import parse
         file_info = self.file_info
         src_mod_time = self.get_source_modified_time()
         ast = parse(self.read_source(), file_info.src_path)
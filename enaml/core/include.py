@@ -5,10 +5,11 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import ContainerList, Bool
+from atom.api import ContainerList, Bool, Typed
 
 from .declarative import Declarative, d_
 from .object import Object
+from .view_pool import ViewPool
 
 
 class Include(Declarative):
@@ -26,9 +27,17 @@ class Include(Declarative):
     objects = d_(ContainerList(Object))
 
     #: A boolean flag indicating whether to destroy the old objects that
-    #: are removed from the parent. The default is True.
+    #: are removed from the parent. The default is True. The detached
+    #: views held by the pool are destroyed with the Include regardless
+    #: of this flag, since nothing else references them.
     destroy_old = d_(Bool(True))
 
+    #: An optional pool of views owned by the Include. The objects held
+    #: by the pool are detached from the parent when they are removed,
+    #: with the updates of their bindings suspended, instead of being
+    #: destroyed. They are resumed when they are included again.
+    pool = d_(Typed(ViewPool))
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -45,7 +54,8 @@ class Include(Declarative):
         """ A reimplemented destructor.
 
         The Include will destroy all of its objects if the 'destroy_old'
-        flag is set and the parent is not also being destroyed.
+        flag is set and the parent is not also being destroyed. The
+        detached views held by the pool are always destroyed.
 
         """
         destroy_items = self.destroy_old
@@ -57,6 +67,8 @@ class Include(Declarative):
             for item in self.objects:
                 if not item.is_destroyed:
                     item.destroy()
+        if self.pool is not None:
+            self.pool.clear(() if destroy_items else self.objects)
         del self.objects
 
     def _observe_objects(self, change):
@@ -64,7 +76,8 @@ class Include(Declarative):
 
         If the object is initialized objects which are removed will be
         unparented and objects which are added will be reparented. Old
-        objects will be destroyed if the 'destroy_old' flag is True.
+        objects will be destroyed if the 'destroy_old' flag is True,
+        unless they are held by the pool.
 
         """
         # TODO clean this up
@@ -73,16 +86,11 @@ class Include(Declarative):
                 oldvalue = change['oldvalue']
                 newvalue = change['value']
                 newset = set(newvalue)
-                if self.destroy_old:
-                    for obj in oldvalue:
-                        if obj not in newset:
-                            obj.destroy()
-                else:
-                    for obj in oldvalue:
-                        if obj not in newset:
-                            obj.set_parent(None)
+                for obj in oldvalue:
+                    if obj not in newset:
+                        self._remove_object(obj)
                 if newvalue:
-                    self.parent.insert_children(self, newvalue)
+                    self._insert_objects(newvalue)
             elif change['type'] == 'container':
                 added = []
                 removed = []
@@ -117,12 +125,40 @@ class Include(Declarative):
                 elif op == 'remove':
                     removed.append(change['item'])
                 addset = set(added)
-                if self.destroy_old:
-                    for obj in removed:
-                        if obj not in addset:
-                            obj.destroy()
-                else:
-                    for obj in removed:
-                        if obj not in addset:
-                            obj.set_parent(None)
-                self.parent.insert_children(self, change['value'])
+                for obj in removed:
+                    if obj not in addset:
+                        self._remove_object(obj)
+                self._insert_objects(change['value'])
+            if self.pool is not None:
+                self.pool.trim()
+
+    def _remove_object(self, obj):
+        """ Remove an object which is no longer included.
+
+        The pooled objects are detached and suspended, the others are
+        destroyed or unparented according to the 'destroy_old' flag.
+
+        """
+        if obj.is_destroyed:
+            return
+        pool = self.pool
+        if pool is not None and obj in pool:
+            if isinstance(obj, Declarative):
+                obj.suspend_bindings()
+            obj.set_parent(None)
+        elif self.destroy_old:
+            obj.destroy()
+        else:
+            obj.set_parent(None)
+
+    def _insert_objects(self, objects):
+        """ Insert the included objects into the parent.
+
+        The pooled objects which were detached are resumed.
+
+        """
+        self.parent.insert_children(self, objects)
+        if self.pool is not None:
+            for obj in objects:
+                if isinstance(obj, Declarative) and obj.bindings_suspended:
+                    obj.resume_reattached()
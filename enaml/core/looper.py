@@ -5,13 +5,13 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+from bisect import bisect_left
 from collections import Iterable
 
 from atom.api import Instance, List, Typed
-from atom.datastructures.api import sortedmap
 
 from .compiler_nodes import new_scope
-from .declarative import d_
+from .declarative import Declarative, d_
 from .pattern import Pattern
 
 
@@ -47,9 +47,10 @@ class Looper(Pattern):
     items = List()
 
     #: Private data storage which maps the user iterable data to the
-    #: list of items created for that iteration. This allows the looper
-    #: to only create and destroy the items which have changed.
-    _iter_data = Typed(sortedmap, ())
+    #: list of items created for that iteration and the local scopes
+    #: of the iteration. This allows the looper to only create and
+    #: destroy the items which have changed.
+    _iter_data = Typed(dict, ())
 
     #--------------------------------------------------------------------------
     # Lifetime API
@@ -85,35 +86,49 @@ class Looper(Pattern):
         """ Get a list of items created by the pattern.
 
         """
-        return sum(self.items, [])
+        return [item for iteration in self.items for item in iteration]
 
     def refresh_items(self):
         """ Refresh the items of the pattern.
 
         This method destroys the old items and creates and initializes
-        the new items.
+        the new items. The iterations for items which were already in
+        the iterable are reused, and have their `loop_index` updated
+        along with the subscription expressions which read it. Only the
+        iterations which are new or have changed position are inserted
+        into the parent.
 
         """
-        old_items = self.items[:]
-        old_iter_data = self._iter_data
+        old_items = self.items
+        old_iter_data = self._iter_data.copy()
         iterable = self.iterable
         pattern_nodes = self.pattern_nodes
-        new_iter_data = sortedmap()
+        new_iter_data = {}
         new_items = []
+        reused = {}
+        reindexed = []
 
         if iterable is not None and len(pattern_nodes) > 0:
             for loop_index, loop_item in enumerate(iterable):
-                iteration = old_iter_data.get(loop_item)
-                if iteration is not None:
-                    new_iter_data[loop_item] = iteration
+                item_key = _iter_key(loop_item)
+                data = old_iter_data.pop(item_key, None)
+                if data is not None:
+                    iteration, scopes = data
+                    if scopes and scopes[0]['loop_index'] != loop_index:
+                        for scope in scopes:
+                            scope['loop_index'] = loop_index
+                        reindexed.append(iteration)
+                    reused[id(iteration)] = iteration
+                    new_iter_data[item_key] = data
                     new_items.append(iteration)
-                    old_items.remove(iteration)
                     continue
                 iteration = []
-                new_iter_data[loop_item] = iteration
+                scopes = []
+                new_iter_data[item_key] = (iteration, scopes)
                 new_items.append(iteration)
                 for nodes, key, f_locals in pattern_nodes:
                     with new_scope(key, f_locals) as f_locals:
+                        scopes.append(f_locals)
                         f_locals['loop_index'] = loop_index
                         f_locals['loop_item'] = loop_item
                         for node in nodes:
@@ -124,18 +139,157 @@ class Looper(Pattern):
                                 iteration.append(child)
 
         for iteration in old_items:
-            for old in iteration:
-                if not old.is_destroyed:
-                    old.destroy()
+            if id(iteration) not in reused:
+                for old in iteration:
+                    if not old.is_destroyed:
+                        old.destroy()
 
         if len(new_items) > 0:
-            expanded = []
-            recursive_expand(sum(new_items, []), expanded)
-            self.parent.insert_children(self, expanded)
+            old_index = dict(
+                (id(iteration), index)
+                for index, iteration in enumerate(old_items)
+                if id(iteration) in reused
+            )
+            self._insert_iterations(new_items, old_index)
 
         self.items = new_items
         self._iter_data = new_iter_data
 
+        for iteration in reindexed:
+            _update_loop_index(iteration)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _insert_iterations(self, new_items, old_index):
+        """ Insert the new and moved iterations into the parent.
+
+        The reused iterations which form the longest run of iterations
+        whose relative order is unchanged are left in place. The other
+        iterations are inserted in front of the next stable iteration.
+
+        Parameters
+        ----------
+        new_items : list
+            The list of iterations in their new order.
+
+        old_index : dict
+            A mapping of id(iteration) to old index for the iterations
+            which have been reused.
+
+        """
+        reused = [it for it in new_items if id(it) in old_index]
+        positions = [old_index[id(it)] for it in reused]
+        stable = set(
+            id(reused[i]) for i in _increasing_subsequence(positions)
+        )
+
+        runs = []
+        pending = []
+        for iteration in new_items:
+            if id(iteration) in stable:
+                expanded = []
+                recursive_expand(iteration, expanded)
+                if expanded:
+                    if pending:
+                        runs.append((pending, expanded[0]))
+                        pending = []
+                    continue
+            pending.append(iteration)
+        if pending:
+            runs.append((pending, self))
+
+        # Each insertion is linear in the number of children of the
+        # parent, so many scattered runs are inserted as a single block.
+        parent = self.parent
+        if len(runs) > MAX_INSERT_RUNS:
+            runs = [(new_items, self)]
+        for iterations, before in runs:
+            expanded = []
+            for iteration in iterations:
+                recursive_expand(iteration, expanded)
+            if expanded:
+                parent.insert_children(before, expanded)
+
+
+#: The maximum number of separate insertions performed by a looper
+#: refresh before falling back to reinserting all of the items.
+MAX_INSERT_RUNS = 8
+
+
+#: A sentinel used to build the keys of unhashable iterable items.
+_UNHASHABLE = object()
+
+
+def _iter_key(item):
+    """ Get the key used to identify an item of the looper iterable.
+
+    Unhashable items are identified by their id. The item is kept alive
+    by the looper iteration data, so the id cannot be reused.
+
+    """
+    try:
+        hash(item)
+    except TypeError:
+        return (_UNHASHABLE, id(item))
+    return item
+
+
+def _update_loop_index(iteration):
+    """ Update the subscription expressions of an iteration which read
+    the `loop_index` of the iteration.
+
+    The scope values are not tracked, so the expressions are not
+    notified when the index of a reused iteration changes. The simple
+    '=' expressions are not updated, since they are only evaluated
+    once at initialization.
+
+    """
+    expanded = []
+    recursive_expand(iteration, expanded)
+    for item in expanded:
+        for obj in item.traverse():
+            if isinstance(obj, Declarative):
+                engine = obj._d_engine
+                if engine is not None:
+                    engine.update_readers(obj, 'loop_index')
+
+
+def _increasing_subsequence(seq):
+    """ Compute a longest strictly increasing subsequence.
+
+    Parameters
+    ----------
+    seq : list
+        The list of numbers to analyze.
+
+    Returns
+    -------
+    result : list
+        The indices in 'seq' of the items of the subsequence.
+
+    """
+    tails = []
+    tail_values = []
+    prev = [-1] * len(seq)
+    for index, value in enumerate(seq):
+        pos = bisect_left(tail_values, value)
+        if pos > 0:
+            prev[index] = tails[pos - 1]
+        if pos == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[pos] = index
+            tail_values[pos] = value
+    result = []
+    index = tails[-1] if tails else -1
+    while index >= 0:
+        result.append(index)
+        index = prev[index]
+    result.reverse()
+    return result
+
 
 def recursive_expand(items, expanded):
     """ Recursively expand the list of items created by the looper.
@@ -10,6 +10,8 @@ import re
 
 from atom.api import Atom, Unicode, Value, List, Event
 
+from .dynamicscope import _invalidate_resolve_cache
+
 
 def flag_generator():
     """ A generator which yields success bit flags.
@@ -117,6 +119,7 @@ class Object(Atom):
         if parent is not None:
             if parent.is_destroyed:
                 self._parent = None
+                _invalidate_resolve_cache()
             else:
                 self.set_parent(None)
 
@@ -151,6 +154,7 @@ class Object(Atom):
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
         self._parent = parent
+        _invalidate_resolve_cache()
         self.parent_changed(old_parent, parent)
         if old_parent is not None:
             old_parent._children.remove(self)
@@ -216,6 +220,7 @@ class Object(Atom):
             old_parent = child._parent
             if old_parent is not self:
                 child._parent = self
+                _invalidate_resolve_cache()
                 child.parent_changed(old_parent, self)
                 if old_parent is not None:
                     old_parent.child_removed(child)
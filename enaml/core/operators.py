@@ -46,6 +46,138 @@ def optimize_locals(codelist):
             codelist[idx] = (DELETE_FAST, op_arg)  # py2.6 list comps
 
 
+def simple_code(code):
+    """ Generate the code object for a simple function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.newlocals = False
+    return bp_code.to_code()
+
+
+def tracer_code(code):
+    """ Generate the code object for a trace function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access
+        and instrumentation for invoking a code tracer.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_tracing(bp_code.code)
+    bp_code.newlocals = False
+    bp_code.args = ('_[tracer]',) + bp_code.args
+    return bp_code.to_code()
+
+
+def inverter_code(code):
+    """ Generate the code object for an inverter function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access
+        and instrumentation for inverting the operation.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_inversion(bp_code.code)
+    bp_code.newlocals = False
+    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
+    return bp_code.to_code()
+
+
+#: The code generators for the various kinds of operator functions.
+CODE_GENERATORS = {
+    'simple': simple_code,
+    'tracer': tracer_code,
+    'inverter': inverter_code,
+}
+
+
+#: The kinds of code which are needed by the default operators. This
+#: is used by the compiler to know which code objects to precompute.
+OPERATOR_CODE_KINDS = {
+    '=': ('simple',),
+    '::': ('simple',),
+    '>>': ('inverter',),
+    '<<': ('tracer',),
+    ':=': ('tracer', 'inverter'),
+}
+
+
+#: The code objects precomputed by the compiler which are available
+#: for the operator currently being run. Keyed on (kind, code).
+__precomputed_code = {}
+
+
+@contextmanager
+def precomputed_code(code, generated):
+    """ Make precomputed code available for the duration of the context.
+
+    The Enaml compiler stores the transformed code objects for the
+    default operators alongside the original code in the .enamlc file.
+    While this context is active, the code generation functions will
+    return those code objects instead of rewriting the bytecode.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    generated : tuple
+        A tuple of (kind, code) pairs holding the precomputed code.
+
+    """
+    keys = []
+    for kind, gen_code in generated:
+        key = (kind, code)
+        __precomputed_code[key] = gen_code
+        keys.append(key)
+    try:
+        yield
+    finally:
+        for key in keys:
+            __precomputed_code.pop(key, None)
+
+
+def __get_code(kind, code):
+    """ Get the code of the given kind for a code object.
+
+    This function is for internal use only and may disappear at any time.
+
+    """
+    gen_code = __precomputed_code.get((kind, code))
+    if gen_code is None:
+        gen_code = CODE_GENERATORS[kind](code)
+    return gen_code
+
+
 def gen_simple(code, f_globals):
     """ Generate a simple function from a code object.
 
@@ -63,11 +195,7 @@ def gen_simple(code, f_globals):
         A new function with optimized local variable access.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.newlocals = False
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(__get_code('simple', code), f_globals)
 
 
 def gen_tracer(code, f_globals):
@@ -88,13 +216,7 @@ def gen_tracer(code, f_globals):
         and instrumentation for invoking a code tracer.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_tracing(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[tracer]',) + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(__get_code('tracer', code), f_globals)
 
 
 def gen_inverter(code, f_globals):
@@ -115,13 +237,7 @@ def gen_inverter(code, f_globals):
         and instrumentation for inverting the operation.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_inversion(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(__get_code('inverter', code), f_globals)
 
 
 def op_simple(code, scope_key, f_globals):
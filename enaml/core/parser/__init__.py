@@ -6,33 +6,59 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
 import sys
+import threading
 
 from .base_parser import ParsingError
 
-py_version = sys.version_info
-if py_version < (3,):
-    from .parser2 import Python2EnamlParser
-    _parser = Python2EnamlParser()
-else:
-    if py_version[1] < 3:
-        raise ImportError('Python < 3.3 is not supported')
+if (3,) <= sys.version_info < (3, 3):
+    raise ImportError('Python < 3.3 is not supported')
+
+#: The parser instance, which is built on first use since building the
+#: lexer and the parsing tables is expensive.
+_parser = None
+
+#: The lock protecting the creation of the parser.
+_parser_lock = threading.Lock()
+
+
+def _parser_class():
+    """ Get the parser class for the running version of Python.
+
+    """
+    py_version = sys.version_info
+    if py_version < (3,):
+        from .parser2 import Python2EnamlParser
+        return Python2EnamlParser
     elif py_version[1] == 3:
         from .parser3 import Python3EnamlParser
-        _parser = Python3EnamlParser()
+        return Python3EnamlParser
     elif py_version[1] == 4:
         from .parser34 import Python34EnamlParser
-        _parser = Python34EnamlParser()
+        return Python34EnamlParser
     elif py_version[1] == 5:
         from .parser35 import Python35EnamlParser
-        _parser = Python35EnamlParser()
+        return Python35EnamlParser
     else:
         from .parser36 import Python36EnamlParser
-        _parser = Python36EnamlParser()
+        return Python36EnamlParser
+
+
+def get_parser():
+    """ Get the parser instance, building it if needed.
+
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                _parser = _parser_class()()
+    return _parser
 
 
 def write_tables():
-    _parser.lexer().write_tables()
-    _parser.write_tables()
+    parser = get_parser()
+    parser.lexer().write_tables()
+    parser.write_tables()
 
 
 def parse(enaml_source, filename='Enaml'):
@@ -45,6 +71,6 @@ def parse(enaml_source, filename='Enaml'):
     # stop parsing immediately and then re-raise the errors outside
     # of the control of Ply.
     try:
-        return _parser.parse(enaml_source, filename)
+        return get_parser().parse(enaml_source, filename)
     except ParsingError as parse_error:
         raise parse_error()
@@ -0,0 +1,10 @@
+# lextab36.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ALIAS', 'AMPER', 'AMPEREQUAL', 'AND', 'AS', 'ASSERT', 'ASYNC', 'AT', 'ATEQUAL', 'AWAIT', 'BREAK', 'BYTES', 'CIRCUMFLEX', 'CIRCUMFLEXEQUAL', 'CLASS', 'COLON', 'COLONEQUAL', 'COMMA', 'CONST', 'CONTINUE', 'DEDENT', 'DEF', 'DEL', 'DOT', 'DOUBLECOLON', 'DOUBLESLASH', 'DOUBLESLASHEQUAL', 'DOUBLESTAR', 'DOUBLESTAREQUAL', 'ELIF', 'ELLIPSIS', 'ELSE', 'ENAMLDEF', 'ENDMARKER', 'EQEQUAL', 'EQUAL', 'EXCEPT', 'FALSE', 'FINALLY', 'FOR', 'FROM', 'FSTRING', 'GLOBAL', 'GREATER', 'GREATEREQUAL', 'IF', 'IMPORT', 'IN', 'INDENT', 'IS', 'LAMBDA', 'LBRACE', 'LEFTSHIFT', 'LEFTSHIFTEQUAL', 'LESS', 'LESSEQUAL', 'LPAR', 'LSQB', 'MINUS', 'MINUSEQUAL', 'NAME', 'NEWLINE', 'NONE', 'NONLOCAL', 'NOT', 'NOTEQUAL', 'NUMBER', 'OR', 'PASS', 'PERCENT', 'PERCENTEQUAL', 'PLUS', 'PLUSEQUAL', 'PRAGMA', 'RAISE', 'RBRACE', 'RETURN', 'RETURNARROW', 'RIGHTARROW', 'RIGHTSHIFT', 'RIGHTSHIFTEQUAL', 'RPAR', 'RSQB', 'SEMI', 'SLASH', 'SLASHEQUAL', 'STAR', 'STAREQUAL', 'STRING', 'STRING_CONTINUE', 'STRING_END', 'STRING_START_SINGLE', 'STRING_START_TRIPLE', 'TEMPLATE', 'TILDE', 'TRUE', 'TRY', 'VBAR', 'VBAREQUAL', 'WHILE', 'WITH', 'WS', 'YIELD'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'SINGLEQ1': 'exclusive', 'SINGLEQ2': 'exclusive', 'TRIPLEQ1': 'exclusive', 'TRIPLEQ2': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>(([0-9](?:_?[0-9])*[jJ]|(([0-9](?:_?[0-9])*\\.(?:[0-9](?:_?[0-9])*)?|\\.[0-9](?:_?[0-9])*)([eE][-+]?[0-9](?:_?[0-9])*)?|[0-9](?:_?[0-9])*[eE][-+]?[0-9](?:_?[0-9])*)[jJ])|(([0-9](?:_?[0-9])*\\.(?:[0-9](?:_?[0-9])*)?|\\.[0-9](?:_?[0-9])*)([eE][-+]?[0-9](?:_?[0-9])*)?|[0-9](?:_?[0-9])*[eE][-+]?[0-9](?:_?[0-9])*)|(0[xX](?:_?[0-9a-fA-F])+|0[bB](?:_?[01])+|0[oO](?:_?[0-7])+|(?:0(?:_?0)*|[1-9](?:_?[0-9])*))))|(?P<t_comment>[ ]*\\#[^\\r\\n]*)|(?P<t_WS> [ \\t\\f]+ )|(?P<t_escaped_newline>\\\\\\n)|(?P<t_newline>\\n+)|(?P<t_LPAR>\\()|(?P<t_RPAR>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LSQB>\\[)|(?P<t_RSQB>\\])|(?P<t_start_triple_quoted_q1_string>(([fF]?[uU]?[bB]?[rR]?)|([rR]?[fF]?[uU]?[bB]?))\'\'\')|(?P<t_start_triple_quoted_q2_string>(([fF]?[uU]?[bB]?[rR]?)|([rR]?[fF]?[uU]?[bB]?))""")|(?P<t_start_single_quoted_q1_string>(([fF]?[uU]?[bB]?[rR]?)|([rR]?[fF]?[uU]?[bB]?))\')|(?P<t_start_single_quoted_q2_string>(([fF]?[uU]?[bB]?[rR]?)|([rR]?[fF]?[uU]?[bB]?))")|(?P<t_NAME>\\w+)|(?P<t_PRAGMA>\\$pragma)|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_DOUBLESTAREQUAL>\\*\\*=)|(?P<t_DOUBLESTAR>\\*\\*)|(?P<t_CIRCUMFLEXEQUAL>\\^=)|(?P<t_DOUBLESLASHEQUAL>//=)|(?P<t_LEFTSHIFTEQUAL><<=)|(?P<t_PLUSEQUAL>\\+=)|(?P<t_RIGHTSHIFTEQUAL>>>=)|(?P<t_STAREQUAL>\\*=)|(?P<t_VBAREQUAL>\\|=)|(?P<t_AMPEREQUAL>&=)|(?P<t_ATEQUAL>@=)|(?P<t_CIRCUMFLEX>\\^)|(?P<t_COLONEQUAL>:=)|(?P<t_DOT>\\.)|(?P<t_DOUBLECOLON>::)|(?P<t_DOUBLESLASH>//)|(?P<t_EQEQUAL>==)|(?P<t_GREATEREQUAL>>=)|(?P<t_LEFTSHIFT><<)|(?P<t_LESSEQUAL><=)|(?P<t_MINUSEQUAL>-=)|(?P<t_NOTEQUAL>!=)|(?P<t_PERCENTEQUAL>%=)|(?P<t_PLUS>\\+)|(?P<t_RETURNARROW>->)|(?P<t_RIGHTARROW>=>)|(?P<t_RIGHTSHIFT>>>)|(?P<t_SLASHEQUAL>/=)|(?P<t_STAR>\\*)|(?P<t_VBAR>\\|)|(?P<t_AMPER>&)|(?P<t_AT>@)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_EQUAL>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_PERCENT>%)|(?P<t_SEMI>;)|(?P<t_SLASH>/)|(?P<t_TILDE>~)', [None, ('t_NUMBER', 'NUMBER'), None, None, None, None, None, None, None, None, None, ('t_comment', 'comment'), ('t_WS', 'WS'), ('t_escaped_newline', 'escaped_newline'), ('t_newline', 'newline'), ('t_LPAR', 'LPAR'), ('t_RPAR', 'RPAR'), ('t_LBRACE', 'LBRACE'), ('t_RBRACE', 'RBRACE'), ('t_LSQB', 'LSQB'), ('t_RSQB', 'RSQB'), ('t_start_triple_quoted_q1_string', 'start_triple_quoted_q1_string'), None, None, None, ('t_start_triple_quoted_q2_string', 'start_triple_quoted_q2_string'), None, None, None, ('t_start_single_quoted_q1_string', 'start_single_quoted_q1_string'), None, None, None, ('t_start_single_quoted_q2_string', 'start_single_quoted_q2_string'), None, None, None, ('t_NAME', 'NAME'), (None, 'PRAGMA'), (None, 'ELLIPSIS'), (None, 'DOUBLESTAREQUAL'), (None, 'DOUBLESTAR'), (None, 'CIRCUMFLEXEQUAL'), (None, 'DOUBLESLASHEQUAL'), (None, 'LEFTSHIFTEQUAL'), (None, 'PLUSEQUAL'), (None, 'RIGHTSHIFTEQUAL'), (None, 'STAREQUAL'), (None, 'VBAREQUAL'), (None, 'AMPEREQUAL'), (None, 'ATEQUAL'), (None, 'CIRCUMFLEX'), (None, 'COLONEQUAL'), (None, 'DOT'), (None, 'DOUBLECOLON'), (None, 'DOUBLESLASH'), (None, 'EQEQUAL'), (None, 'GREATEREQUAL'), (None, 'LEFTSHIFT'), (None, 'LESSEQUAL'), (None, 'MINUSEQUAL'), (None, 'NOTEQUAL'), (None, 'PERCENTEQUAL'), (None, 'PLUS'), (None, 'RETURNARROW'), (None, 'RIGHTARROW'), (None, 'RIGHTSHIFT'), (None, 'SLASHEQUAL'), (None, 'STAR'), (None, 'VBAR'), (None, 'AMPER'), (None, 'AT'), (None, 'COLON'), (None, 'COMMA'), (None, 'EQUAL'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'PERCENT'), (None, 'SEMI'), (None, 'SLASH'), (None, 'TILDE')])], 'SINGLEQ1': [("(?P<t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped>\\\\(.|\\n))|(?P<t_SINGLEQ1_simple>[^'\\\\\\n]+)|(?P<t_SINGLEQ1_end>')", [None, ('t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped', 'escaped'), None, ('t_SINGLEQ1_simple', 'simple'), ('t_SINGLEQ1_end', 'end')])], 'SINGLEQ2': [('(?P<t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped>\\\\(.|\\n))|(?P<t_SINGLEQ2_simple>[^"\\\\\\n]+)|(?P<t_SINGLEQ2_end>")', [None, ('t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped', 'escaped'), None, ('t_SINGLEQ2_simple', 'simple'), ('t_SINGLEQ2_end', 'end')])], 'TRIPLEQ1': [("(?P<t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped>\\\\(.|\\n))|(?P<t_TRIPLEQ1_simple>[^'\\\\]+)|(?P<t_TRIPLEQ1_q1_but_not_triple>'(?!''))|(?P<t_TRIPLEQ1_end>''')", [None, ('t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped', 'escaped'), None, ('t_TRIPLEQ1_simple', 'simple'), ('t_TRIPLEQ1_q1_but_not_triple', 'q1_but_not_triple'), ('t_TRIPLEQ1_end', 'end')])], 'TRIPLEQ2': [('(?P<t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped>\\\\(.|\\n))|(?P<t_TRIPLEQ2_simple>[^"\\\\]+)|(?P<t_TRIPLEQ2_q2_but_not_triple>"(?!""))|(?P<t_TRIPLEQ2_end>""")', [None, ('t_SINGLEQ1_SINGLEQ2_TRIPLEQ1_TRIPLEQ2_escaped', 'escaped'), None, ('t_TRIPLEQ2_simple', 'simple'), ('t_TRIPLEQ2_q2_but_not_triple', 'q2_but_not_triple'), ('t_TRIPLEQ2_end', 'end')])]}
+_lexstateignore = {'SINGLEQ1': '', 'SINGLEQ2': '', 'TRIPLEQ1': '', 'TRIPLEQ2': '', 'INITIAL': ''}
+_lexstateerrorf = {'SINGLEQ1': 't_SINGLEQ1_error', 'SINGLEQ2': 't_SINGLEQ2_error', 'TRIPLEQ1': 't_TRIPLEQ1_error', 'TRIPLEQ2': 't_TRIPLEQ2_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
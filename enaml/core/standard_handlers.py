@@ -9,6 +9,7 @@ from types import FunctionType
 
 from atom.api import Atom, Typed
 
+from .byteplay import Code, LOAD_GLOBAL, LOAD_NAME
 from .dynamicscope import DynamicScope
 from .expression_engine import ReadHandler, WriteHandler
 from .funchelper import call_func
@@ -16,6 +17,34 @@ from .standard_inverter import StandardInverter
 from .standard_tracer import StandardTracer
 
 
+def _code_loads_name(code, name):
+    """ Get whether a code object, or a nested one, loads a name from
+    its scope.
+
+    Parameters
+    ----------
+    code : Code
+        The byteplay code object to inspect.
+
+    name : str
+        The name of the scope value.
+
+    Returns
+    -------
+    result : bool
+        Whether the name is loaded from the scope. An attribute of the
+        same name which is loaded from an object does not count.
+
+    """
+    for op, op_arg in code.code:
+        if op == LOAD_NAME or op == LOAD_GLOBAL:
+            if op_arg == name:
+                return True
+        elif isinstance(op_arg, Code) and _code_loads_name(op_arg, name):
+            return True
+    return False
+
+
 class HandlerMixin(Atom):
     """ A mixin class which provides common handler functionality.
 
@@ -88,6 +117,9 @@ class StandardTracedReadHandler(ReadHandler, HandlerMixin):
     This handler is used in conjuction with the standard '<<' operator.
 
     """
+    #: The cache of the scope values loaded by the expression.
+    _loads = Typed(dict, ())
+
     def __call__(self, owner, name):
         """ Evaluate and return the expression value.
 
@@ -100,6 +132,17 @@ class StandardTracedReadHandler(ReadHandler, HandlerMixin):
         scope = DynamicScope(owner, f_locals, f_globals, f_builtins, None, tr)
         return call_func(func, (tr,), {}, scope)
 
+    def subscribes_to(self, identifier):
+        """ Get whether the expression loads a value from its scope.
+
+        """
+        loads = self._loads
+        res = loads.get(identifier)
+        if res is None:
+            code = Code.from_code(self.func.__code__)
+            res = loads[identifier] = _code_loads_name(code, identifier)
+        return res
+
 
 class StandardInvertedWriteHandler(WriteHandler, HandlerMixin):
     """ An expression writer which writes an expression value.
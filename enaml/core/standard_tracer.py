@@ -5,6 +5,10 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
 from atom.api import Atom, atomref
 
 from .alias import Alias
@@ -12,11 +16,141 @@ from .code_tracing import CodeTracer
 from ..compat import IS_PY3, basestring
 
 
+class UpdateBatch(threading.local):
+    """ The state of the update batch used by the subscription observers.
+
+    While a batch is active, the subscription observers record the
+    expressions which must be updated instead of updating them
+    immediately. The expressions are evaluated once, in dependency
+    order, when the outermost batch exits. Each thread has its own
+    batch, so a batch only defers the updates made by its thread.
+
+    """
+    def __init__(self):
+        """ Initialize an UpdateBatch.
+
+        """
+        #: The nesting depth of the active batches.
+        self.depth = 0
+
+        #: The map of (owner, name) to observer of the pending updates.
+        self.pending = OrderedDict()
+
+        #: The set of (owner, name) of the updates of the current pass.
+        self.scheduled = set()
+
+    def flush(self):
+        """ Evaluate the pending expressions.
+
+        Expressions which are invalidated while the batch is flushed
+        are evaluated in a subsequent pass, unless they are already
+        scheduled for evaluation in the current pass. If an update
+        raises, the other pending updates are still evaluated before
+        the exception propagates.
+
+        """
+        pending = self.pending
+        try:
+            while pending:
+                order = _dependency_order(pending)
+                pending.clear()
+                self.scheduled.update(key for key, observer in order)
+                self._update(order, 0)
+        finally:
+            if pending:
+                self.flush()
+            self.scheduled.clear()
+
+    def _update(self, order, start):
+        """ Evaluate the expressions of a pass, starting at an index.
+
+        """
+        index = start
+        try:
+            for index in range(start, len(order)):
+                key, observer = order[index]
+                self.scheduled.discard(key)
+                if observer:
+                    owner, name = key
+                    engine = owner._d_engine
+                    if engine is not None:
+                        engine.update(owner, name)
+        finally:
+            if index + 1 < len(order):
+                self._update(order, index + 1)
+
+
+#: The thread local update batch used by the subscription observers.
+_update_batch = UpdateBatch()
+
+
+@contextmanager
+def batch_updates():
+    """ Batch the updates of subscription expressions.
+
+    Within the context, a change notification received by a `<<`
+    expression marks the expression as dirty instead of evaluating it.
+    Each dirty expression is evaluated exactly once when the outermost
+    context exits, with the expressions which feed other dirty
+    expressions being evaluated first. Batches may be nested, and only
+    defer the updates made by the current thread.
+
+    """
+    batch = _update_batch
+    batch.depth += 1
+    try:
+        yield
+    finally:
+        batch.depth -= 1
+        if batch.depth == 0:
+            batch.depth += 1
+            try:
+                batch.flush()
+            finally:
+                batch.depth -= 1
+
+
+def _dependency_order(pending):
+    """ Sort pending updates so that dependencies are updated first.
+
+    Parameters
+    ----------
+    pending : OrderedDict
+        The mapping of (owner, name) to SubscriptionObserver for the
+        expressions which must be updated.
+
+    Returns
+    -------
+    result : list
+        The list of (key, observer) pairs in update order. Cyclic
+        dependencies are broken using the order of notification.
+
+    """
+    order = []
+    state = set()
+    for root in pending:
+        if root in state:
+            continue
+        state.add(root)
+        stack = [(root, pending[root].dependencies())]
+        while stack:
+            key, deps = stack[-1]
+            for dep in deps:
+                if dep in pending and dep not in state:
+                    state.add(dep)
+                    stack.append((dep, pending[dep].dependencies()))
+                    break
+            else:
+                stack.pop()
+                order.append((key, pending[key]))
+    return order
+
+
 class SubscriptionObserver(object):
     """ An observer object which manages a tracer subscription.
 
     """
-    __slots__ = ('ref', 'name')
+    __slots__ = ('ref', 'name', 'items')
 
     def __init__(self, owner, name):
         """ Initialize a SubscriptionObserver.
@@ -33,6 +167,11 @@ class SubscriptionObserver(object):
         self.ref = atomref(owner)
         self.name = name
 
+        # The (atomref, name) pairs of the observed items. The items
+        # are weakly referenced, so that the observer does not keep
+        # them alive after its owner is gone.
+        self.items = frozenset()
+
     def __bool__(self):
         """ The notifier is valid when it has an internal owner.
 
@@ -46,15 +185,31 @@ class SubscriptionObserver(object):
         __nonzero__ = __bool__
         del __bool__
 
+    def dependencies(self):
+        """ Iterate over the (obj, name) pairs of the observed items
+        which are still alive.
+
+        """
+        for ref, name in self.items:
+            if ref:
+                yield (ref(), name)
+
     def __call__(self, change):
         """ The handler for the change notification.
 
         This will be invoked by the Atom observer mechanism when the
-        item which is being observed changes.
+        item which is being observed changes. If an update batch is
+        active, the update is deferred until the batch is flushed.
 
         """
         if self.ref:
             owner = self.ref()
+            batch = _update_batch
+            if batch.depth:
+                key = (owner, self.name)
+                if key not in batch.scheduled:
+                    batch.pending[key] = self
+                return
             engine = owner._d_engine
             if engine is not None:
                 engine.update(owner, self.name)
@@ -104,26 +259,37 @@ class StandardTracer(CodeTracer):
     def finalize(self):
         """ Finalize the tracing process.
 
-        This method will discard the old observer and attach a new
-        observer to the traced dependencies.
+        This method will update the subscriptions of the observer for
+        the expression with the traced dependencies. The existing
+        observer is reused, and only the dependencies which have been
+        added or dropped since the last evaluation are (un)observed.
 
         """
         owner = self.owner
         name = self.name
         key = '_[%s|trace]' % name
         storage = owner._d_storage
+        items = self.items
 
-        # invalidate the old observer so that it can be collected
-        old_observer = storage.get(key)
-        if old_observer is not None:
-            old_observer.ref = None
-
-        # create a new observer and subscribe it to the dependencies
-        if self.items:
+        observer = storage.get(key)
+        if observer is None:
+            if not items:
+                return
             observer = SubscriptionObserver(owner, name)
             storage[key] = observer
-            for obj, d_name in self.items:
-                obj.observe(d_name, observer)
+
+        # The atomref of an object is shared, so the refs of the same
+        # object compare equal from one evaluation to the next.
+        refs = frozenset((atomref(obj), d_name) for obj, d_name in items)
+        old_refs = observer.items
+        if refs == old_refs:
+            return
+        for ref, d_name in old_refs - refs:
+            if ref:
+                ref().unobserve(d_name, observer)
+        for ref, d_name in refs - old_refs:
+            ref().observe(d_name, observer)
+        observer.items = refs
 
     #--------------------------------------------------------------------------
     # AbstractScopeListener Interface
@@ -0,0 +1,176 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from collections import OrderedDict
+
+from atom.api import Atom, Int, Typed
+
+
+class ViewPool(Atom):
+    """ A least recently used pool of views.
+
+    A view pool keeps the views created for a key, typically the view
+    factory, so that they can be reused instead of being recreated. The
+    pool holds at most `size` entries; when it is full, the views of the
+    least recently used entries which are not in use, meaning they are
+    not attached to a parent, are destroyed to make room.
+
+    A view pool is owned by a single Include, which detaches the pooled
+    views when they are removed and destroys the pool on destruction.
+
+    """
+    #: The maximum number of entries held by the pool. A value of zero
+    #: disables the pooling.
+    size = Int(8)
+
+    #: The number of times a pooled entry was reused.
+    hits = Int(0)
+
+    #: The number of times an entry had to be created.
+    misses = Int(0)
+
+    #: The number of entries destroyed to make room in the pool.
+    evictions = Int(0)
+
+    #: The pooled views, ordered from the least to the most recently
+    #: used entry.
+    _entries = Typed(OrderedDict, ())
+
+    #: The set of the pooled views, for fast membership tests.
+    _members = Typed(set, ())
+
+    def __contains__(self, view):
+        """ Get whether or not a view is held by the pool.
+
+        """
+        return view in self._members
+
+    def __len__(self):
+        """ Get the number of entries held by the pool.
+
+        """
+        return len(self._entries)
+
+    def acquire(self, key):
+        """ Get the pooled views for a key.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key of the views.
+
+        Returns
+        -------
+        result : list or None
+            The pooled views for the key, or None if they must be
+            created and added with the 'add' method.
+
+        """
+        entries = self._entries
+        views = entries.pop(key, None)
+        if views is not None:
+            if not any(view.is_destroyed for view in views):
+                entries[key] = views
+                self.hits += 1
+                return views
+            self._release(views)
+        self.misses += 1
+        return None
+
+    def add(self, key, views):
+        """ Add the views created for a key to the pool.
+
+        The least recently used entries which are not in use are
+        destroyed if the pool is full.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key of the views.
+
+        views : list
+            The list of views created for the key.
+
+        """
+        if self.size <= 0:
+            return
+        entries = self._entries
+        old = entries.pop(key, None)
+        if old is not None:
+            self._discard(old, views)
+        entries[key] = views
+        self._members.update(views)
+        self.trim()
+
+    def trim(self):
+        """ Destroy the least recently used entries which exceed the
+        size of the pool.
+
+        The entries whose views are attached to a parent are in use and
+        are kept, as is the most recently used entry. The pool may then
+        exceed its size until the owner of the views detaches them and
+        calls this method again.
+
+        """
+        entries = self._entries
+        excess = len(entries) - self.size
+        if excess <= 0:
+            return
+        evicted = []
+        for key in list(entries)[:-1]:
+            if excess == 0:
+                break
+            if not any(view.parent is not None for view in entries[key]):
+                evicted.append(key)
+                excess -= 1
+        for key in evicted:
+            self._discard(entries.pop(key))
+            self.evictions += 1
+
+    def clear(self, keep=()):
+        """ Destroy all of the pooled views.
+
+        Parameters
+        ----------
+        keep : iterable, optional
+            The views which are forgotten by the pool but not destroyed,
+            typically because they are still in use.
+
+        """
+        entries = self._entries
+        self._entries = OrderedDict()
+        self._members = set()
+        keep = set(keep)
+        for views in entries.values():
+            for view in views:
+                if view not in keep and not view.is_destroyed:
+                    view.destroy()
+
+    def reset_counters(self):
+        """ Reset the hit, miss and eviction counters.
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _release(self, views):
+        """ Forget the given views without destroying them.
+
+        """
+        members = self._members
+        for view in views:
+            members.discard(view)
+
+    def _discard(self, views, keep=()):
+        """ Forget the given views and destroy those not in 'keep'.
+
+        """
+        self._release(views)
+        for view in views:
+            if view not in keep and not view.is_destroyed:
+                view.destroy()
@@ -7,13 +7,150 @@
 #------------------------------------------------------------------------------
 from contextlib import contextmanager
 
-from atom.api import Atom, List, Typed
+from atom.api import Atom, Int, List, Tuple, Typed
 
 import kiwisolver as kiwi
 
+from .constrainable import ConstraintMember
 from .layout_helpers import expand_constraints
 
 
+#: A cache of the names of the constraint members of a class.
+_constraint_names = {}
+
+
+def _constrainable_vars(constrainable, stable):
+    """ Add the ids of the variables of a constrainable to a set.
+
+    These variables are owned by the constrainable, so they are the
+    same objects from one layout pass to the next.
+
+    """
+    names = _constraint_names.get(type(constrainable))
+    if names is None:
+        names = _constraint_names[type(constrainable)] = tuple(
+            name for name, member in type(constrainable).members().items()
+            if isinstance(member, ConstraintMember)
+        )
+    for name in names:
+        stable.add(id(getattr(constrainable, name)))
+
+
+def _constraint_key(cn, stable, local):
+    """ Compute a hashable key which identifies a constraint.
+
+    Two constraints with equal keys have the same effect on a solver,
+    even though they are distinct objects.
+
+    Parameters
+    ----------
+    cn : Constraint
+        The constraint of interest.
+
+    stable : set
+        The ids of the variables owned by a constrainable. Variables
+        are not hashable, so these are keyed on their identity. This
+        is safe since the variables are kept alive by the constraints
+        being compared.
+
+    local : dict
+        The mapping of id to key of the other variables, which are
+        created by the layout helpers on every layout pass. These are
+        keyed on their name and order of first appearance in the list
+        of constraints. The mapping is updated in-place.
+
+    Returns
+    -------
+    result : tuple
+        A 2-tuple of the key and whether the constraint involves a
+        variable created by a layout helper.
+
+    """
+    expr = cn.expression()
+    terms = []
+    unseen = []
+    for term in expr.terms():
+        var = term.variable()
+        var_id = id(var)
+        if var_id not in stable and var_id not in local:
+            unseen.append((var.name(), var_id))
+        terms.append((var_id, term.coefficient()))
+    # The solver orders the terms by address, so the new variables are
+    # numbered in order of name and the terms are sorted by key.
+    for name, var_id in sorted(unseen):
+        if var_id not in local:
+            local[var_id] = (1, name, len(local))
+    is_local = any(v in local for v, c in terms)
+    terms = sorted(
+        (local[v] if v in local else (0, v), c) for v, c in terms
+    )
+    key = (tuple(terms), expr.constant(), cn.op(), cn.strength())
+    return key, is_local
+
+
+def _diff_constraints(old, new, added, removed, stable):
+    """ Diff a list of new constraints against the old constraints.
+
+    The constraints which involve variables created by the layout
+    helpers are only reused if all of them are unchanged, since the
+    old and the new helper variables can not be mixed in the solver.
+
+    Parameters
+    ----------
+    old : list
+        The list of constraints currently in the solver.
+
+    new : list
+        The list of newly generated constraints.
+
+    added : list
+        The list to which the constraints which must be added to the
+        solver are appended.
+
+    removed : list
+        The list to which the constraints which must be removed from
+        the solver are appended.
+
+    stable : set
+        The ids of the variables owned by a constrainable.
+
+    Returns
+    -------
+    result : list
+        The list of constraints which will be in the solver once the
+        changes are applied. Old constraints are reused in place of
+        structurally identical new constraints.
+
+    """
+    old_local = {}
+    old_keys = [_constraint_key(cn, stable, old_local) for cn in old]
+    new_local = {}
+    new_keys = [_constraint_key(cn, stable, new_local) for cn in new]
+    reuse_local = (
+        [key for key, is_local in old_keys if is_local] ==
+        [key for key, is_local in new_keys if is_local]
+    )
+    pool = {}
+    for cn, (key, is_local) in zip(old, old_keys):
+        if is_local and not reuse_local:
+            removed.append(cn)
+        else:
+            pool.setdefault(key, []).append(cn)
+    result = []
+    for cn, (key, is_local) in zip(new, new_keys):
+        bucket = None
+        if reuse_local or not is_local:
+            bucket = pool.get(key)
+        if bucket:
+            result.append(bucket.pop())
+        else:
+            result.append(cn)
+            added.append(cn)
+    for bucket in pool.values():
+        removed.extend(bucket)
+    return result
+
+
 class LayoutItem(Atom):
     """ A base class used for creating layout items.
 
@@ -29,10 +166,16 @@ class LayoutItem(Atom):
     #: by the layout manager.
     _margin_cache = List()
 
+    #: The last geometry applied to the item, along with its offset.
+    #: This is used by the layout manager to skip unchanged items.
+    _geometry_rect = Tuple()
+
     def __call__(self):
         """ Update the geometry of the underlying toolkit widget.
 
-        This should not be called directly by user code.
+        The toolkit widget is only updated if the solved geometry of the
+        item or its offset changed since the last update. This should
+        not be called directly by user code.
 
         """
         d = self.constrainable()
@@ -40,7 +183,26 @@ class LayoutItem(Atom):
         y = d.top.value()
         w = d.width.value()
         h = d.height.value()
-        self.set_geometry(x, y, w, h)
+        rect = (x, y, w, h) + self.geometry_offset()
+        if rect != self._geometry_rect:
+            self._geometry_rect = rect
+            self.set_geometry(x, y, w, h)
+
+    def geometry_offset(self):
+        """ Get the offset which is applied to the solved geometry.
+
+        The geometry of the item is reapplied whenever this value
+        changes, even if the solved geometry is unchanged. It should
+        be reimplemented by subclasses which position the toolkit
+        widget relative to the geometry of another item.
+
+        Returns
+        -------
+        result : tuple
+            A tuple of numbers. The default is an empty tuple.
+
+        """
+        return ()
 
     def hard_constraints(self):
         """ Generate a list of hard constraints for the item.
@@ -260,6 +422,25 @@ class LayoutManager(Atom):
     #: The list of layout items handled by the manager.
     _layout_items = List()
 
+    #: A mapping of constrainable object to the lists of constraints
+    #: currently in the solver for the layout item which owns it. The
+    #: lists are ordered as [hard, geometry, margin, layout].
+    _item_constraints = Typed(dict, ())
+
+    #: The cached (best, min, max) size bounds of the layout owner. An
+    #: empty tuple indicates the bounds must be recomputed.
+    _size_bounds = Tuple()
+
+    #: The number of times the solver has updated its variables.
+    solve_count = Int()
+
+    #: The number of size bounds queries answered from the cache.
+    bounds_cache_hits = Int()
+
+    #: The size given to the last resize for which the solver is still
+    #: up-to-date. An empty tuple indicates the next resize must solve.
+    _resize_size = Tuple()
+
     def __init__(self, item):
         """ Initialize a LayoutManager.
 
@@ -278,8 +459,12 @@ class LayoutManager(Atom):
     def set_items(self, items):
         """ Set the layout items for this layout manager.
 
-        This method will reset the internal solver state and build a
-        new system of constraints using the new list of items.
+        This method will update the solver with the system of
+        constraints generated by the new list of items. The constraints
+        are tracked per layout item, and only the constraints which
+        have been added or removed since the previous call are applied
+        to the solver. Items whose constraints are unchanged are left
+        untouched.
 
         Parameters
         ----------
@@ -288,49 +473,80 @@ class LayoutManager(Atom):
             item should *not* be included in this list.
 
         """
-        # Reset the state of the solver.
-        del self._edit_stack
         del self._layout_items
-        solver = self._solver
-        solver.reset()
 
         # Setup the standard edit variables.
         root = self._root_item
-        d = root.constrainable()
-        strength = kiwi.strength.medium
-        pairs = ((d.width, strength), (d.height, strength))
-        self._push_edit_vars(pairs)
+        if not self._edit_stack:
+            d = root.constrainable()
+            strength = kiwi.strength.medium
+            pairs = ((d.width, strength), (d.height, strength))
+            self._push_edit_vars(pairs)
 
         # Generate the constraints for the layout system. The size hint
         # and bounds of the root item are ignored since the input to the
         # solver is the suggested size of the root item and the output
         # of the solver is used to compute the bounds of the item.
-        cns = []
+        new_cns = {}
         hc = root.hard_constraints()
         mc = root.margin_constraints()
         lc = root.layout_constraints()
-        root._margin_cache = mc
-        cns.extend(hc)
-        cns.extend(mc)
-        cns.extend(lc)
+        new_cns[root.constrainable()] = (root, [hc, [], mc, lc])
         for child in items:
             hc = child.hard_constraints()
             gc = child.geometry_constraints()
             mc = child.margin_constraints()
             lc = child.layout_constraints()
-            child._geometry_cache = gc
-            child._margin_cache = mc
-            cns.extend(hc)
-            cns.extend(gc)
-            cns.extend(mc)
-            cns.extend(lc)
-
-        # Add the new constraints to the solver.
-        for cn in cns:
-            solver.addConstraint(cn)
-
-        # Store the layout items for resize updates.
+            new_cns[child.constrainable()] = (child, [hc, gc, mc, lc])
+
+        # Diff the new constraints against the constraints currently in
+        # the solver. Constraints which are structurally identical to a
+        # constraint in the solver reuse the existing constraint object.
+        added = []
+        removed = []
+        old_cns = self._item_constraints
+        stable = set()
+        for key in old_cns:
+            _constrainable_vars(key, stable)
+        for key in new_cns:
+            _constrainable_vars(key, stable)
+        item_cns = {}
+        for key, (item, groups) in new_cns.items():
+            old_groups = old_cns.pop(key, None)
+            if old_groups is not None:
+                groups = [
+                    _diff_constraints(old, new, added, removed, stable)
+                    for old, new in zip(old_groups, groups)
+                ]
+            else:
+                for group in groups:
+                    added.extend(group)
+            item._geometry_cache = groups[1]
+            item._margin_cache = groups[2]
+            item_cns[key] = groups
+        for old_groups in old_cns.values():
+            for group in old_groups:
+                removed.extend(group)
+
+        # Apply the changes to the solver. If the solver rejects one of
+        # the new constraints, its state is reset so that the next call
+        # will rebuild the system from scratch.
+        solver = self._solver
+        try:
+            for cn in removed:
+                solver.removeConstraint(cn)
+            for cn in added:
+                solver.addConstraint(cn)
+        except Exception:
+            self._reset()
+            raise
+        if added or removed:
+            del self._size_bounds
+
+        # Store the constraints and layout items for later updates.
+        self._item_constraints = item_cns
         self._layout_items = items
+        del self._resize_size
 
     def clear_items(self):
         """ Clear the child layout items in the layout.
@@ -353,39 +569,84 @@ class LayoutManager(Atom):
             The desired height of the layout owner.
 
         """
+        # The solver is skipped if nothing changed since the last resize
+        # and only the items whose geometry changed are updated.
+        size = (width, height)
+        if size == self._resize_size:
+            return
         solver = self._solver
         d = self._root_item.constrainable()
         solver.suggestValue(d.width, width)
         solver.suggestValue(d.height, height)
-        solver.updateVariables()
+        self._solve()
+        self._resize_size = size
         for item in self._layout_items:
             item()
 
-    def best_size(self):
-        """ Get the best size for the layout owner.
+    def size_bounds(self):
+        """ Get the best, minimum and maximum size of the layout owner.
 
-        The best size is computed by invoking the solver with a zero
-        size suggestion at a strength of 0.1 * weak. The resulting
-        values for width and height are taken as the best size.
+        The bounds are computed together and cached until the system
+        of constraints changes, so that repeated queries do not incur
+        additional solves.
 
         Returns
         -------
         result : tuple
-            The 2-tuple of (width, height) best size values.
+            The 3-tuple of (best, min, max) sizes, each of which is a
+            2-tuple of (width, height) values.
 
         """
+        bounds = self._size_bounds
+        if bounds:
+            self.bounds_cache_hits += 1
+            return bounds
+
         d = self._root_item.constrainable()
         width = d.width
         height = d.height
         solver = self._solver
+
+        # The best size is computed by invoking the solver with a zero
+        # size suggestion at a strength of 0.1 * weak.
         strength = 0.1 * kiwi.strength.weak
         pairs = ((width, strength), (height, strength))
         with self._edit_context(pairs):
             solver.suggestValue(width, 0.0)
             solver.suggestValue(height, 0.0)
-            solver.updateVariables()
-            result = (width.value(), height.value())
-        return result
+            self._solve()
+            best = (width.value(), height.value())
+
+        # The min and max sizes are computed by invoking the solver with
+        # a zero and a max size suggestion at a strength of medium.
+        solver.suggestValue(width, 0.0)
+        solver.suggestValue(height, 0.0)
+        self._solve()
+        min_size = (width.value(), height.value())
+
+        solver.suggestValue(width, 16777215.0)  # max allowed by Qt
+        solver.suggestValue(height, 16777215.0)
+        self._solve()
+        max_size = (width.value(), height.value())
+
+        bounds = self._size_bounds = (best, min_size, max_size)
+        del self._resize_size
+        return bounds
+
+    def best_size(self):
+        """ Get the best size for the layout owner.
+
+        The best size is computed by invoking the solver with a zero
+        size suggestion at a strength of 0.1 * weak. The resulting
+        values for width and height are taken as the best size.
+
+        Returns
+        -------
+        result : tuple
+            The 2-tuple of (width, height) best size values.
+
+        """
+        return self.size_bounds()[0]
 
     def min_size(self):
         """ Compute the minimum size for the layout owner.
@@ -400,14 +661,7 @@ class LayoutManager(Atom):
             The 2-tuple of (width, height) min size values.
 
         """
-        d = self._root_item.constrainable()
-        width = d.width
-        height = d.height
-        solver = self._solver
-        solver.suggestValue(width, 0.0)
-        solver.suggestValue(height, 0.0)
-        solver.updateVariables()
-        return (width.value(), height.value())
+        return self.size_bounds()[1]
 
     def max_size(self):
         """ Compute the maximum size for the container.
@@ -422,14 +676,14 @@ class LayoutManager(Atom):
             The 2-tuple of (width, height) max size values.
 
         """
-        d = self._root_item.constrainable()
-        width = d.width
-        height = d.height
-        solver = self._solver
-        solver.suggestValue(width, 16777215.0)  # max allowed by Qt
-        solver.suggestValue(height, 16777215.0)
-        solver.updateVariables()
-        return (width.value(), height.value())
+        return self.size_bounds()[2]
+
+    def reset_counters(self):
+        """ Reset the solve and bounds cache counters to zero.
+
+        """
+        self.solve_count = 0
+        self.bounds_cache_hits = 0
 
     def update_geometry(self, index):
         """ Update the geometry for the given layout item.
@@ -444,11 +698,13 @@ class LayoutManager(Atom):
             was provided in the call to 'set_items'.
 
         """
+        groups = self._tracked_groups(index)
+        if groups is None:
+            return
         item = self._layout_items[index]
-        old = item._geometry_cache
-        new = item.geometry_constraints()
-        item._geometry_cache = new
-        self._replace(old, new)
+        new = self._replace(item, item._geometry_cache,
+                            item.geometry_constraints())
+        item._geometry_cache = groups[1] = new
 
     def update_margins(self, index):
         """ Update the margins for the given layout item.
@@ -464,32 +720,99 @@ class LayoutManager(Atom):
             can be given to indicate the root item.
 
         """
+        groups = self._tracked_groups(index)
+        if groups is None:
+            return
         item = self._root_item if index < 0 else self._layout_items[index]
-        old = item._margin_cache
-        new = item.margin_constraints()
-        item._margin_cache = new
-        self._replace(old, new)
+        new = self._replace(item, item._margin_cache,
+                            item.margin_constraints())
+        item._margin_cache = groups[2] = new
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _replace(self, old, new):
+    def _reset(self):
+        """ Reset the solver and the tracked constraints.
+
+        """
+        del self._edit_stack
+        del self._layout_items
+        del self._item_constraints
+        del self._size_bounds
+        del self._resize_size
+        self._solver.reset()
+
+    def _solve(self):
+        """ Update the variables of the solver and count the solve.
+
+        """
+        self._solver.updateVariables()
+        self.solve_count += 1
+
+    def _tracked_groups(self, index):
+        """ Get the constraint groups tracked for a layout item.
+
+        Parameters
+        ----------
+        index : int
+            The index of the item in the list of layout items, or -1
+            for the root item.
+
+        Returns
+        -------
+        result : list or None
+            The constraint groups of the item, or None if the item is
+            not tracked. This is the case after the solver was reset,
+            since the system is then rebuilt by the next 'set_items'.
+
+        """
+        if index < 0:
+            item = self._root_item
+        elif index < len(self._layout_items):
+            item = self._layout_items[index]
+        else:
+            return None
+        return self._item_constraints.get(item.constrainable())
+
+    def _replace(self, item, old, new):
         """ Replace constraints in the solver.
 
+        Only the constraints which differ between the two lists are
+        updated, and the cached size bounds are invalidated if any
+        constraint was changed.
+
         Parameters
         ----------
+        item : LayoutItem
+            The layout item which owns the constraints.
+
         old : list
             The list of constraints to remove from the solver.
 
         new : list
             The list of constraints to add to the solver.
 
+        Returns
+        -------
+        result : list
+            The list of constraints now in the solver, reusing the old
+            constraints which are identical to the new ones.
+
         """
-        solver = self._solver
-        for cn in old:
-            solver.removeConstraint(cn)
-        for cn in new:
-            solver.addConstraint(cn)
+        added = []
+        removed = []
+        stable = set()
+        _constrainable_vars(item.constrainable(), stable)
+        result = _diff_constraints(old, new, added, removed, stable)
+        if added or removed:
+            solver = self._solver
+            for cn in removed:
+                solver.removeConstraint(cn)
+            for cn in added:
+                solver.addConstraint(cn)
+            del self._size_bounds
+            del self._resize_size
+        return result
 
     def _push_edit_vars(self, pairs):
         """ Push edit variables into the solver.
@@ -5,7 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, Int, Typed, List, atomref
+from atom.api import Atom, Int, Typed, List, Value, atomref
 
 from enaml.layout.dock_layout import DockLayout, DockLayoutValidator
 
@@ -13,7 +13,9 @@ from enaml.qt.QtCore import Qt, QPoint, QRect, QObject
 from enaml.qt.QtWidgets import QApplication
 
 from .dock_overlay import DockOverlay
-from .layout_handling import layout_hit_test, plug_frame, iter_containers
+from .layout_handling import (
+    LayoutHitIndex, layout_hit_test, plug_frame, iter_containers
+)
 from .layout_builder import LayoutBuilder
 from .layout_saver import LayoutSaver
 from .proximity_handler import ProximityHandler
@@ -79,6 +81,12 @@ class DockManager(Atom):
     #: A container monitor which tracks toplevel container changes.
     _container_monitor = Typed(DockContainerMonitor)
 
+    #: The frame currently being dragged by the user, if any.
+    _drag_frame = Value()
+
+    #: The hit test indices of the dock areas built during a drag.
+    _hit_indices = Typed(dict, ())
+
     def _default__container_monitor(self):
         return DockContainerMonitor(self)
 
@@ -420,6 +428,8 @@ class DockManager(Atom):
         # that has an opposite edge lying within the snap distance.
         # The overlay is hidden when the frame has proximal frames
         # since such a frame is not allowed to be docked.
+        if frame is not self._drag_frame:
+            self._begin_drag(frame)
         show_drag_overlay = True
         handler = self._proximity_handler
         if frame.isLinked():
@@ -485,6 +495,7 @@ class DockManager(Atom):
         # frames, or if the target dock area has a maximized widget.
         # This prevents a situation where the docking logic would be
         # non-sensical and maintains a consistent user experience.
+        self._end_drag()
         overlay = self._overlay
         overlay.hide()
         guide = overlay.guide_at(pos)
@@ -511,6 +522,53 @@ class DockManager(Atom):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _begin_drag(self, frame):
+        """ Setup the spatial indices used while a frame is dragged.
+
+        Parameters
+        ----------
+        frame : QDockFrame
+            The dock frame being dragged by the user.
+
+        """
+        self._drag_frame = frame
+        self._hit_indices.clear()
+        self._proximity_handler.buildIndex(exclude=frame)
+
+    def _end_drag(self):
+        """ Discard the spatial indices used while a frame is dragged.
+
+        """
+        self._drag_frame = None
+        self._hit_indices.clear()
+        self._proximity_handler.clearIndex()
+
+    def _layout_hit_test(self, area, pos):
+        """ Hit test a dock area using a cached spatial index.
+
+        The index is rebuilt if the contents or the size of the area
+        changed since it was created.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area of interest.
+
+        pos : QPoint
+            The point of interest expressed in local area coordinates.
+
+        Returns
+        -------
+        result : QWidget or None
+            The relevant dock target under the position.
+
+        """
+        indices = self._hit_indices
+        index = indices.get(area)
+        if index is None or not index.isValid():
+            index = indices[area] = LayoutHitIndex(area)
+        return index.hitTest(pos)
+
     def _free_container(self, container):
         """ Free the resources attached to the container.
 
@@ -623,7 +681,7 @@ class DockManager(Atom):
                 overlay.hide()
                 return
             local = target.mapFromGlobal(pos)
-            widget = layout_hit_test(target, local)
+            widget = self._layout_hit_test(target, local)
             overlay.mouse_over_area(target, widget, local)
         else:
             overlay.hide()
@@ -5,7 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from enaml.qt.QtCore import Qt, QEvent
+from enaml.qt.QtCore import Qt, QEvent, QPoint, QRect
 from enaml.qt.QtWidgets import QApplication
 
 from .event_types import DockAreaContentsChanged
@@ -14,6 +14,7 @@ from .q_dock_container import QDockContainer
 from .q_dock_splitter import QDockSplitter, QDockSplitterHandle
 from .q_dock_tab_widget import QDockTabWidget
 from .q_dock_window import QDockWindow
+from .utils import RectIndex
 
 
 #------------------------------------------------------------------------------
@@ -214,6 +215,82 @@ def layout_hit_test(area, pos):
                 return dock_container
 
 
+class LayoutHitIndex(object):
+    """ A spatial index of the dock targets of a dock area.
+
+    The index captures the geometry of the splitter handles, tab widgets
+    and visible dock containers of a dock area when it is created, so
+    that the repeated hit tests performed during a drag operation only
+    test the targets located near the position. The index should be
+    discarded when the contents or the geometry of the area change,
+    which can be checked with the `isValid` method.
+
+    """
+    def __init__(self, area):
+        """ Initialize a LayoutHitIndex.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area to index.
+
+        """
+        self._area = area
+        self._size = area.size()
+        self._generation = area.contentsGeneration()
+        self._handles = handles = RectIndex()
+        self._tabs = tabs = RectIndex()
+        self._containers = containers = RectIndex()
+        origin = QPoint()
+        for handle in iter_handles(area):
+            rect = QRect(handle.mapTo(area, origin), handle.size())
+            handles.add(rect.adjusted(-20, -20, 20, 20), handle)
+        for tab_widget in iter_tabs(area):
+            rect = QRect(tab_widget.mapTo(area, origin), tab_widget.size())
+            tabs.add(rect, tab_widget)
+        for dock_container in iter_containers(area):
+            if not dock_container.isHidden():  # hidden tab
+                pos = dock_container.mapTo(area, origin)
+                rect = QRect(pos, dock_container.size())
+                containers.add(rect, dock_container)
+
+    def isValid(self):
+        """ Get whether the index matches the current state of the area.
+
+        """
+        area = self._area
+        return (area.contentsGeneration() == self._generation and
+                area.size() == self._size)
+
+    def hitTest(self, pos):
+        """ Hit test the indexed dock area for a relevant dock target.
+
+        This method follows the same rules as `layout_hit_test`.
+
+        Parameters
+        ----------
+        pos : QPoint
+            The point of interest expressed in local area coordinates.
+
+        Returns
+        -------
+        result : QWidget or None
+            The relevant dock target under the position. This will be
+            a QDockContainer, QDockTabWidget, or QDockSplitterHandle.
+
+        """
+        hits = self._handles.at(pos)
+        if hits:
+            dist = lambda hit: (hit[0].center() - pos).manhattanLength()
+            return min(hits, key=dist)[1]
+        hits = self._tabs.at(pos)
+        if hits:
+            return hits[0][1]
+        hits = self._containers.at(pos)
+        if hits:
+            return hits[0][1]
+
+
 #------------------------------------------------------------------------------
 # Layout Unplugging
 #------------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from atom.api import Atom, Typed, Value
 from enaml.qt.QtCore import QObject
 
 from .q_dock_frame import QDockFrame
+from .utils import RectIndex
 
 
 class ProximityHandler(QObject):
@@ -59,6 +60,7 @@ class ProximityHandler(QObject):
         """
         super(ProximityHandler, self).__init__()
         self._nodes = {}
+        self._index = None
 
     #--------------------------------------------------------------------------
     # Private API
@@ -87,6 +89,7 @@ class ProximityHandler(QObject):
             return
         nodes[frame] = self.GraphNode(frame=frame)
         frame.linkButtonToggled.connect(self._onLinkToggled)
+        self._index = None
 
     def removeFrame(self, frame):
         """ Remove a dock frame from the proximity handler.
@@ -103,6 +106,7 @@ class ProximityHandler(QObject):
             return
         nodes.pop(frame).unlink()
         frame.linkButtonToggled.disconnect(self._onLinkToggled)
+        self._index = None
 
     def hasLinkedFrames(self, frame):
         """ Get whether or not the frame has linked proximal frames.
@@ -173,6 +177,33 @@ class ProximityHandler(QObject):
                     if proximal is not frame and proximal.isLinked():
                         node.link(nodes[proximal])
 
+    def buildIndex(self, exclude=None):
+        """ Build a spatial index of the current frame geometries.
+
+        While the index exists, `proximalFrames` only tests the frames
+        located near the rectangle of interest. The index is meant to
+        be used while a frame is dragged, when the other frames do not
+        move. It is discarded by `clearIndex` or when a frame is added
+        to or removed from the handler.
+
+        Parameters
+        ----------
+        exclude : QDockFrame, optional
+            A frame to leave out of the index, typically the frame
+            being dragged.
+
+        """
+        index = self._index = RectIndex(cell_size=256)
+        for frame in self._nodes:
+            if frame is not exclude:
+                index.add(frame.frameGeometry(), frame)
+
+    def clearIndex(self):
+        """ Discard the spatial index of the frame geometries.
+
+        """
+        self._index = None
+
     def proximalFrames(self, rect, distance):
         """ Get an iterable of proximal frames for a gap distance.
 
@@ -193,6 +224,13 @@ class ProximityHandler(QObject):
 
         """
         d = max(0, distance)
+        index = self._index
+        if index is not None:
+            for _, frame in index.intersecting(rect.adjusted(-d, -d, d, d)):
+                f_rect = frame.frameGeometry().adjusted(-d, -d, d, d)
+                if rect.intersects(f_rect):
+                    yield frame
+            return
         for frame in self._nodes:
             f_rect = frame.frameGeometry().adjusted(-d, -d, d, d)
             if rect.intersects(f_rect):
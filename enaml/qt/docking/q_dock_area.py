@@ -11,6 +11,7 @@ from enaml.qt.QtWidgets import (
     QWidget, QStyle, QStyleOption
 )
 
+from .event_types import DockAreaContentsChanged
 from .q_dock_bar import QDockBarManager
 
 
@@ -67,6 +68,7 @@ class QDockArea(QFrame):
         self._dock_events_enabled = False
         self._opaque_resize = None
         self._tab_position = None
+        self._contents_generation = 0
 
         central_layout = QVBoxLayout()
         central_layout.setContentsMargins(QMargins(0, 0, 0, 0))
@@ -101,11 +103,26 @@ class QDockArea(QFrame):
         """
         if event.type() == QEvent.StyleChange:
             self.updateSpacing()
+        elif event.type() == DockAreaContentsChanged:
+            self._contents_generation += 1
         return super(QDockArea, self).event(event)
 
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
+    def contentsGeneration(self):
+        """ Get the generation number of the dock area contents.
+
+        Returns
+        -------
+        result : int
+            A number which is incremented each time the contents of
+            the dock area change. It can be used to invalidate data
+            which is derived from the layout of the dock area.
+
+        """
+        return self._contents_generation
+
     def updateSpacing(self):
         """ Update the primary layout spacing for the dock area.
 
@@ -188,6 +205,7 @@ class QDockArea(QFrame):
                 return
             old.hide()
             old.setParent(None)
+        self._contents_generation += 1
         if widget is not None:
             layout.addWidget(widget)
             # lower the widget to keep it stacked behind any pinned
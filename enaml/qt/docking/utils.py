@@ -5,6 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+from collections import defaultdict
+
+from enaml.qt.QtCore import QRect
 
 
 def repolish(widget):
@@ -19,3 +22,105 @@ def repolish(widget):
     style = widget.style()
     style.unpolish(widget)
     style.polish(widget)
+
+
+class RectIndex(object):
+    """ A uniform grid index of rectangles.
+
+    The index maps each cell of a grid to the rectangles which overlap
+    it, so that a point query only has to test the rectangles of a
+    single cell.
+
+    """
+    def __init__(self, cell_size=64):
+        """ Initialize a RectIndex.
+
+        Parameters
+        ----------
+        cell_size : int, optional
+            The size in pixels of the cells of the grid.
+
+        """
+        self._cell_size = cell_size
+        self._cells = defaultdict(list)
+        self._items = []
+
+    def __len__(self):
+        """ Get the number of rectangles in the index.
+
+        """
+        return len(self._items)
+
+    def _cell_range(self, rect):
+        """ Get the ranges of the cell coordinates covered by a rect.
+
+        """
+        size = self._cell_size
+        x_range = range(rect.left() // size, rect.right() // size + 1)
+        y_range = range(rect.top() // size, rect.bottom() // size + 1)
+        return x_range, y_range
+
+    def add(self, rect, value):
+        """ Add a rectangle to the index.
+
+        Parameters
+        ----------
+        rect : QRect
+            The rectangle to add to the index.
+
+        value : object
+            The value associated with the rectangle.
+
+        """
+        index = len(self._items)
+        self._items.append((QRect(rect), value))
+        cells = self._cells
+        x_range, y_range = self._cell_range(rect)
+        for x in x_range:
+            for y in y_range:
+                cells[(x, y)].append(index)
+
+    def at(self, pos):
+        """ Get the rectangles which contain a point.
+
+        Parameters
+        ----------
+        pos : QPoint
+            The point of interest.
+
+        Returns
+        -------
+        result : list
+            The (rect, value) pairs which contain the point, in the
+            order in which they were added to the index.
+
+        """
+        size = self._cell_size
+        indices = self._cells.get((pos.x() // size, pos.y() // size), ())
+        items = self._items
+        return [items[i] for i in indices if items[i][0].contains(pos)]
+
+    def intersecting(self, rect):
+        """ Get the rectangles which intersect a rect.
+
+        Parameters
+        ----------
+        rect : QRect
+            The rectangle of interest.
+
+        Returns
+        -------
+        result : list
+            The (rect, value) pairs which intersect the rectangle, in
+            the order in which they were added to the index.
+
+        """
+        cells = self._cells
+        found = set()
+        x_range, y_range = self._cell_range(rect)
+        for x in x_range:
+            for y in y_range:
+                found.update(cells.get((x, y), ()))
+        items = self._items
+        return [items[i] for i in sorted(found)
+                if items[i][0].intersects(rect)]
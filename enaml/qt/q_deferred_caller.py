@@ -5,6 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+from collections import deque
+from threading import Lock
+
 from .QtCore import QObject, QTimer, QEvent, QThread
 from .QtWidgets import QApplication
 
@@ -12,20 +15,31 @@ from .QtWidgets import QApplication
 class DeferredCallEvent(QEvent):
     """ A custom event type for deferred call events.
 
+    An event posted from the main gui thread carries a single call, so
+    that the call keeps its order relative to the other events of the
+    Qt event loop. An event posted from another thread carries no call
+    and runs the batch of calls held by the DeferredCaller.
+
     """
     # Explicitly coerce to QEvent.Type for PySide compatibility.
     Type = QEvent.Type(QEvent.registerEventType())
 
-    def __init__(self, callback, args, kwargs):
+    def __init__(self, entry=None):
         super(DeferredCallEvent, self).__init__(self.Type)
-        self.callback = callback
-        self.args = args
-        self.kwargs = kwargs
+        self.entry = entry
 
 
 class DeferredCaller(QObject):
     """ A QObject subclass which handles deferred call events.
 
+    A call made on the main gui thread is posted as its own event. The
+    calls made from other threads are queued by the caller and a single
+    event is posted to run all the calls queued until it is processed.
+    This keeps the Qt event queue small when calls are made at a high
+    rate from another thread. A call made with a key replaces the
+    pending call with the same key, if any, so that only the latest one
+    is run.
+
     """
     def __init__(self):
         """ Initialize a DeferredCaller.
@@ -33,13 +47,109 @@ class DeferredCaller(QObject):
         """
         super(DeferredCaller, self).__init__()
         self.moveToThread(QApplication.instance().thread())
+        self._lock = Lock()
+        self._queue = deque()
+        self._keyed = {}
+        self._posted = False
+
+        #: The number of calls which were queued without posting an
+        #: event because one was already pending.
+        self.merged = 0
+
+        #: The number of keyed calls which were replaced by a later
+        #: call with the same key before being run.
+        self.dropped = 0
+
+    def post(self, key, callback, args, kwargs):
+        """ Post a call to run on the main gui thread.
+
+        Parameters
+        ----------
+        key : hashable or None
+            The key of the call. A pending call with the same key is
+            replaced by this call. None means the call is not keyed.
+
+        callback : callable
+            The callable to run.
+
+        args : tuple
+            The positional arguments to pass to the callable.
+
+        kwargs : dict
+            The keyword arguments to pass to the callable.
+
+        """
+        entry = [callback, args, kwargs, key]
+        direct = QThread.currentThread() == self.thread()
+        with self._lock:
+            if key is not None:
+                pending = self._keyed.get(key)
+                if pending is not None:
+                    # The call keeps the position of the replaced one.
+                    pending[:3] = entry[:3]
+                    self.dropped += 1
+                    return
+                self._keyed[key] = entry
+            if not direct:
+                self._queue.append(entry)
+                if self._posted:
+                    self.merged += 1
+                    return
+                self._posted = True
+                entry = None
+        QApplication.postEvent(self, DeferredCallEvent(entry))
+
+    def resetCounters(self):
+        """ Reset the merged and dropped counters to zero.
+
+        """
+        self.merged = self.dropped = 0
 
     def customEvent(self, event):
         """ Handle the custom deferred call events.
 
         """
         if event.type() == DeferredCallEvent.Type:
-            event.callback(*event.args, **event.kwargs)
+            if event.entry is not None:
+                self._run(event.entry)
+                return
+            with self._lock:
+                batch = self._queue
+                self._queue = deque()
+                self._posted = False
+            try:
+                while batch:
+                    self._run(batch.popleft())
+            finally:
+                if batch:
+                    self._requeue(batch)
+
+    def _run(self, entry):
+        """ Run the call held by a pending entry.
+
+        """
+        key = entry[3]
+        if key is not None:
+            with self._lock:
+                del self._keyed[key]
+                callback, args, kwargs = entry[:3]
+        else:
+            callback, args, kwargs = entry[:3]
+        callback(*args, **kwargs)
+
+    def _requeue(self, batch):
+        """ Queue again the calls left over by a failing call.
+
+        The calls are put in front of the queue.
+
+        """
+        post = False
+        with self._lock:
+            self._queue.extendleft(reversed(batch))
+            if not self._posted:
+                self._posted = post = True
+        if post:
+            QApplication.postEvent(self, DeferredCallEvent())
 
 
 #: A globally available caller instance. This will be created on demand
@@ -47,8 +157,8 @@ class DeferredCaller(QObject):
 __caller = None
 
 
-def deferredCall(callback, *args, **kwargs):
-    """ Execute the callback on the main gui thread.
+def deferredCaller():
+    """ Get the global deferred caller, creating it if needed.
 
     This should only be called after the QApplication is created.
 
@@ -57,8 +167,26 @@ def deferredCall(callback, *args, **kwargs):
     caller = __caller
     if caller is None:
         caller = __caller = DeferredCaller()
-    event = DeferredCallEvent(callback, args, kwargs)
-    QApplication.postEvent(caller, event)
+    return caller
+
+
+def deferredCall(callback, *args, **kwargs):
+    """ Execute the callback on the main gui thread.
+
+    This should only be called after the QApplication is created.
+
+    """
+    deferredCaller().post(None, callback, args, kwargs)
+
+
+def keyedDeferredCall(key, callback, *args, **kwargs):
+    """ Execute the callback on the main gui thread, replacing the
+    pending call with the same key, if any.
+
+    This should only be called after the QApplication is created.
+
+    """
+    deferredCaller().post(key, callback, args, kwargs)
 
 
 def timedCall(ms, callback, *args, **kwargs):
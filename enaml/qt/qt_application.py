@@ -5,14 +5,16 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed
+from atom.api import Bool, Typed
 
 from enaml.application import Application, ProxyResolver
 
 from .QtCore import QThread
 from .QtWidgets import QApplication
 
-from .q_deferred_caller import deferredCall, timedCall
+from .q_deferred_caller import (
+    deferredCall, deferredCaller, keyedDeferredCall, timedCall
+)
 from .qt_factories import QT_FACTORIES
 from .qt_mime_data import QtMimeData
 
@@ -24,6 +26,14 @@ class QtApplication(Application):
     runs in the local process.
 
     """
+    #: Whether the styles are compiled once into a single application
+    #: style sheet instead of a style sheet per widget. In this mode,
+    #: the widgets only toggle a dynamic property when their styles
+    #: change, which avoids parsing a style sheet for every widget.
+    #: It should be set before any widget is created and it does not
+    #: apply to the dock area and dock items, which use custom styling.
+    shared_style_sheet = Bool(False)
+
     #: The private QApplication instance.
     _qapp = Typed(QApplication)
 
@@ -72,6 +82,25 @@ class QtApplication(Application):
         """
         deferredCall(callback, *args, **kwargs)
 
+    def keyed_deferred_call(self, key, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the main event loop
+        thread, replacing the pending call with the same key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying the calls which replace each other.
+
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        args, kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        keyedDeferredCall(key, callback, *args, **kwargs)
+
     def timed_call(self, ms, callback, *args, **kwargs):
         """ Invoke a callable on the main event loop thread at a
         specified time in the future.
@@ -92,6 +121,21 @@ class QtApplication(Application):
         """
         timedCall(ms, callback, *args, **kwargs)
 
+    def deferred_call_counts(self):
+        """ Get the counters of the deferred call queue.
+
+        Returns
+        -------
+        result : dict
+            A dict with the number of 'merged' calls, which were queued
+            from another thread without posting a Qt event, and of
+            'dropped' calls, which were replaced by a later call with
+            the same key.
+
+        """
+        caller = deferredCaller()
+        return {'merged': caller.merged, 'dropped': caller.dropped}
+
     def is_main_thread(self):
         """ Indicates whether the caller is on the main gui thread.
 
@@ -138,6 +138,19 @@ class QtLayoutItem(LayoutItem):
         """
         return self.declaration.layout_constraints()
 
+    def geometry_offset(self):
+        """ Get the offset which is applied to the solved geometry.
+
+        Returns
+        -------
+        result : tuple
+            The 2-tuple of the (x, y) offset of the parent item, since
+            the widget geometry is expressed relative to its parent.
+
+        """
+        offset = self.offset
+        return (offset.x, offset.y)
+
     def set_geometry(self, x, y, width, height):
         """ Set the geometry of the underlying widget.
 
@@ -563,9 +576,10 @@ class QtContainer(QtFrame, ProxyContainer):
             min_size = DEFAULT_MIN_SIZE
             max_size = DEFAULT_MAX_SIZE
         else:
-            best_size = QSize(*manager.best_size())
-            min_size = QSize(*manager.min_size())
-            max_size = QSize(*manager.max_size())
+            best, minimum, maximum = manager.size_bounds()
+            best_size = QSize(*best)
+            min_size = QSize(*minimum)
+            max_size = QSize(*maximum)
 
         # Store the computed min and max size, which is used by the
         # QtChildContainerItem to provide min and max size constraints.
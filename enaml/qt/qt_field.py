@@ -128,6 +128,9 @@ class QtField(QtControl, ProxyField):
             self._guard &= ~ERROR_FLAG
             self.widget.setStyleSheet(u'')
             self.widget.setToolTip(u'')
+            # Restore the style sheet computed from the declared styles.
+            del self._style_key
+            self.refresh_style_sheet()
 
     def _maybe_valid(self, text):
         """ Get whether the text is valid or can be valid.
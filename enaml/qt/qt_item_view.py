@@ -0,0 +1,268 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Int, Typed
+
+from enaml.widgets.item_view import ProxyItemView
+
+from .QtCore import Qt, QAbstractTableModel, QModelIndex
+from .QtWidgets import QAbstractItemView
+
+from .qt_control import QtControl
+
+
+class QItemModelAdaptor(QAbstractTableModel):
+    """ A QAbstractTableModel which exposes an Enaml ItemModel.
+
+    The data is pulled from the item model only for the cells that the
+    view requests, which are the visible ones. The row events of the
+    item model are forwarded as the incremental notifications of the
+    Qt model.
+
+    The item model fires its row events once its data has changed, so
+    the adaptor keeps its own row count. It is only updated between the
+    begin and end notifications of a change, which means the views and
+    proxy models see the row count expected by the Qt model contract.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QItemModelAdaptor.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the adaptor.
+
+        """
+        super(QItemModelAdaptor, self).__init__(parent)
+        self._model = None
+        self._rowCount = 0
+
+    def model(self):
+        """ Get the item model exposed by the adaptor.
+
+        Returns
+        -------
+        result : ItemModel or None
+            The item model exposed by the adaptor.
+
+        """
+        return self._model
+
+    def setModel(self, model):
+        """ Set the item model exposed by the adaptor.
+
+        Parameters
+        ----------
+        model : ItemModel or None
+            The item model to expose.
+
+        """
+        old = self._model
+        if old is model:
+            return
+        self.beginResetModel()
+        if old is not None:
+            old.unobserve('rows_inserted', self._onRowsInserted)
+            old.unobserve('rows_removed', self._onRowsRemoved)
+            old.unobserve('rows_changed', self._onRowsChanged)
+            old.unobserve('model_reset', self._onModelReset)
+        self._model = model
+        self._rowCount = 0
+        if model is not None:
+            model.observe('rows_inserted', self._onRowsInserted)
+            model.observe('rows_removed', self._onRowsRemoved)
+            model.observe('rows_changed', self._onRowsChanged)
+            model.observe('model_reset', self._onModelReset)
+            self._rowCount = model.row_count()
+        self.endResetModel()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _onRowsInserted(self, change):
+        """ Handle the 'rows_inserted' event of the item model.
+
+        """
+        first, last = change['value']
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._rowCount += last - first + 1
+        self.endInsertRows()
+
+    def _onRowsRemoved(self, change):
+        """ Handle the 'rows_removed' event of the item model.
+
+        """
+        first, last = change['value']
+        self.beginRemoveRows(QModelIndex(), first, last)
+        self._rowCount -= last - first + 1
+        self.endRemoveRows()
+
+    def _onRowsChanged(self, change):
+        """ Handle the 'rows_changed' event of the item model.
+
+        """
+        first, last = change['value']
+        right = self.columnCount() - 1
+        self.dataChanged.emit(self.index(first, 0), self.index(last, right))
+
+    def _onModelReset(self, change):
+        """ Handle the 'model_reset' event of the item model.
+
+        """
+        self.beginResetModel()
+        self._rowCount = self._model.row_count()
+        self.endResetModel()
+
+    #--------------------------------------------------------------------------
+    # QAbstractTableModel API
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows of the model.
+
+        """
+        if self._model is None or parent.isValid():
+            return 0
+        return self._rowCount
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Get the number of columns of the model.
+
+        """
+        model = self._model
+        if model is None or parent.isValid():
+            return 0
+        return model.column_count()
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Get the data of a cell of the model.
+
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        model = self._model
+        row = index.row()
+        column = index.column()
+        # Rows may be requested while a removal is being processed.
+        if row >= model.row_count() or column >= model.column_count():
+            return None
+        return model.data(row, column)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """ Get the data of a header section of the model.
+
+        """
+        model = self._model
+        if (model is not None and role == Qt.DisplayRole and
+                orientation == Qt.Horizontal):
+            text = model.header_data(section)
+            if text is not None:
+                return text
+        return super(QItemModelAdaptor, self).headerData(
+            section, orientation, role
+        )
+
+
+# cyclic notification guard flags
+ROW_GUARD = 0x1
+
+
+class QtItemView(QtControl, ProxyItemView):
+    """ A Qt implementation of an Enaml ProxyItemView.
+
+    This is a base class which must be subclassed to create the view
+    widget.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QAbstractItemView)
+
+    #: The adaptor exposing the item model to the widget.
+    adaptor = Typed(QItemModelAdaptor)
+
+    #: Cyclic notification guard. This a bitfield of multiple guards.
+    _guard = Int(0)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtItemView, self).init_widget()
+        d = self.declaration
+        widget = self.widget
+        self.adaptor = QItemModelAdaptor(widget)
+        widget.setModel(self.adaptor)
+        widget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        widget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.set_model(d.model)
+        self.set_current_row(d.current_row)
+        widget.selectionModel().currentRowChanged.connect(
+            self.on_current_row_changed
+        )
+        widget.activated.connect(self.on_activated)
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This destructor disconnects the adaptor from the item model.
+
+        """
+        if self.adaptor is not None:
+            self.adaptor.setModel(None)
+            del self.adaptor
+        super(QtItemView, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_current_row_changed(self, current, previous):
+        """ Handle the 'currentRowChanged' signal of the selection model.
+
+        """
+        if not self._guard & ROW_GUARD:
+            self._guard |= ROW_GUARD
+            try:
+                row = current.row() if current.isValid() else -1
+                self.declaration.current_row = row
+            finally:
+                self._guard &= ~ROW_GUARD
+
+    def on_activated(self, index):
+        """ Handle the 'activated' signal of the widget.
+
+        """
+        if index.isValid():
+            self.declaration.row_activated(index.row())
+
+    #--------------------------------------------------------------------------
+    # ProxyItemView API
+    #--------------------------------------------------------------------------
+    def set_model(self, model):
+        """ Set the item model displayed by the widget.
+
+        """
+        self.adaptor.setModel(model)
+
+    def set_current_row(self, row):
+        """ Set the current row of the widget.
+
+        """
+        if not self._guard & ROW_GUARD:
+            self._guard |= ROW_GUARD
+            try:
+                widget = self.widget
+                index = self.adaptor.index(row, 0)
+                if index.isValid():
+                    widget.setCurrentIndex(index)
+                    widget.scrollTo(index)
+                else:
+                    widget.selectionModel().clear()
+            finally:
+                self._guard &= ~ROW_GUARD
@@ -0,0 +1,36 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.list_view import ProxyListView
+
+from .QtWidgets import QListView
+
+from .qt_item_view import QtItemView
+
+
+class QtListView(QtItemView, ProxyListView):
+    """ A Qt implementation of an Enaml ProxyListView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QListView)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying QListView widget.
+
+        """
+        widget = QListView(self.parent_widget())
+        # Uniform sizes and batched layout avoid measuring every row,
+        # which keeps the view cost proportional to the visible rows.
+        widget.setUniformItemSizes(True)
+        widget.setLayoutMode(QListView.Batched)
+        self.widget = widget
@@ -411,9 +411,25 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
         for page in self.pages():
             widget.addPage(page)
         self.init_selected_tab()
+        self.activate_current_page()
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This destructor disconnects the 'currentChanged' signal, which
+        is emitted while the pages are removed.
+
+        """
+        widget = self.widget
+        if widget is not None:
+            try:
+                widget.currentChanged.disconnect(self.on_current_changed)
+            except (TypeError, RuntimeError):  # was never connected
+                pass
+        super(QtNotebook, self).destroy()
+
     #--------------------------------------------------------------------------
     # Utility Methods
     #--------------------------------------------------------------------------
@@ -444,6 +460,19 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
             if page.objectName() == name:
                 return page
 
+    def activate_current_page(self):
+        """ Activate the deferred contents of the current page.
+
+        This is a no-op unless the notebook is lazy.
+
+        """
+        if self.declaration.lazy:
+            current = self.widget.currentWidget()
+            for p in self.declaration.pages():
+                if p.proxy_is_active and p.proxy.widget is current:
+                    p.activate_contents()
+                    break
+
     def init_selected_tab(self):
         """ Initialize the selected tab.
 
@@ -496,6 +525,7 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
         """ Handle the 'currentChanged' signal from the QNotebook.
 
         """
+        self.activate_current_page()
         if not self._guard & CHANGE_GUARD:
             self._guard |= CHANGE_GUARD
             try:
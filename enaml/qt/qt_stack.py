@@ -335,6 +335,7 @@ class QtStack(QtConstraintsWidget, ProxyStack):
             widget.addWidget(item)
         # Bypass the transition effect during initialization.
         widget.setCurrentIndex(self.declaration.index)
+        self.activate_item(self.declaration.index)
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
@@ -350,6 +351,18 @@ class QtStack(QtConstraintsWidget, ProxyStack):
             if w is not None:
                 yield w
 
+    def activate_item(self, index):
+        """ Activate the deferred contents of the item at an index.
+
+        This is a no-op unless the stack is lazy.
+
+        """
+        d = self.declaration
+        if d.lazy:
+            items = d.stack_items()
+            if 0 <= index < len(items):
+                items[index].activate_contents()
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -384,6 +397,7 @@ class QtStack(QtConstraintsWidget, ProxyStack):
         """ Handle the `currentChanged` signal from the QStack.
 
         """
+        self.activate_item(self.widget.currentIndex())
         if not self._guard & INDEX_FLAG:
             self._guard |= INDEX_FLAG
             try:
@@ -398,6 +412,9 @@ class QtStack(QtConstraintsWidget, ProxyStack):
         """ Set the current index of the underlying widget.
 
         """
+        # The contents are activated before the transition so that
+        # the transition renders the target item.
+        self.activate_item(index)
         if not self._guard & INDEX_FLAG:
             self._guard |= INDEX_FLAG
             try:
@@ -0,0 +1,61 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.table_view import ProxyTableView
+
+from .QtWidgets import QHeaderView, QTableView
+
+from .qt_item_view import QtItemView
+
+
+class QtTableView(QtItemView, ProxyTableView):
+    """ A Qt implementation of an Enaml ProxyTableView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QTableView)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying QTableView widget.
+
+        """
+        widget = QTableView(self.parent_widget())
+        # Fixed row heights avoid measuring every row, which keeps the
+        # view cost proportional to the visible rows.
+        header = widget.verticalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(widget.fontMetrics().height() + 6)
+        self.widget = widget
+
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtTableView, self).init_widget()
+        d = self.declaration
+        self.set_header_visible(d.header_visible)
+        self.set_row_header_visible(d.row_header_visible)
+
+    #--------------------------------------------------------------------------
+    # ProxyTableView API
+    #--------------------------------------------------------------------------
+    def set_header_visible(self, visible):
+        """ Set whether or not the column header is visible.
+
+        """
+        self.widget.horizontalHeader().setVisible(visible)
+
+    def set_row_header_visible(self, visible):
+        """ Set whether or not the row header is visible.
+
+        """
+        self.widget.verticalHeader().setVisible(visible)
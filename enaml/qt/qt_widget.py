@@ -5,7 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed, Coerced
+from atom.api import Typed, Coerced, Value
 
 from enaml.drag_drop import DropAction
 from enaml.styling import StyleCache
@@ -21,7 +21,10 @@ from .q_resource_helpers import (
 )
 from .qt_drag_drop import QtDropEvent
 from .qt_toolkit_object import QtToolkitObject
-from .styleutil import translate_style
+from .styleutil import (
+    SHARED_STYLE_PROPERTY, SharedStyleSheet, cached_style,
+    shared_style_sheet_enabled, translate_style
+)
 
 
 class QtWidget(QtToolkitObject, ProxyWidget):
@@ -42,6 +45,9 @@ class QtWidget(QtToolkitObject, ProxyWidget):
     #: Internal storage for the drag origin position.
     _drag_origin = Typed(QPoint)
 
+    #: Internal storage for the key of the last applied style sheet.
+    _style_key = Value()
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -142,9 +148,21 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         """ Refresh the widget style sheet with the current style data.
 
         """
+        if shared_style_sheet_enabled():
+            self.refresh_shared_styles()
+            return
+        widget = self.widget
+        name = widget.objectName()
+        styles = StyleCache.styles(self.declaration)
+        # The translations are shared and cached per style, so the
+        # style sheet is only rebuilt and reparsed if one of them or
+        # the object name changed since the last refresh.
+        key = (name, tuple(cached_style(style) for style in styles))
+        if key == self._style_key:
+            return
+        self._style_key = key
         parts = []
-        name = self.widget.objectName()
-        for style in StyleCache.styles(self.declaration):
+        for style in styles:
             t = translate_style(name, style)
             if t:
                 parts.append(t)
@@ -152,7 +170,28 @@ class QtWidget(QtToolkitObject, ProxyWidget):
             stylesheet = u'\n\n'.join(parts)
         else:
             stylesheet = u''
-        self.widget.setStyleSheet(stylesheet)
+        if stylesheet or widget.styleSheet():
+            widget.setStyleSheet(stylesheet)
+
+    def refresh_shared_styles(self):
+        """ Refresh the shared styles applied to the widget.
+
+        This is used in place of a per-widget style sheet when the
+        application shares a single style sheet. The widget is only
+        repolished when the set of applied styles changed.
+
+        """
+        widget = self.widget
+        style_ids = SharedStyleSheet.style_ids(
+            StyleCache.styles(self.declaration)
+        )
+        if widget.property(SHARED_STYLE_PROPERTY) != style_ids:
+            widget.setProperty(SHARED_STYLE_PROPERTY, style_ids)
+            if widget.styleSheet():
+                widget.setStyleSheet(u'')
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
 
     def tab_focus_request(self, reason):
         """ Handle a custom tab focus request.
@@ -542,6 +581,17 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         """
         return self.focus_target().hasFocus()
 
+    def is_visible(self):
+        """ Test whether the widget is visible in its window.
+
+        This accounts for the ancestors hidden by the toolkit, such as
+        the non-current pages of a notebook. A window is shown by the
+        application, so it is always considered visible.
+
+        """
+        widget = self.widget
+        return widget.isWindow() or widget.isVisibleTo(widget.window())
+
     def focus_next_child(self):
         """ Give focus to the next widget in the focus chain.
 
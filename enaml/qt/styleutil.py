@@ -6,9 +6,13 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
 import re
+from itertools import count
 
+from enaml.application import Application, deferred_call
 from enaml.styling import StyleCache
 
+from .QtWidgets import QApplication
+
 
 _grad_re = re.compile(r'(lineargradient|radialgradient)')
 
@@ -127,12 +131,12 @@ def _translate_style_body(style):
     return '\n'.join(translated)
 
 
-def translate_style(name, style):
-    parts = ['#%s' % name]
+def _translate_selector_suffixes(style):
+    parts = ['']
     if style.pseudo_element:
-        root = parts.pop()
+        parts = []
         for pe in style.pseudo_element.split(','):
-            parts.append(root + '::%s' % pe.strip())
+            parts.append('::%s' % pe.strip())
     if style.pseudo_class:
         these = parts[:]
         parts = []
@@ -140,9 +144,216 @@ def translate_style(name, style):
             pc = pc.strip()
             for this in these:
                 parts.append(this + ':%s' % pc)
-    selector = ','.join(parts)
+    return tuple(parts)
+
+
+def _translate_style(style):
+    suffixes = _translate_selector_suffixes(style)
     body = '{\n%s\n}' % _translate_style_body(style)
-    return '%s %s' % (selector, body)
+    return (suffixes, body)
+
+
+def cached_style(style):
+    """ Get the cached translation of a style.
+
+    The translation only depends on the style, so it is shared by all
+    of the widgets to which the style applies. It is cleared by the
+    StyleCache when the style, its pseudo state, or its setters change.
+
+    Parameters
+    ----------
+    style : Style
+        The style of interest.
+
+    Returns
+    -------
+    result : tuple
+        A 2-tuple of the tuple of selector suffixes for the pseudo
+        elements and classes of the style, and the translated body.
+
+    """
+    return StyleCache.toolkit_style(style, _translate_style)
+
+
+def _join_style(root, translated):
+    suffixes, body = translated
+    return '%s %s' % (','.join(root + s for s in suffixes), body)
+
+
+def translate_style(name, style):
+    return _join_style('#%s' % name, cached_style(style))
+
+
+#------------------------------------------------------------------------------
+# Shared Styling
+#------------------------------------------------------------------------------
+#: The name of the dynamic widget property which holds the space
+#: separated identifiers of the shared styles applied to the widget.
+SHARED_STYLE_PROPERTY = 'enamlStyles'
+
+#: The comment which starts the shared rules appended to the style
+#: sheet of the application.
+SHARED_STYLE_HEADER = u'\n/* enaml shared styles */\n'
+
+
+def shared_style_sheet_enabled():
+    """ Get whether the shared style sheet mode is enabled.
+
+    """
+    app = Application.instance()
+    return app is not None and getattr(app, 'shared_style_sheet', False)
+
+
+def _style_sheet_depth(sheet):
+    depth = 0
+    parent = sheet.parent
+    while parent is not None:
+        depth += 1
+        parent = parent.parent
+    return depth
+
+
+def _style_specificity(style):
+    specificity = 0
+    if style.object_name:
+        specificity += 0x100
+    if style.style_class:
+        specificity += 0x10
+    if style.element:
+        specificity += 0x1
+    return specificity
+
+
+class SharedStyleSheet(object):
+    """ A class which manages the application level shared style sheet.
+
+    In this mode, each :class:`Style` is compiled once into a rule
+    which targets the widgets having the style identifier in their
+    dynamic property named by SHARED_STYLE_PROPERTY. Widgets then only
+    update that property, and the rules are ordered globally so that
+    the cascade matches the precedence computed by the StyleCache.
+
+    All interaction with this class is through public class methods.
+
+    """
+    #: A private mapping of Style to style identifier.
+    _style_ids = {}
+
+    #: A private mapping of Style to (translation, order key, rule).
+    _rules = {}
+
+    #: The style sheet set on the application by the user.
+    _user_style_sheet = u''
+
+    #: The application style sheet as it was last applied, including
+    #: the generated rules.
+    _applied_style_sheet = None
+
+    #: Whether a flush of the style sheet has been scheduled.
+    _flush_pending = False
+
+    #: A counter used to generate the style identifiers.
+    _counter = count()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    @classmethod
+    def style_ids(cls, styles):
+        """ Get the shared identifiers for a sequence of styles.
+
+        The rules of the styles which were not compiled, or which were
+        invalidated since their last compilation, are (re)compiled and
+        an update of the application style sheet is scheduled.
+
+        Parameters
+        ----------
+        styles : iterable
+            The :class:`Style` objects which apply to a widget.
+
+        Returns
+        -------
+        result : unicode
+            The space separated identifiers of the styles.
+
+        """
+        rules = cls._rules
+        positions = {}
+        ids = []
+        for style in styles:
+            translated = cached_style(style)
+            rule = rules.get(style)
+            if rule is None or rule[0] is not translated:
+                rules[style] = cls._make_rule(style, translated, positions)
+                cls._schedule_flush()
+            ids.append(cls._style_ids[style])
+        return u' '.join(ids)
+
+    @classmethod
+    def flush(cls):
+        """ Apply the pending rule changes to the application.
+
+        The rules are appended to the style sheet set on the application
+        by the user, which is stored separately and preserved. A style
+        sheet found on the application which differs from the one last
+        applied is taken as a new user style sheet. The application
+        style sheet is only reset if its text changed.
+
+        """
+        cls._flush_pending = False
+        rules = cls._rules
+        style_ids = cls._style_ids
+        for style in [s for s in rules if s.is_destroyed]:
+            del rules[style]
+            style_ids.pop(style, None)
+        ordered = sorted(rules.values(), key=lambda rule: rule[1])
+        style_sheet = u'\n\n'.join(rule[2] for rule in ordered)
+        if style_sheet:
+            style_sheet = SHARED_STYLE_HEADER + style_sheet
+        app = QApplication.instance()
+        if app is not None:
+            current = app.styleSheet()
+            if current != cls._applied_style_sheet:
+                cls._user_style_sheet = current
+            text = cls._user_style_sheet + style_sheet
+            if text != current:
+                app.setStyleSheet(text)
+                current = app.styleSheet()
+            cls._applied_style_sheet = current
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def __new__(cls, *args, **kwargs):
+        raise TypeError('Cannot create instances of SharedStyleSheet')
+
+    @classmethod
+    def _make_rule(cls, style, translated, positions):
+        style_ids = cls._style_ids
+        if style not in style_ids:
+            style_ids[style] = u'es%d' % next(cls._counter)
+        root = '*[%s~="%s"]' % (SHARED_STYLE_PROPERTY, style_ids[style])
+        # The cascade order follows the StyleCache precedence: sheets
+        # closer to the widget win, then the more specific styles, and
+        # finally the styles declared last in a sheet.
+        sheet = style.parent
+        if sheet is not None:
+            index = positions.get(sheet)
+            if index is None:
+                index = positions[sheet] = dict(
+                    (s, i) for i, s in enumerate(sheet.styles())
+                )
+            order = (_style_sheet_depth(sheet), _style_specificity(style),
+                     index[style])
+        else:
+            order = (0, _style_specificity(style), 0)
+        return (translated, order, _join_style(root, translated))
+
+    @classmethod
+    def _schedule_flush(cls):
+        if not cls._flush_pending:
+            cls._flush_pending = True
+            deferred_call(cls.flush)
 
 
 #------------------------------------------------------------------------------
@@ -388,13 +599,11 @@ def translate_dock_area_style(name, style):
     selector = _dock_style_selector(name, style, _DOCK_AREA_PSEUDO_ELEMENTS)
     if not selector:
         return
-    body = '{\n%s\n}' % _translate_style_body(style)
-    return '%s %s' % (selector, body)
+    return '%s %s' % (selector, cached_style(style)[1])
 
 
 def translate_dock_item_style(name, style):
     selector = _dock_style_selector(name, style, _DOCK_ITEM_PSEUDO_ELEMENTS)
     if not selector:
         return
-    body = '{\n%s\n}' % _translate_style_body(style)
-    return '%s %s' % (selector, body)
+    return '%s %s' % (selector, cached_style(style)[1])
@@ -7,6 +7,7 @@
 |----------------------------------------------------------------------------*/
 #include "pythonhelpersex.h"
 #include "py23compat.h"
+#include "inttypes.h"
 
 #ifdef __clang__
 #pragma clang diagnostic ignored "-Wdeprecated-writable-strings"
@@ -135,6 +136,240 @@ run_tracer( PyObject* tracer, PyObject* owner, PyObject* name, PyObject* value )
 }
 
 
+/*-----------------------------------------------------------------------------
+| Resolution Cache
+|----------------------------------------------------------------------------*/
+// The resolution cache records, for an object and an attribute name, the
+// ancestor which provided the name the last time it was loaded from the
+// object, or that no ancestor provided it. A lookup which hits the cache
+// starts at the recorded ancestor and skips the walk up the parent chain.
+//
+// An entry is only recorded if every skipped level is an enaml Object
+// without an instance dict, so a miss on a level depends only on the
+// classes in its mro. The atom classes have a metaclass, so they have no
+// type version tag. The version of the dict of every class in the mro of
+// the skipped levels is recorded instead, along with the mro itself, so
+// that a class mutation invalidates the entry. All of the entries are
+// invalidated when an Object is reparented, which bumps the parent epoch.
+// While the epoch is unchanged, the recorded ancestor is kept alive by the
+// parent references of the object. The object itself is verified through
+// an atomref, since atoms are not weak referenceable. Assigning the class
+// of a skipped ancestor is not detected.
+//
+// The table is shared by the threads and is only used with the GIL held.
+// An entry is copied before running any code which could release the GIL
+// or reenter a lookup, and it is written without running such code, so a
+// partially written entry is never observed. The epoch is read before the
+// walk, so that a reparenting which happens during the walk invalidates
+// the entry recorded at its end.
+//
+// The dict versions were added in Python 3.6, the cache is disabled on the
+// older versions.
+#if PY_VERSION_HEX >= 0x03060000
+#define RESOLVE_CACHE_ENABLED 1
+#else
+#define RESOLVE_CACHE_ENABLED 0
+#endif
+#define RESOLVE_CACHE_SIZE 512
+#define RESOLVE_CACHE_MAX_TYPES 32
+
+
+typedef struct {
+    PyTypeObject* type;
+    PyObject* mro;
+    uint64_t version;
+} ResolveCacheType;
+
+
+typedef struct {
+    PyObject* name;
+    PyObject* ref;
+    PyObject* owner;
+    PyTypeObject* obj_type;
+    size_t epoch;
+    Py_ssize_t count;
+    ResolveCacheType types[ RESOLVE_CACHE_MAX_TYPES ];
+} ResolveCacheEntry;
+
+
+// The classes of the skipped levels, collected during a walk.
+typedef struct {
+    Py_ssize_t count;
+    ResolveCacheType types[ RESOLVE_CACHE_MAX_TYPES ];
+} ResolveCacheTypes;
+
+
+static ResolveCacheEntry resolve_cache[ RESOLVE_CACHE_SIZE ];
+
+
+// The epoch starts at 1 so that the zeroed entries are never valid.
+static size_t parent_epoch = 1;
+
+
+static PyObject* object_type;
+
+
+static PyObject* atomref_type;
+
+
+static inline ResolveCacheEntry*
+resolve_cache_entry( PyObject* obj, PyObject* name )
+{
+    size_t h = ( reinterpret_cast<size_t>( obj ) >> 4 ) ^
+               ( reinterpret_cast<size_t>( name ) >> 4 );
+    return &resolve_cache[ h & ( RESOLVE_CACHE_SIZE - 1 ) ];
+}
+
+
+static inline uint64_t
+type_dict_version( PyTypeObject* tp )
+{
+#if RESOLVE_CACHE_ENABLED
+    return reinterpret_cast<PyDictObject*>( tp->tp_dict )->ma_version_tag;
+#else
+    return 0;
+#endif
+}
+
+
+static PyObject*
+import_attr( const char* module, const char* name )
+{
+    PyObjectPtr mod( PyImport_ImportModule( module ) );
+    if( !mod )
+        return 0;
+    return PyObject_GetAttrString( mod.get(), name );
+}
+
+
+static bool
+resolve_cache_ready()
+{
+    // The classes are imported lazily, since the module of the Object
+    // class imports this module. It is always imported by the time an
+    // Object is looked up. The cache is disabled if the import fails.
+    if( object_type )
+        return object_type != Py_None;
+    if( RESOLVE_CACHE_ENABLED )
+    {
+        object_type = import_attr( "enaml.core.object", "Object" );
+        atomref_type = import_attr( "atom.api", "atomref" );
+    }
+    if( !object_type || !atomref_type || !PyType_Check( object_type ) )
+    {
+        PyErr_Clear();
+        Py_XDECREF( object_type );
+        Py_CLEAR( atomref_type );
+        object_type = newref( Py_None );
+        return false;
+    }
+    return true;
+}
+
+
+static inline bool
+resolve_cache_allowed( PyObject* obj )
+{
+    return Py_TYPE( obj )->tp_dictoffset == 0 &&
+           PyObject_TypeCheck( obj, reinterpret_cast<PyTypeObject*>( object_type ) );
+}
+
+
+// Add the classes in the mro of a skipped level. Returns false if there
+// are too many distinct classes to record.
+static bool
+resolve_cache_add_types( ResolveCacheTypes& types, PyTypeObject* tp )
+{
+    PyObject* mro = tp->tp_mro;
+    if( !mro || !PyTuple_Check( mro ) )
+        return false;
+    Py_ssize_t size = PyTuple_GET_SIZE( mro );
+    for( Py_ssize_t i = 0; i < size; ++i )
+    {
+        PyObject* base = PyTuple_GET_ITEM( mro, i );
+        if( !PyType_Check( base ) )
+            return false;
+        PyTypeObject* base_tp = reinterpret_cast<PyTypeObject*>( base );
+        Py_ssize_t j = 0;
+        while( j < types.count && types.types[ j ].type != base_tp )
+            ++j;
+        if( j < types.count )
+            continue;
+        if( types.count == RESOLVE_CACHE_MAX_TYPES || !base_tp->tp_dict )
+            return false;
+        ResolveCacheType& item = types.types[ types.count++ ];
+        item.type = base_tp;
+        item.mro = base_tp->tp_mro;
+        item.version = type_dict_version( base_tp );
+    }
+    return true;
+}
+
+
+// Get the recorded ancestor of an object for a name. Returns false if no
+// valid entry exists. Otherwise, the owner is set to a new reference to
+// the ancestor, or to null if no ancestor provides the name.
+static bool
+resolve_cache_lookup( PyObject* obj, PyObject* name, PyObjectPtr& owner )
+{
+    ResolveCacheEntry* entry = resolve_cache_entry( obj, name );
+    if( entry->name != name || entry->epoch != parent_epoch ||
+        entry->obj_type != Py_TYPE( obj ) )
+        return false;
+    PyObjectPtr ref( newref( entry->ref ) );
+    PyObject* cached_owner = entry->owner;
+    ResolveCacheTypes types;
+    types.count = entry->count;
+    for( Py_ssize_t i = 0; i < types.count; ++i )
+        types.types[ i ] = entry->types[ i ];
+    // Calling an atomref returns its atom, or None once it is freed.
+    PyObjectPtr referent( PyObject_CallObject( ref.get(), 0 ) );
+    if( !referent )
+    {
+        PyErr_Clear();
+        return false;
+    }
+    if( referent.get() != obj )
+        return false;
+    // The object is alive, so are its unchanged ancestors and classes.
+    for( Py_ssize_t i = 0; i < types.count; ++i )
+    {
+        ResolveCacheType& item = types.types[ i ];
+        if( item.type->tp_mro != item.mro ||
+            type_dict_version( item.type ) != item.version )
+            return false;
+    }
+    owner = xnewref( cached_owner );
+    return true;
+}
+
+
+static void
+resolve_cache_store( PyObject* obj, PyObject* name, PyObject* owner,
+                     size_t epoch, ResolveCacheTypes& types )
+{
+    PyObjectPtr ref( PyObject_CallFunctionObjArgs( atomref_type, obj, NULL ) );
+    if( !ref )
+    {
+        PyErr_Clear();
+        return;
+    }
+    ResolveCacheEntry* entry = resolve_cache_entry( obj, name );
+    PyObject* old_name = entry->name;
+    PyObject* old_ref = entry->ref;
+    entry->name = newref( name );
+    entry->ref = ref.release();
+    entry->owner = owner;
+    entry->obj_type = Py_TYPE( obj );
+    entry->epoch = epoch;
+    entry->count = types.count;
+    for( Py_ssize_t i = 0; i < types.count; ++i )
+        entry->types[ i ] = types.types[ i ];
+    Py_XDECREF( old_name );
+    Py_XDECREF( old_ref );
+}
+
+
 static PyObject*
 load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
 {
@@ -143,9 +378,31 @@ load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
     PyObjectPtr descr;
     descrgetfunc descr_f;
     PyObjectPtr objptr( newref( obj ) );
+    PyObjectPtr res;
+
+    // Start from the recorded ancestor if the name was resolved before.
+    // The walk goes on from there if the ancestor does not provide the
+    // name anymore, since the levels below it are known to not provide
+    // it either. The result is then not recorded again.
+    size_t epoch = parent_epoch;
+    bool cacheable = resolve_cache_ready() && resolve_cache_allowed( obj );
+    if( cacheable )
+    {
+        PyObjectPtr owner;
+        if( resolve_cache_lookup( obj, name, owner ) )
+        {
+            if( !owner )
+                return 0;
+            objptr = owner;
+            cacheable = false;
+        }
+    }
+    Py_ssize_t depth = 0;
+    ResolveCacheTypes types;
+    types.count = 0;
 
     // The body of this loop is PyObject_GenericGetAttr, modified to
-    // use smart pointers and _PyObject_GetDictPtr, and run a tracer.
+    // use smart pointers and _PyObject_GetDictPtr.
     while( objptr.get() != Py_None )
     {
         tp = Py_TYPE( objptr.get() );
@@ -158,14 +415,8 @@ load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
             descr_f = descr.get()->ob_type->tp_descr_get;
             if( descr_f && PyDescr_IsData( descr.get() ) )
             {
-                PyObjectPtr res(
-                    descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-                );
-                if( !res )
-                    maybe_translate_key_error();
-                else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
-                    return 0;
-                return res.release();
+                res = descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) );
+                break;
             }
         }
 
@@ -176,40 +427,56 @@ load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
             PyObject* item = PyDict_GetItem( *dictptr, name );
             if( item )
             {
-                if( tracer && !run_tracer( tracer, objptr.get(), name, item ) )
-                    return 0;
-                return newref( item );
+                res = newref( item );
+                break;
             }
         }
 
         // Non-data descriptor
         if( descr_f )
         {
-            PyObjectPtr res(
-                descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-            );
-            if( !res )
-                maybe_translate_key_error();
-            else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
-                return 0;
-            return res.release();
+            res = descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) );
+            break;
         }
 
         // Non-readable descriptor
         if( descr )
         {
-            if( tracer && !run_tracer( tracer, objptr.get(), name, descr.get() ) )
-                return 0;
-            return descr.release();
+            res = descr;
+            break;
         }
 
+        // Record the miss for the resolution cache
+        if( cacheable )
+            cacheable = resolve_cache_allowed( objptr.get() ) &&
+                        resolve_cache_add_types( types, tp );
+        ++depth;
+
         // Step up to the parent object
         objptr = PyObject_GetAttr( objptr.get(), parent_str );
         if( !objptr )
             return 0;
     }
 
-    return 0;
+    // No ancestor provides the name
+    if( objptr.get() == Py_None )
+    {
+        if( cacheable )
+            resolve_cache_store( obj, name, 0, epoch, types );
+        return 0;
+    }
+
+    // Run the tracer on the object which provided the name
+    if( !res )
+    {
+        maybe_translate_key_error();
+        return 0;
+    }
+    if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
+        return 0;
+    if( cacheable && depth > 0 )
+        resolve_cache_store( obj, name, objptr.get(), epoch, types );
+    return res.release();
 }
 
 
@@ -834,8 +1101,18 @@ struct module_state {
 };
 
 
+static PyObject*
+invalidate_resolve_cache( PyObject* mod )
+{
+    ++parent_epoch;
+    Py_RETURN_NONE;
+}
+
+
 static PyMethodDef
 dynamicscope_methods[] = {
+    { "_invalidate_resolve_cache", ( PyCFunction )invalidate_resolve_cache, METH_NOARGS,
+      "_invalidate_resolve_cache() invalidate the ancestors resolved by the scopes" },
     { 0 } // sentinel
 };
 
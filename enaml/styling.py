@@ -9,8 +9,9 @@
 
 """
 from collections import defaultdict
+from time import time
 
-from atom.api import Atom, Unicode, Typed, observe
+from atom.api import Atom, Float, Int, List, Tuple, Unicode, Typed, observe
 
 from enaml.application import Application, deferred_call
 from enaml.core.declarative import Declarative, d_
@@ -361,12 +362,205 @@ class Stylable(Declarative):
             StyleCache._item_style_class_invalidated(self)
 
 
+class RestyleStats(Atom):
+    """ Counters which instrument the restyle passes of the StyleCache.
+
+    """
+    #: The number of completed restyle passes.
+    passes = Int()
+
+    #: The number of event loop iterations used by the restyle passes.
+    slices = Int()
+
+    #: The total number of restyled items.
+    items = Int()
+
+    #: The total time, in seconds, spent restyling items.
+    duration = Float()
+
+    #: The number of items restyled by the last completed pass.
+    last_items = Int()
+
+    #: The time, in seconds, spent by the last completed pass.
+    last_duration = Float()
+
+    def reset(self):
+        """ Reset all of the counters to zero.
+
+        """
+        self.passes = self.slices = self.items = self.last_items = 0
+        self.duration = self.last_duration = 0.0
+
+
+def _proxy_visible(proxy):
+    """ Get whether the toolkit displays the widget of a proxy.
+
+    Proxies which can not tell are considered visible.
+
+    """
+    is_visible = getattr(proxy, 'is_visible', None)
+    if is_visible is None:
+        return True
+    try:
+        return is_visible()
+    except NotImplementedError:
+        return True
+
+
+def _restyle_order(items):
+    """ Sort items in the order in which they should be restyled.
+
+    Visible items come first, followed by the visible items which do
+    not have an active proxy, and then by the hidden items. An item is
+    hidden if it or one of its ancestors is declared hidden, or if its
+    proxy reports that the toolkit does not display it, as is the case
+    for the non-current pages of a notebook. Within each group, the
+    items closer to the root of their tree come first.
+
+    """
+    memo = {}
+
+    def state(node):
+        # Returns (hidden, depth) for the node, memoized across items
+        # since the restyled items typically share their ancestors.
+        if node is None:
+            return (False, -1)
+        if node in memo:
+            return memo[node]
+        hidden, depth = state(node.parent)
+        result = memo[node] = (
+            hidden or not getattr(node, 'visible', True), depth + 1
+        )
+        return result
+
+    def key(item):
+        hidden, depth = state(item)
+        if hidden:
+            priority = 2
+        elif getattr(item, 'proxy_is_active', False):
+            priority = 0 if _proxy_visible(item.proxy) else 2
+        else:
+            priority = 1
+        return (priority, depth)
+
+    return sorted(items, key=key)
+
+
 class _RestyleTask(Atom):
+    """ A task which collapses item restyle requests.
+
+    The dirty items are restyled in the order defined by _restyle_order
+    and, if StyleCache.restyle_budget is set, over as many event loop
+    iterations as needed to keep each one within the budget.
+
+    """
+    #: The items which were marked dirty since the last slice.
     dirty = Typed(set, ())
+
+    #: The ordered items remaining to restyle, in reverse order.
+    pending = Typed(list, ())
+
+    #: The number of items restyled by the current pass.
+    count = Int()
+
+    #: The time spent by the current pass.
+    duration = Float()
+
     def __call__(self):
-        StyleCache._restyle_task = None
-        for item in self.dirty:
+        dirty = self.dirty
+        pending = self.pending
+        if dirty:
+            dirty.update(pending)
+            pending = self.pending = _restyle_order(dirty)[::-1]
+            self.dirty = set()
+        budget = StyleCache.restyle_budget
+        start = time()
+        count = 0
+        while pending:
+            item = pending.pop()
+            if item.is_destroyed:
+                continue
             item.restyle()
+            count += 1
+            if budget > 0 and time() - start >= budget:
+                break
+        elapsed = time() - start
+        self.count += count
+        self.duration += elapsed
+        stats = StyleCache.restyle_stats
+        stats.slices += 1
+        stats.items += count
+        stats.duration += elapsed
+        if pending or self.dirty:
+            deferred_call(self)
+        else:
+            StyleCache._restyle_task = None
+            stats.passes += 1
+            stats.last_items = self.count
+            stats.last_duration = self.duration
+
+
+class _StyleIndex(Atom):
+    """ An index of the styles of a style sheet keyed on their selector.
+
+    Each style is filed under the tokens of its most selective non-empty
+    field: the object name, then the style class, then the element. The
+    styles with no selector field apply to all items.
+
+    """
+    #: The styles of the style sheet, in declaration order.
+    styles = Tuple()
+
+    #: The indices of the styles which apply to all items.
+    universal = List()
+
+    #: A mapping of (kind, token) to the indices of the styles.
+    keyed = Typed(dict, ())
+
+    def __init__(self, sheet):
+        super(_StyleIndex, self).__init__(styles=tuple(sheet.styles()))
+        universal = self.universal
+        keyed = self.keyed
+        for index, style in enumerate(self.styles):
+            if style.object_name:
+                kind, text = 'name', style.object_name
+            elif style.style_class:
+                kind, text = 'class', style.style_class
+            elif style.element:
+                kind, text = 'element', style.element
+            else:
+                universal.append(index)
+                continue
+            for token in _comma_split(text):
+                keyed.setdefault((kind, token), []).append(index)
+
+    def candidates(self, item):
+        """ Get the styles which may match an item.
+
+        Parameters
+        ----------
+        item : :class:`Stylable`
+            The item of interest.
+
+        Returns
+        -------
+        result : list
+            The styles which may match the item, in declaration order.
+            The styles must still be matched against the item.
+
+        """
+        keyed = self.keyed
+        found = set(self.universal)
+        if keyed:
+            name = item.name
+            if name:
+                found.update(keyed.get(('name', name), ()))
+            for token in item.style_class.split():
+                found.update(keyed.get(('class', token), ()))
+            for t in type(item).__mro__:
+                found.update(keyed.get(('element', t.__name__), ()))
+        styles = self.styles
+        return [styles[index] for index in sorted(found)]
 
 
 def _app_style_sheet():
@@ -405,9 +599,24 @@ class StyleCache(object):
     #: A private mapping of Setter to toolkit data.
     _toolkit_setters = {}
 
+    #: A private mapping of Style to toolkit data.
+    _toolkit_styles = {}
+
+    #: A private mapping of StyleSheet to style index.
+    _style_sheet_indices = {}
+
     #: A RestyleTask which collapses item restyle requests.
     _restyle_task = None
 
+    #: The maximum time, in seconds, spent restyling items in a single
+    #: iteration of the event loop. The remaining items are restyled in
+    #: the following iterations. A value of zero, the default, restyles
+    #: all items at once.
+    restyle_budget = 0.0
+
+    #: The counters which instrument the restyle passes.
+    restyle_stats = RestyleStats()
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
@@ -471,7 +680,7 @@ class StyleCache(object):
         styles = []
         for sheet in cls.style_sheets(item):
             matches = []
-            for style in sheet.styles():
+            for style in cls._style_index(sheet).candidates(item):
                 specificity = style.match(item)
                 if specificity >= 0:
                     matches.append((specificity, len(matches), style))
@@ -514,6 +723,37 @@ class StyleCache(object):
         result = cache[setter] = translate(setter)
         return result
 
+    @classmethod
+    def toolkit_style(cls, style, translate):
+        """ Get the toolkit representation of a style.
+
+        This method will return the cached toolkit style, if available,
+        or invoke the translator to create the cached style. The cached
+        toolkit style will be cleared when the style, its pseudo state,
+        or any of its setters are invalidated.
+
+        Parameters
+        ----------
+        style : :class:`Style`
+            The style of interest.
+
+        translate : callable
+            A callable which accepts a single :class:`Style` argument
+            and returns a toolkit representation of the style. The
+            returned value is cached until the style is invalidated.
+
+        Returns
+        -------
+        result : object
+            The toolkit representation of the style.
+
+        """
+        cache = cls._toolkit_styles
+        if style in cache:
+            return cache[style]
+        result = cache[style] = translate(style)
+        return result
+
     #--------------------------------------------------------------------------
     # Protected Framework API
     #--------------------------------------------------------------------------
@@ -530,6 +770,7 @@ class StyleCache(object):
         # get a child_removed event which will trigger a restyle pass.
         # That logic does not need to be repeated here.
         cls._style_items.pop(style, None)
+        cls._toolkit_styles.pop(style, None)
 
     @classmethod
     def _style_sheet_destroyed(cls, sheet):
@@ -537,6 +778,7 @@ class StyleCache(object):
         # get a child_removed event which will trigger a restyle pass.
         # That logic does not need to be repeated here.
         cls._style_sheet_items.pop(sheet, None)
+        cls._style_sheet_indices.pop(sheet, None)
 
     @classmethod
     def _item_destroyed(cls, item):
@@ -557,22 +799,31 @@ class StyleCache(object):
     @classmethod
     def _setter_invalidated(cls, setter):
         cls._toolkit_setters.pop(setter, None)
+        cls._toolkit_styles.pop(setter.parent, None)
         items = cls._style_items.get(setter.parent)
         if items is not None:
             cls._request_restyle(items)
 
     @classmethod
     def _style_match_invalidated(cls, style):
-        cls._style_items.pop(style, None)
+        old_items = cls._style_items.pop(style, None)
+        cls._toolkit_styles.pop(style, None)
+        cls._style_sheet_indices.pop(style.parent, None)
         items = cls._style_sheet_items.get(style.parent)
         if items is not None:
+            # Only the items which matched the style, or which match it
+            # now, can have a different set of styles.
+            affected = set(old_items or ())
+            affected.update(i for i in items if style.match(i) >= 0)
             cache = cls._item_styles
-            for item in items:
+            for item in affected:
                 cache.pop(item, None)
-            cls._request_restyle(items)
+            if affected:
+                cls._request_restyle(affected)
 
     @classmethod
     def _style_pseudo_invalidated(cls, style):
+        cls._toolkit_styles.pop(style, None)
         items = cls._style_items.get(style)
         if items is not None:
             cls._request_restyle(items)
@@ -589,18 +840,55 @@ class StyleCache(object):
 
     @classmethod
     def _style_setters_changed(cls, style):
+        cls._toolkit_styles.pop(style, None)
         items = cls._style_items.get(style)
         if items is not None:
             cls._request_restyle(items)
 
     @classmethod
     def _style_sheet_styles_changed(cls, sheet):
+        toolkit_styles = cls._toolkit_styles
+        new_styles = sheet.styles()
+        for style in new_styles:
+            toolkit_styles.pop(style, None)
+        index = cls._style_sheet_indices.pop(sheet, None)
         items = cls._style_sheet_items.get(sheet, None)
         if items is not None:
+            if index is not None:
+                affected = cls._styles_changed_items(
+                    items, index.styles, new_styles
+                )
+            else:
+                affected = items
             styles = cls._item_styles
-            for item in items:
+            for item in affected:
                 styles.pop(item, None)
-            cls._request_restyle(items)
+            if affected:
+                cls._request_restyle(affected)
+
+    @classmethod
+    def _styles_changed_items(cls, items, old_styles, new_styles):
+        # Compute the items affected by a change of the styles of a
+        # sheet. If the retained styles kept their relative order, only
+        # the items which matched a removed style or which match an
+        # added style can have a different set of styles.
+        old_set = set(old_styles)
+        new_set = set(new_styles)
+        kept_old = [s for s in old_styles if s in new_set]
+        kept_new = [s for s in new_styles if s in old_set]
+        if kept_old != kept_new:
+            return items
+        affected = set()
+        style_items = cls._style_items
+        for style in old_styles:
+            if style not in new_set and style in style_items:
+                affected.update(style_items[style])
+        added = [s for s in new_styles if s not in old_set]
+        if added:
+            for item in items:
+                if any(style.match(item) >= 0 for style in added):
+                    affected.add(item)
+        return affected
 
     @classmethod
     def _item_parent_changed(cls, item):
@@ -642,6 +930,14 @@ class StyleCache(object):
     def __new__(cls, *args, **kwargs):
         raise TypeError('Cannot create instances of StyleCache')
 
+    @classmethod
+    def _style_index(cls, sheet):
+        indices = cls._style_sheet_indices
+        if sheet in indices:
+            return indices[sheet]
+        index = indices[sheet] = _StyleIndex(sheet)
+        return index
+
     @classmethod
     def _request_restyle(cls, items):
         task = cls._restyle_task
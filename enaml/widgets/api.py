@@ -32,7 +32,9 @@ from .h_group import HGroup
 from .html import Html
 from .image_view import ImageView
 from .ipython_console import IPythonConsole
+from .item_model import ItemModel, ListModel
 from .label import Label
+from .list_view import ListView
 from .main_window import MainWindow
 from .mdi_area import MdiArea
 from .mdi_window import MdiWindow
@@ -58,6 +60,7 @@ from .stack import Stack, Transition
 from .stack_item import StackItem
 from .status_bar import StatusBar
 from .status_item import StatusItem
+from .table_view import TableView
 from .time_selector import TimeSelector
 from .timer import Timer
 from .tool_bar import ToolBar
@@ -0,0 +1,175 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom, Callable, ContainerList, Event, List, observe
+
+from enaml.compat import str
+
+
+class ItemModel(Atom):
+    """ An adaptor providing the data displayed by an item view.
+
+    The data is requested by the toolkit only for the rows which are
+    visible, which means a model can provide a very large number of
+    rows without allocating anything per row. Subclasses must fire
+    the row events *after* they have modified their underlying data
+    in order for the views to be updated incrementally.
+
+    """
+    #: An event fired when rows have been inserted. The payload is a
+    #: tuple of the first and the last (inclusive) inserted rows.
+    rows_inserted = Event(tuple)
+
+    #: An event fired when rows have been removed. The payload is a
+    #: tuple of the first and the last (inclusive) removed rows.
+    rows_removed = Event(tuple)
+
+    #: An event fired when the data of rows have changed. The payload
+    #: is a tuple of the first and the last (inclusive) changed rows.
+    rows_changed = Event(tuple)
+
+    #: An event fired when the whole content of the model has changed.
+    model_reset = Event()
+
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        raise NotImplementedError
+
+    def column_count(self):
+        """ Get the number of columns in the model.
+
+        The default implementation returns 1.
+
+        """
+        return 1
+
+    def data(self, row, column):
+        """ Get the text to display for the given cell.
+
+        Parameters
+        ----------
+        row : int
+            The row of the cell. It is always in the model range.
+
+        column : int
+            The column of the cell. It is always in the model range.
+
+        Returns
+        -------
+        result : unicode or None
+            The text to display in the cell, or None.
+
+        """
+        raise NotImplementedError
+
+    def header_data(self, column):
+        """ Get the text to display in the header of a column.
+
+        The default implementation returns None, which lets the toolkit
+        display the column number.
+
+        """
+        return None
+
+
+class ListModel(ItemModel):
+    """ An item model which displays the items of a list.
+
+    The in-place operations on the list of items are translated into
+    the row events of the model.
+
+    """
+    #: The list of items displayed by the model.
+    items = ContainerList()
+
+    #: The names of the columns of the model. When empty, the model
+    #: has a single column.
+    columns = List()
+
+    #: The callable used to convert a cell into text. It is called
+    #: with the item and the column index. The default converts the
+    #: item using the builtin 'str'.
+    to_string = Callable(lambda item, column: str(item))
+
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        return len(self.items)
+
+    def column_count(self):
+        """ Get the number of columns in the model.
+
+        """
+        return len(self.columns) or 1
+
+    def data(self, row, column):
+        """ Get the text to display for the given cell.
+
+        """
+        return self.to_string(self.items[row], column)
+
+    def header_data(self, column):
+        """ Get the text to display in the header of a column.
+
+        """
+        columns = self.columns
+        if column < len(columns):
+            return columns[column]
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('columns', 'to_string')
+    def _reset_model(self, change):
+        """ Reset the model when the formatting of the cells changes.
+
+        """
+        if change['type'] == 'update':
+            self.model_reset()
+
+    @observe('items')
+    def _items_changed(self, change):
+        """ Translate the list operations into row events.
+
+        """
+        if change['type'] == 'create':
+            return
+        if change['type'] != 'container':
+            self.model_reset()
+            return
+        count = len(self.items)
+        op = change['operation']
+        index = change.get('index')
+        if op == 'append':
+            self.rows_inserted((count - 1, count - 1))
+        elif op in ('extend', '__iadd__'):
+            added = len(change['items'])
+            if added:
+                self.rows_inserted((count - added, count - 1))
+        elif op == 'insert':
+            # Mimic the clamping of list.insert on the old length.
+            if index < 0:
+                index = max(index + count - 1, 0)
+            index = min(index, count - 1)
+            self.rows_inserted((index, index))
+        elif op == 'pop':
+            if index < 0:
+                index += count + 1
+            self.rows_removed((index, index))
+        elif op == '__delitem__' and isinstance(index, int):
+            if index < 0:
+                index += count + 1
+            self.rows_removed((index, index))
+        elif op == '__setitem__' and isinstance(index, int):
+            if index < 0:
+                index += count
+            self.rows_changed((index, index))
+        else:
+            self.model_reset()
@@ -0,0 +1,65 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Event, Int, Typed, ForwardTyped, observe, set_default
+
+from enaml.core.declarative import d_
+
+from .control import Control, ProxyControl
+from .item_model import ItemModel
+
+
+class ProxyItemView(ProxyControl):
+    """ The abstract definition of a proxy ItemView object.
+
+    """
+    #: A reference to the ItemView declaration.
+    declaration = ForwardTyped(lambda: ItemView)
+
+    def set_model(self, model):
+        raise NotImplementedError
+
+    def set_current_row(self, row):
+        raise NotImplementedError
+
+
+class ItemView(Control):
+    """ A base class for the controls displaying the rows of an item
+    model.
+
+    Only the visible rows are rendered by the toolkit, and no widget is
+    created per row. This class should not be used directly, but the
+    ListView and TableView subclasses instead.
+
+    """
+    #: The model providing the data displayed by the view.
+    model = d_(Typed(ItemModel))
+
+    #: The index of the current row, or -1 if there is no current row.
+    current_row = d_(Int(-1))
+
+    #: An event fired when the user activates a row, by double clicking
+    #: or by pressing enter. The payload will be the index of the row.
+    row_activated = d_(Event(int), writable=False)
+
+    #: An item view expands freely in height and width by default.
+    hug_width = set_default('ignore')
+    hug_height = set_default('ignore')
+
+    #: A reference to the ProxyItemView object.
+    proxy = Typed(ProxyItemView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('model', 'current_row')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(ItemView, self)._update_proxy(change)
@@ -0,0 +1,52 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom
+
+from .toolkit_object import ToolkitObject
+
+
+class LazyContentsMixin(Atom):
+    """ A mixin for the widgets whose contents may be activated lazily.
+
+    When the 'lazy' attribute of the parent of the widget is True, only
+    the widget itself is activated. The activation of its children is
+    deferred until 'activate_contents' is called, typically when the
+    widget is first shown by its parent.
+
+    This mixin must precede the ToolkitObject subclass in the bases of
+    the widget.
+
+    """
+    def activate_proxy(self):
+        """ A reimplemented proxy activation method.
+
+        When the parent is lazy, only the widget itself is activated.
+
+        """
+        if not getattr(self.parent, 'lazy', False):
+            super(LazyContentsMixin, self).activate_proxy()
+            return
+        self.activate_top_down()
+        self.activate_bottom_up()
+        self.proxy_is_active = True
+        self.activated()
+
+    def activate_contents(self):
+        """ Activate the children whose activation was deferred.
+
+        This method is a no-op if the widget is not active or if its
+        children are already active.
+
+        """
+        if not self.proxy_is_active:
+            return
+        for child in self.children:
+            if isinstance(child, ToolkitObject):
+                if not child.proxy_is_active:
+                    child.activate_proxy()
+                    self.proxy.child_added(child.proxy)
@@ -0,0 +1,30 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed, ForwardTyped
+
+from .item_view import ItemView, ProxyItemView
+
+
+class ProxyListView(ProxyItemView):
+    """ The abstract definition of a proxy ListView object.
+
+    """
+    #: A reference to the ListView declaration.
+    declaration = ForwardTyped(lambda: ListView)
+
+
+class ListView(ItemView):
+    """ A control which displays the first column of an item model as
+    a list.
+
+    All the rows are assumed to have the same height, which allows
+    the view to scale to very large models.
+
+    """
+    #: A reference to the ProxyListView object.
+    proxy = Typed(ProxyListView)
@@ -69,6 +69,13 @@ class Notebook(ConstraintsWidget):
     #: notebook will be the size hint of the current tab.
     size_hint_mode = d_(Enum('union', 'current'))
 
+    #: Whether or not the activation of the contents of the pages is
+    #: deferred until a page is first shown. When True, the widgets,
+    #: layout and style of a page subtree are only created when the
+    #: page becomes the current tab. The declarative tree is left
+    #: intact. This value has no effect once the notebook is active.
+    lazy = d_(Bool(False))
+
     #: A notebook expands freely in height and width by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
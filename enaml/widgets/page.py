@@ -11,6 +11,7 @@ from enaml.core.declarative import d_
 from enaml.icon import Icon
 
 from .container import Container
+from .lazy_contents import LazyContentsMixin
 from .widget import Widget, ProxyWidget
 
 
@@ -31,7 +32,7 @@ class ProxyPage(ProxyWidget):
         raise NotImplementedError
 
 
-class Page(Widget):
+class Page(LazyContentsMixin, Widget):
     """ A widget which can be used as a page in a Notebook control.
 
     A Page is a widget which can be used as a child of a Notebook
@@ -6,7 +6,7 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
 from atom.api import (
-    Atom, Enum, Int, Range, Typed, ForwardTyped, observe, set_default
+    Atom, Bool, Enum, Int, Range, Typed, ForwardTyped, observe, set_default
 )
 
 from enaml.core.declarative import d_
@@ -71,6 +71,13 @@ class Stack(ConstraintsWidget):
     #: stack will be the size hint of the current stack item.
     size_hint_mode = d_(Enum('union', 'current'))
 
+    #: Whether or not the activation of the contents of the stack items
+    #: is deferred until an item is first shown. When True, the widgets,
+    #: layout and style of an item subtree are only created when the
+    #: item becomes the current item. The declarative tree is left
+    #: intact. This value has no effect once the stack is active.
+    lazy = d_(Bool(False))
+
     #: A Stack expands freely in height and width by default
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
@@ -8,6 +8,7 @@
 from atom.api import Typed, ForwardTyped
 
 from .container import Container
+from .lazy_contents import LazyContentsMixin
 from .widget import Widget, ProxyWidget
 
 
@@ -19,7 +20,7 @@ class ProxyStackItem(ProxyWidget):
     declaration = ForwardTyped(lambda: StackItem)
 
 
-class StackItem(Widget):
+class StackItem(LazyContentsMixin, Widget):
     """ A widget which can be used as an item in a Stack.
 
     A StackItem is a widget which can be used as a child of a Stack
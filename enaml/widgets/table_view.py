@@ -0,0 +1,54 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, Typed, ForwardTyped, observe
+
+from enaml.core.declarative import d_
+
+from .item_view import ItemView, ProxyItemView
+
+
+class ProxyTableView(ProxyItemView):
+    """ The abstract definition of a proxy TableView object.
+
+    """
+    #: A reference to the TableView declaration.
+    declaration = ForwardTyped(lambda: TableView)
+
+    def set_header_visible(self, visible):
+        raise NotImplementedError
+
+    def set_row_header_visible(self, visible):
+        raise NotImplementedError
+
+
+class TableView(ItemView):
+    """ A control which displays the cells of an item model as a table.
+
+    All the rows have the same height, which allows the view to scale
+    to very large models.
+
+    """
+    #: Whether or not the column header is visible.
+    header_visible = d_(Bool(True))
+
+    #: Whether or not the row header is visible.
+    row_header_visible = d_(Bool(False))
+
+    #: A reference to the ProxyTableView object.
+    proxy = Typed(ProxyTableView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('header_visible', 'row_header_visible')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(TableView, self)._update_proxy(change)
@@ -70,6 +70,9 @@ class ProxyWidget(ProxyToolkitObject):
     def has_focus(self):
         raise NotImplementedError
 
+    def is_visible(self):
+        raise NotImplementedError
+
     def focus_next_child(self):
         raise NotImplementedError
 
@@ -165,6 +168,17 @@ class Widget(ToolkitObject, Stylable):
         if self.proxy_is_active:
             self.proxy.restyle()
 
+    def resume_reattached(self):
+        """ Resume a widget which is inserted back into a parent.
+
+        The toolkits hide a widget when it is unparented, so a visible
+        widget is shown again once its bindings are resumed.
+
+        """
+        super(Widget, self).resume_reattached()
+        if self.visible:
+            self.show()
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
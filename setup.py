@@ -165,7 +165,7 @@ setup(
     requires=['atom', 'PyQt', 'ply', 'kiwisolver', 'qtpy'],
     install_requires=['setuptools', 'atom>=0.4.2.dev', 'qtpy>=1.3',
                       'kiwisolver>=1.0.0', 'ply>=3.4'],
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     package_data={
         'enaml.applib': ['*.enaml'],
         'enaml.stdlib': ['*.enaml'],
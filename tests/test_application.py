@@ -0,0 +1,148 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from contextlib import contextmanager
+
+import pytest
+from atom.api import Int, List
+
+from enaml.application import Application, ProxyResolver
+from enaml.widgets.field import Field, ProxyField
+from enaml.widgets.label import Label, ProxyLabel
+
+
+class ManualApplication(Application):
+    """ An application whose event loop is run manually.
+
+    """
+    #: The calls posted to the event loop.
+    posted = List()
+
+    #: The number of the next posts which fail.
+    fail_posts = Int()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        if self.fail_posts:
+            self.fail_posts -= 1
+            raise RuntimeError('the event loop is not running')
+        self.posted.append((callback, args, kwargs))
+
+    def is_main_thread(self):
+        return True
+
+    def process_events(self):
+        """ Run the calls posted so far and return their number.
+
+        """
+        posted = self.posted
+        self.posted = []
+        for callback, args, kwargs in posted:
+            callback(*args, **kwargs)
+        return len(posted)
+
+
+@contextmanager
+def standalone_application(**kwargs):
+    """ Create an application without disturbing the global instance.
+
+    """
+    saved = Application._instance
+    Application._instance = None
+    try:
+        yield ManualApplication(**kwargs)
+    finally:
+        Application._instance = saved
+
+
+def test_proxy_class_cache():
+    """ Test that the proxy classes are resolved once per declaration.
+
+    """
+    calls = []
+
+    def field_factory():
+        calls.append('Field')
+        return ProxyField
+
+    resolver = ProxyResolver(factories={'Field': field_factory})
+    with standalone_application(resolver=resolver) as app:
+        app.preload_proxy_classes([Field])
+        assert app.resolve_proxy_class(Field) is ProxyField
+        assert app.resolve_proxy_class(Field) is ProxyField
+        assert calls == ['Field']
+
+        # Replacing the factories clears the cache.
+        resolver.factories = {'Field': field_factory,
+                              'Label': lambda: ProxyLabel}
+        assert app.resolve_proxy_class(Field) is ProxyField
+        assert app.resolve_proxy_class(Label) is ProxyLabel
+        assert calls == ['Field', 'Field']
+
+
+def test_schedule_batches():
+    """ Test that the scheduled tasks are run in batches by priority.
+
+    """
+    with standalone_application() as app:
+        results = []
+        for i in range(5):
+            app.schedule(results.append, (i,), priority=i % 2)
+        assert app.schedule_stats.depth == 5
+        assert len(app.posted) == 1
+        assert app.process_events() == 1
+        assert results == [1, 3, 0, 2, 4]
+        assert not app.posted
+        stats = app.schedule_stats
+        assert (stats.wakeups, stats.tasks, stats.depth) == (1, 5, 0)
+        assert stats.max_depth == 5
+
+        # A spent budget leaves the remaining tasks to the next wakeup.
+        app.schedule_budget = 1e-9
+        for i in range(3):
+            app.schedule(results.append, (i,))
+        while app.process_events():
+            pass
+        assert results[5:] == [0, 1, 2]
+        assert stats.wakeups == 4
+
+
+def test_schedule_rescheduling_task():
+    """ Test that a task which schedules itself again is run once per
+    wakeup, and gives control back to the event loop.
+
+    """
+    with standalone_application() as app:
+        runs = []
+
+        def poll():
+            runs.append(len(runs))
+            if len(runs) < 3:
+                app.schedule(poll)
+
+        app.schedule(poll)
+        assert app.process_events() == 1
+        assert runs == [0]
+        assert app.process_events() == 1
+        assert runs == [0, 1]
+        assert app.process_events() == 1
+        assert runs == [0, 1, 2]
+        assert app.process_events() == 0
+        assert app.schedule_stats.wakeups == 3
+
+
+def test_schedule_failed_post():
+    """ Test that a drain which could not be posted is posted again by
+    the next call to schedule.
+
+    """
+    with standalone_application(fail_posts=1) as app:
+        runs = []
+        with pytest.raises(RuntimeError):
+            app.schedule(runs.append, (0,))
+        app.schedule(runs.append, (1,))
+        assert app.process_events() == 1
+        assert runs == [0, 1]
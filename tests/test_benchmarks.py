@@ -0,0 +1,37 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.__main__ import iter_benchmarks, run_benchmark
+
+
+BENCHMARKS = [
+    (name, cls, method)
+    for name, cls in iter_benchmarks()
+    for method in sorted(a for a in dir(cls) if a.startswith('time_'))
+]
+
+
+@pytest.mark.parametrize('name, cls, method', BENCHMARKS,
+                         ids=['%s.%s' % (b[0], b[2]) for b in BENCHMARKS])
+def test_benchmark_runs(name, cls, method):
+    """ Test that the benchmarks run with their smallest parameters.
+
+    """
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], list):
+        params = [params]
+    values = tuple(min(p) for p in params)
+    assert run_benchmark(cls, method, values, 1) >= 0
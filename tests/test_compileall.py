@@ -11,7 +11,7 @@ import sys
 import shutil
 import pytest
 import importlib
-from enaml.compile_all import compileall
+from enaml.compile_all import compileall, pop_workers
 from enaml.compat import IS_PY3
 from utils import cd, enaml_run
 
@@ -78,3 +78,14 @@ def test_tutorials(enaml_run, tmpdir, tutorial):
         # Now run from cache
         mod = importlib.import_module(tutorial)
         mod.main()
+
+
+@pytest.mark.parametrize("argv, workers, rest", [
+    (['compile_all', '-j', '4', 'src'], 4, ['compile_all', 'src']),
+    (['compile_all', '-j0', '-q', 'src'], 0, ['compile_all', '-q', 'src']),
+    (['compile_all', '--workers=2', 'src'], 2, ['compile_all', 'src']),
+    (['compile_all', 'src'], None, ['compile_all', 'src']),
+])
+def test_pop_workers(argv, workers, rest):
+    assert pop_workers(argv) == workers
+    assert argv == rest
@@ -0,0 +1,77 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import threading
+from textwrap import dedent
+
+from enaml.core.compiler_nodes import new_scope, peek_scope
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.declarative import Declarative
+
+enamldef Child(Declarative):
+    attr index : int = 0
+
+enamldef Main(Declarative): main:
+    attr count : int = 0
+    Child: first:
+        index = main.count
+    Child: second:
+        index = first.index + 1
+
+""")
+
+
+def test_scope_stack_is_thread_local():
+    """ Test that a scope pushed in a thread is not visible in another.
+
+    """
+    seen = []
+
+    def worker():
+        with new_scope('worker'):
+            seen.append(peek_scope())
+
+    with new_scope('main') as scope:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert peek_scope() is scope
+    assert seen and seen[0] is not scope
+
+
+def test_build_in_threads():
+    """ Test that declarative trees can be built from several threads.
+
+    """
+    Main = compile_source(SOURCE, 'Main')
+    results = []
+    errors = []
+
+    def build(count):
+        try:
+            for i in range(50):
+                main = Main(count=count)
+                results.append(
+                    (count, [c.index for c in main.children])
+                )
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=build, args=(i * 10,))
+               for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(results) == 200
+    for count, indices in results:
+        assert indices == [count, count + 1]
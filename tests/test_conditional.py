@@ -0,0 +1,70 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.conditional import Conditional
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from atom.api import Int
+from enaml.core.api import Conditional, Looper
+from enaml.core.declarative import Declarative
+
+class Model(Declarative):
+    value = Int()
+
+enamldef Child(Declarative):
+    attr value
+
+enamldef Main(Declarative): main:
+    attr model = Model()
+    attr show : bool = True
+    attr keep : bool = True
+    Conditional:
+        keep_alive << main.keep
+        condition << main.show
+        Child:
+            value << main.model.value
+        Looper:
+            iterable = [1, 2]
+            Child:
+                value = loop_item
+
+""")
+
+
+def test_conditional_keep_alive():
+    """ Test that the kept alive items are detached and reused.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    main.initialize()
+    items = main.children[:-1]
+    assert [c.value for c in items[:3]] == [0, 1, 2]
+    assert isinstance(main.children[-1], Conditional)
+
+    main.show = False
+    assert len(main.children) == 1
+    assert not any(item.is_destroyed for item in items)
+
+    # The bindings are suspended while the items are detached.
+    main.model.value = 5
+    assert items[0].value == 0
+
+    main.show = True
+    assert main.children[:-1] == items
+    assert items[0].value == 5
+
+    # The detached items are destroyed once they are not kept alive.
+    main.show = False
+    main.keep = False
+    assert all(item.is_destroyed for item in items)
+    main.show = True
+    assert main.children[0] is not items[0]
+    assert main.children[0].value == 5
@@ -188,3 +188,29 @@ def test_dock_area_interactions(enaml_qtbot, enaml_sleep):
         enaml_qtbot.wait(enaml_sleep)
     
     enaml_qtbot.wait(enaml_sleep)
+
+
+def test_layout_hit_index(enaml_qtbot, enaml_sleep):
+    """Test that the hit test index agrees with the linear hit test.
+
+    """
+    from enaml.qt.QtCore import QPoint
+    from enaml.qt.docking.layout_handling import (
+        LayoutHitIndex, layout_hit_test
+    )
+    win = compile_source(DOCK_AREA_TEMPLATE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    enaml_qtbot.wait(enaml_sleep)
+    q_area = win.area.proxy.widget
+    index = LayoutHitIndex(q_area)
+    assert index.isValid()
+    size = q_area.size()
+    for x in range(0, size.width(), 7):
+        for y in range(0, size.height(), 7):
+            pos = QPoint(x, y)
+            assert index.hitTest(pos) is layout_hit_test(q_area, pos)
+
+    win.area.layout = HSplitLayout('item1', 'item2')
+    enaml_qtbot.wait(enaml_sleep)
+    assert not index.isValid()
@@ -0,0 +1,185 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import gc
+
+import pytest
+from atom.api import Atom, Int, Value
+
+from enaml.core.dynamicscope import DynamicScope
+from enaml.core.object import Object
+
+
+class Root(Object):
+
+    value = Int()
+
+
+class Mid(Object):
+    pass
+
+
+class OtherMid(Object):
+    pass
+
+
+class Leaf(Object):
+    pass
+
+
+class Tracer(object):
+    """ A tracer recording the dynamic loads.
+
+    """
+    def __init__(self):
+        self.loads = []
+
+    def dynamic_load(self, owner, name, value):
+        self.loads.append((owner, name, value))
+
+
+def lookup(owner, name, tracer=None):
+    """ Look up a name from the dynamic scope of an object.
+
+    """
+    scope = DynamicScope(owner, {}, {}, {}, None, tracer)
+    return scope[name]
+
+
+def make_chain(value=1):
+    root = Root(value=value)
+    mid = Mid(root)
+    leaf = Leaf(mid)
+    return root, mid, leaf
+
+
+def test_resolution_cache_tracing():
+    """ Test that the tracer sees the ancestor which provides the name
+    on every lookup.
+
+    """
+    root, mid, leaf = make_chain()
+    tracer = Tracer()
+    for i in range(3):
+        assert lookup(leaf, 'value', tracer) == 1
+    assert tracer.loads == [(root, 'value', 1)] * 3
+    for i in range(2):
+        with pytest.raises(KeyError):
+            lookup(leaf, 'missing')
+
+
+def test_class_mutation_invalidates_resolution():
+    """ Test that an attribute added to an ancestor class after a
+    lookup is seen by the later lookups.
+
+    """
+    root, mid, leaf = make_chain()
+    assert lookup(leaf, 'value') == 1
+    assert lookup(leaf, 'value') == 1
+    with pytest.raises(KeyError):
+        lookup(leaf, 'extra')
+    with pytest.raises(KeyError):
+        lookup(leaf, 'extra')
+    try:
+        Mid.value = 2
+        Mid.extra = 3
+        assert lookup(leaf, 'value') == 2
+        assert lookup(leaf, 'extra') == 3
+    finally:
+        del Mid.value
+        del Mid.extra
+    assert lookup(leaf, 'value') == 1
+    with pytest.raises(KeyError):
+        lookup(leaf, 'extra')
+
+    # A class shared by the mro of the ancestors.
+    try:
+        Object.extra = 4
+        assert lookup(leaf, 'extra') == 4
+    finally:
+        del Object.extra
+    with pytest.raises(KeyError):
+        lookup(leaf, 'extra')
+
+
+def test_reparenting_invalidates_resolution():
+    """ Test that a lookup made after reparenting an object sees the
+    values of its new ancestors.
+
+    """
+    root, mid, leaf = make_chain()
+    assert lookup(leaf, 'value') == 1
+    assert lookup(leaf, 'value') == 1
+
+    # Same ancestor types, different objects.
+    other_root, other_mid, _ = make_chain(value=5)
+    leaf.set_parent(other_mid)
+    assert lookup(leaf, 'value') == 5
+
+    # Different ancestor types.
+    try:
+        OtherMid.value = 7
+        leaf.set_parent(OtherMid(root))
+        assert lookup(leaf, 'value') == 7
+    finally:
+        del OtherMid.value
+
+    # A shorter chain.
+    leaf.set_parent(root)
+    root.value = 9
+    assert lookup(leaf, 'value') == 9
+
+    # An object inserted in the chain.
+    Root(root, value=13).insert_children(None, [leaf])
+    assert lookup(leaf, 'value') == 13
+
+    # A destroyed ancestor.
+    with pytest.raises(KeyError):
+        lookup(leaf, 'missing')
+    leaf.parent.destroy()
+    assert leaf.parent is None
+    with pytest.raises(KeyError):
+        lookup(leaf, 'value')
+
+
+def test_freed_object_resolution():
+    """ Test that the lookups made from a new object do not use the
+    resolution recorded for a freed object.
+
+    """
+    for i in range(10):
+        root, mid, leaf = make_chain(value=i)
+        assert lookup(leaf, 'value') == i
+        del root, mid, leaf
+        gc.collect()
+        leaf = Leaf()
+        with pytest.raises(KeyError):
+            lookup(leaf, 'value')
+
+
+class Node(Atom):
+    """ A node which is not an Object, whose lookups are not recorded.
+
+    """
+    _parent = Value()
+
+
+class ValueNode(Node):
+
+    value = Int()
+
+
+def test_non_object_resolution():
+    """ Test that the lookups from objects which are not Objects see
+    their current ancestors.
+
+    """
+    leaf = Node(_parent=Node(_parent=ValueNode(value=1)))
+    assert lookup(leaf, 'value') == 1
+    assert lookup(leaf, 'value') == 1
+    leaf._parent = ValueNode(value=2)
+    assert lookup(leaf, 'value') == 2
@@ -0,0 +1,111 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+
+import enaml
+from enaml.core.import_hooks import (
+    CACHEDIR, EnamlImporter, clear_directory_cache, list_directory,
+    make_file_info
+)
+
+
+STARTUP_SCRIPT = """\
+import sys
+import enaml
+sys.path.insert(0, %r)
+with enaml.imports():
+    import startup_view
+loaded = ['enaml.core.parser', 'enaml.core.enaml_compiler']
+print(' '.join(name for name in loaded if name in sys.modules))
+"""
+
+
+SOURCE = """\
+from enaml.core.declarative import Declarative
+
+enamldef Main(Declarative):
+    pass
+"""
+
+
+def test_list_directory(tmpdir):
+    """ Test that the directory listing follows the directory changes.
+
+    """
+    path = tmpdir.strpath
+    assert list_directory(path) == frozenset()
+    tmpdir.join('a.enaml').write('')
+    # Ensure the mtime changes on file systems with a coarse resolution.
+    mtime = os.stat(path).st_mtime + 10
+    os.utime(path, (mtime, mtime))
+    assert list_directory(path) == frozenset(['a.enaml'])
+    assert list_directory(tmpdir.join('missing').strpath) == frozenset()
+
+
+def test_locate_module(tmpdir):
+    """ Test locating modules from the source and from the cache.
+
+    """
+    clear_directory_cache()
+    path = tmpdir.strpath
+    tmpdir.join('located_view.enaml').write(SOURCE)
+    assert EnamlImporter.locate_module('located_view', [path]) is not None
+    assert EnamlImporter.locate_module('missing_view', [path]) is None
+
+    sys.path.append(path)
+    try:
+        with enaml.imports():
+            import located_view
+        assert located_view.Main
+    finally:
+        sys.path.remove(path)
+        sys.modules.pop('located_view', None)
+
+    # The module can be located from the cache only.
+    assert os.listdir(tmpdir.join(CACHEDIR).strpath)
+    tmpdir.join('located_view.enaml').remove()
+    EnamlImporter.invalidate_caches()
+    assert EnamlImporter.locate_module('located_view', [path]) is not None
+
+
+def test_write_cache_is_atomic(tmpdir):
+    """ Test that the cache is written without leaving temporary files.
+
+    """
+    path = tmpdir.join('cached_view.enaml')
+    path.write(SOURCE)
+    importer = EnamlImporter(make_file_info(path.strpath))
+    importer.get_code()
+    importer.compile_code()
+    names = os.listdir(tmpdir.join(CACHEDIR).strpath)
+    assert len(names) == 1
+    assert names[0].endswith('.enamlc')
+
+
+def test_cached_startup_does_not_load_parser(tmpdir):
+    """ Test that importing from a fresh cache never builds the parser.
+
+    """
+    tmpdir.join('startup_view.enaml').write(SOURCE)
+    root = os.path.dirname(os.path.dirname(enaml.__file__))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in [env.get('PYTHONPATH')] if p]
+    )
+    script = STARTUP_SCRIPT % tmpdir.strpath
+
+    def run():
+        output = subprocess.check_output([sys.executable, '-c', script],
+                                         env=env)
+        return output.decode('ascii').split()
+
+    # The first run compiles the module and fills the cache.
+    assert run() == ['enaml.core.parser', 'enaml.core.enaml_compiler']
+    assert run() == []
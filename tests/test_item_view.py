@@ -0,0 +1,101 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+
+from enaml.widgets.item_model import ItemModel, ListModel
+from utils import compile_source, is_qt_available
+
+
+def test_list_model_row_events():
+    """ Test that the list operations are translated into row events.
+
+    """
+    model = ListModel(items=[0, 1, 2])
+    events = []
+
+    def record(change):
+        events.append((change['name'], change['value']))
+
+    for name in ('rows_inserted', 'rows_removed', 'rows_changed',
+                 'model_reset'):
+        model.observe(name, record)
+
+    model.items.append(3)
+    model.items.insert(-1, 4)
+    model.items.extend([5, 6])
+    model.items.pop(0)
+    del model.items[-1]
+    model.items[1] = 7
+    model.items = [1]
+    assert events == [
+        ('rows_inserted', (3, 3)),
+        ('rows_inserted', (3, 3)),
+        ('rows_inserted', (5, 6)),
+        ('rows_removed', (0, 0)),
+        ('rows_removed', (5, 5)),
+        ('rows_changed', (1, 1)),
+        ('model_reset', None),
+    ]
+    assert model.data(0, 0) == u'1'
+
+
+class RangeModel(ItemModel):
+    """ A model computing its rows on demand.
+
+    """
+    def row_count(self):
+        return 1000000
+
+    def column_count(self):
+        return 2
+
+    def data(self, row, column):
+        return u'%d' % (row * (column + 1))
+
+
+SOURCE = """\
+from enaml.widgets.api import Window, Container, ListView, TableView
+
+enamldef Main(Window):
+    attr model
+    alias table
+    Container:
+        ListView:
+            model << parent.parent.model
+        TableView: table:
+            model << parent.parent.model
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_item_view_adaptor(enaml_qtbot):
+    """ Test that the views expose very large models and follow the
+    incremental updates of the models.
+
+    """
+    win = compile_source(SOURCE, 'Main')(model=RangeModel())
+    win.show()
+    adaptor = win.table.proxy.adaptor
+    assert adaptor.rowCount() == 1000000
+    assert adaptor.data(adaptor.index(10, 1)) == u'20'
+
+    win.model = model = ListModel(items=[u'a', u'b'])
+    assert adaptor.rowCount() == 2
+
+    # The row count only changes between the begin and end signals.
+    counts = []
+    for signal in (adaptor.rowsAboutToBeInserted, adaptor.rowsInserted,
+                   adaptor.rowsAboutToBeRemoved, adaptor.rowsRemoved):
+        signal.connect(lambda *args: counts.append(adaptor.rowCount()))
+    model.items.append(u'c')
+    assert adaptor.rowCount() == 3
+    model.items.pop(0)
+    model.items.insert(0, u'a')
+    assert counts == [2, 3, 3, 2, 2, 3]
+    win.table.current_row = 2
+    assert win.table.proxy.widget.currentIndex().row() == 2
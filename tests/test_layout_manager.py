@@ -0,0 +1,233 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import List, Tuple, Typed
+
+from enaml.layout.api import vbox
+from enaml.layout.constrainable import (
+    ConstrainableMixin, ContentsConstrainableMixin
+)
+from enaml.layout.layout_manager import LayoutItem, LayoutManager
+
+
+class Box(ContentsConstrainableMixin):
+    """ A simple constrainable used by the test layout items.
+
+    """
+    pass
+
+
+class Item(LayoutItem):
+    """ A layout item which does not rely on a toolkit.
+
+    """
+    box = Typed(ConstrainableMixin)
+
+    hint = Tuple(default=(20, 10))
+
+    user_constraints = List()
+
+    geometry = Tuple()
+
+    def constrainable(self):
+        return self.box
+
+    def constraints(self):
+        return self.user_constraints
+
+    def margins(self):
+        return ()
+
+    def size_hint(self):
+        return self.hint
+
+    def min_size(self):
+        return (-1, -1)
+
+    def max_size(self):
+        return (-1, -1)
+
+    def set_geometry(self, x, y, width, height):
+        self.geometry = (x, y, width, height)
+
+
+class RootItem(Item):
+    """ A root layout item with margins.
+
+    """
+    def margins(self):
+        return (0, 0, 0, 0)
+
+
+def make_manager(count):
+    """ Create a layout manager with a vertical box of items.
+
+    """
+    root = RootItem(box=Box())
+    items = [Item(box=ConstrainableMixin()) for i in range(count)]
+    root.user_constraints = [vbox(*[i.box for i in items], spacing=0)]
+    return LayoutManager(root), root, items
+
+
+def test_layout_manager_resize():
+    """ Test that the items are laid out in a vertical box.
+
+    """
+    manager, root, items = make_manager(3)
+    manager.set_items(items)
+    manager.resize(100, 30)
+    assert [i.geometry[1] for i in items] == [0, 10, 20]
+    assert manager.min_size() == (20, 30)
+
+
+def test_layout_manager_incremental_update():
+    """ Test that unchanged constraints are kept in the solver.
+
+    """
+    manager, root, items = make_manager(3)
+    manager.set_items(items)
+    old_cache = [i._geometry_cache for i in items]
+
+    # Re-setting identical items keeps the existing constraints.
+    manager.set_items(items)
+    for item, cache in zip(items, old_cache):
+        assert all(a is b for a, b in zip(item._geometry_cache, cache))
+
+    # Removing an item only affects the remaining layout.
+    root.user_constraints = [vbox(items[0].box, items[2].box, spacing=0)]
+    manager.set_items([items[0], items[2]])
+    manager.resize(100, 20)
+    assert [items[0].geometry[1], items[2].geometry[1]] == [0, 10]
+    assert all(a is b for a, b in zip(items[0]._geometry_cache,
+                                      old_cache[0]))
+
+    # Adding it back restores the original layout.
+    root.user_constraints = [vbox(*[i.box for i in items], spacing=0)]
+    manager.set_items(items)
+    manager.resize(100, 30)
+    assert [i.geometry[1] for i in items] == [0, 10, 20]
+
+
+def test_layout_manager_geometry_update():
+    """ Test that geometry updates are tracked by the manager.
+
+    """
+    manager, root, items = make_manager(2)
+    manager.set_items(items)
+    items[0].hint = (20, 15)
+    manager.update_geometry(0)
+    manager.set_items(items)
+    manager.resize(100, 25)
+    assert [i.geometry[1] for i in items] == [0, 15]
+
+
+def test_layout_manager_size_bounds_cache():
+    """ Test that the size bounds are only solved when constraints change.
+
+    """
+    manager, root, items = make_manager(2)
+    manager.set_items(items)
+    manager.reset_counters()
+    bounds = manager.size_bounds()
+    assert manager.solve_count == 3
+    assert manager.best_size() == bounds[0]
+    assert manager.min_size() == bounds[1]
+    assert manager.max_size() == bounds[2]
+    assert manager.solve_count == 3
+    assert manager.bounds_cache_hits == 3
+
+    # An update which does not change the constraints keeps the cache.
+    manager.update_geometry(0)
+    manager.size_bounds()
+    assert manager.solve_count == 3
+
+    items[0].hint = (20, 15)
+    manager.update_geometry(0)
+    assert manager.size_bounds()[1] == (20, 25)
+    assert manager.solve_count == 6
+
+
+def test_layout_manager_skip_unchanged_items():
+    """ Test that only the items whose geometry changed are updated.
+
+    """
+    manager, root, items = make_manager(3)
+    manager.set_items(items)
+    manager.resize(100, 30)
+    geometries = [i.geometry for i in items]
+    manager.reset_counters()
+
+    # Resizing to the same size does not solve the system again.
+    manager.resize(100, 30)
+    assert manager.solve_count == 0
+
+    # Unchanged items do not get their geometry set again.
+    for item in items:
+        item.geometry = ()
+    del manager._resize_size
+    manager.resize(100, 30)
+    assert manager.solve_count == 1
+    assert [i.geometry for i in items] == [(), (), ()]
+
+    manager.reset_counters()
+    items[2].hint = (20, 15)
+    manager.update_geometry(2)
+    manager.resize(100, 35)
+    assert manager.solve_count == 1
+    assert items[2].geometry[3] == 15
+    assert items[2].geometry != geometries[2]
+
+
+def test_layout_manager_relayout_resolve():
+    """ Test that a changed layout is re-solved after a resize.
+
+    """
+    manager, root, items = make_manager(3)
+    manager.set_items(items)
+    manager.resize(100, 30)
+
+    # The changed constraints are diffed against the solver.
+    root.user_constraints = [vbox(*[i.box for i in items], spacing=5)]
+    manager.set_items(items)
+    manager.resize(100, 40)
+    assert [i.geometry[1] for i in items] == [0, 15, 30]
+    assert manager.min_size() == (20, 40)
+
+    manager.resize(100, 60)
+    assert [i.geometry[1] for i in items] == [0, 15, 30]
+
+
+def test_layout_manager_reuses_helper_constraints():
+    """ Test that the constraints of a regenerated helper are reused.
+
+    """
+    manager, root, items = make_manager(3)
+    manager.set_items(items)
+    old = list(manager._item_constraints[root.box][3])
+
+    # The helper and its variables are created anew.
+    root.user_constraints = [vbox(*[i.box for i in items], spacing=0)]
+    manager.set_items(items)
+    new = manager._item_constraints[root.box][3]
+    assert len(new) == len(old)
+    assert all(a is b for a, b in zip(new, old))
+    manager.resize(100, 30)
+    assert [i.geometry[1] for i in items] == [0, 10, 20]
+
+
+def test_layout_manager_update_after_reset():
+    """ Test that the updates of untracked items are ignored.
+
+    """
+    manager, root, items = make_manager(2)
+    manager.set_items(items)
+    manager._reset()
+    manager.update_geometry(0)
+    manager.update_margins(-1)
+    manager.set_items(items)
+    manager.resize(100, 20)
+    assert [i.geometry[1] for i in items] == [0, 10]
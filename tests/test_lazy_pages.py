@@ -0,0 +1,69 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """\
+from enaml.widgets.api import (
+    Window, Container, Notebook, Page, Stack, StackItem, Label
+)
+
+enamldef Main(Window):
+    alias notebook
+    alias stack
+    Container:
+        Notebook: notebook:
+            lazy = True
+            Page: first:
+                name = 'first'
+                Container:
+                    Label:
+                        text = 'First'
+            Page: second:
+                name = 'second'
+                Container:
+                    Label:
+                        text = 'Second'
+        Stack: stack:
+            lazy = True
+            StackItem:
+                Container:
+                    Label:
+                        text = 'First'
+            StackItem:
+                Container:
+                    Label:
+                        text = 'Second'
+"""
+
+
+def test_lazy_notebook_and_stack(enaml_qtbot):
+    """ Test that the contents of pages are activated when first shown.
+
+    """
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    first, second = win.notebook.pages()
+    assert first.proxy_is_active and second.proxy_is_active
+    assert first.page_widget().proxy_is_active
+    assert not second.page_widget().proxy_is_active
+    assert second.page_widget().children[0].text == 'Second'
+
+    win.notebook.selected_tab = 'second'
+    assert second.page_widget().proxy_is_active
+    assert second.proxy.widget.pageWidget() is not None
+
+    first, second = win.stack.stack_items()
+    assert first.stack_widget().proxy_is_active
+    assert not second.stack_widget().proxy_is_active
+    win.stack.index = 1
+    assert second.stack_widget().proxy_is_active
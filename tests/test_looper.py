@@ -0,0 +1,79 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.looper import Looper, _increasing_subsequence
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Looper
+from enaml.core.declarative import Declarative
+
+enamldef Row(Declarative):
+    attr value
+    attr index_text
+    attr first_index
+
+enamldef Main(Declarative):
+    attr iterable = []
+    Looper:
+        iterable << parent.iterable
+        Row:
+            value = loop_item
+            index_text << str(loop_index)
+            first_index = loop_index
+            func index():
+                return loop_index
+
+""")
+
+
+def rows(main):
+    """ Get the rows created by the looper in the parent.
+
+    """
+    return [c for c in main.children if c.__class__.__name__ == 'Row']
+
+
+def test_looper_refresh():
+    """ Test that the looper reuses and reorders its iterations.
+
+    """
+    main = compile_source(SOURCE, 'Main')(iterable=[1, 2, 3, 4])
+    main.initialize()
+    old = dict((r.value, r) for r in rows(main))
+    assert [r.value for r in rows(main)] == [1, 2, 3, 4]
+    assert [r.index_text for r in rows(main)] == ['0', '1', '2', '3']
+    # A '=' binding keeps the value of its first read, even when the
+    # iteration is moved.
+    assert [r.first_index for r in rows(main)] == [0, 1, 2, 3]
+    old[4].first_index = 'user'
+
+    main.iterable = [4, 1, 3, 5]
+    new = rows(main)
+    assert [r.value for r in new] == [4, 1, 3, 5]
+    assert [r.index() for r in new] == [0, 1, 2, 3]
+    assert [r.index_text for r in new] == ['0', '1', '2', '3']
+    assert [r.first_index for r in new[:3]] == ['user', 0, 2]
+    assert all(r is old[r.value] for r in new[:3])
+    assert old[2].is_destroyed
+    assert isinstance(main.children[-1], Looper)
+
+    main.iterable = [[1], [2]]
+    assert [r.value for r in rows(main)] == [[1], [2]]
+    assert len(main.children[-1].items) == 2
+
+
+def test_increasing_subsequence():
+    """ Test the computation of the longest increasing subsequence.
+
+    """
+    assert _increasing_subsequence([]) == []
+    assert _increasing_subsequence([3, 0, 1, 4, 2]) == [1, 2, 4]
+    assert _increasing_subsequence([0, 1, 2]) == [0, 1, 2]
@@ -0,0 +1,122 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml import imports
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from atom.api import Atom, Int
+from enaml.core.api import ViewPool
+from enaml.core.declarative import Declarative
+from enaml.stdlib.mapped_view import MappedView
+
+class A(Atom):
+    value = Int()
+
+class B(Atom):
+    value = Int()
+
+class C(Atom):
+    value = Int()
+
+enamldef ViewA(Declarative):
+    attr model
+    attr value << model.value
+
+enamldef ViewB(ViewA):
+    pass
+
+enamldef ViewC(ViewA):
+    pass
+
+enamldef Main(Declarative): main:
+    attr model
+    alias view
+    MappedView: view:
+        model << main.model
+        typemap = {A: ViewA, B: ViewB, C: ViewC}
+        pool = ViewPool(size=2)
+
+def make():
+    return Main, A, B, C
+
+""")
+
+
+def test_mapped_view_pool():
+    """ Test that the pooled views are rebound instead of recreated.
+
+    """
+    with imports():
+        Main, A, B, C = compile_source(SOURCE, 'make')()
+    a1, a2, b = A(value=1), A(value=2), B(value=3)
+    main = Main(model=a1)
+    main.initialize()
+    pool = main.view.pool
+    view_a = main.children[0]
+    assert view_a.value == 1
+    assert (pool.hits, pool.misses) == (0, 1)
+
+    main.model = a2
+    assert main.children[0] is view_a
+    assert view_a.value == 2
+    assert (pool.hits, pool.misses) == (1, 1)
+
+    # The views of another type are detached and suspended.
+    main.model = b
+    view_b = main.children[0]
+    assert view_b.value == 3
+    assert view_a.parent is None and not view_a.is_destroyed
+    a1.value = 5
+    main.model = a1
+    assert main.children[0] is view_a
+    assert view_a.value == 5
+    assert (pool.hits, pool.misses) == (2, 2)
+
+    # The least recently used views are evicted.
+    main.model = C()
+    assert pool.evictions == 1
+    assert view_b.is_destroyed
+    assert not view_a.is_destroyed
+
+    # The views in use are only evicted once they are replaced.
+    view_c = main.children[0]
+    parents = []
+    view_c.observe('destroyed', lambda change: parents.append(view_c.parent))
+    pool.size = 1
+    main.model = B()
+    assert view_a.is_destroyed
+    assert parents == [None]
+    assert pool.evictions == 3
+
+    view = main.children[0]
+    main.destroy()
+    assert view.is_destroyed
+    assert len(pool) == 0
+
+
+def test_mapped_view_pool_keeps_included_views():
+    """ Test that the included views are not destroyed with the pool
+    when the old views are not destroyed.
+
+    """
+    with imports():
+        Main, A, B, C = compile_source(SOURCE, 'make')()
+    a, b = A(value=1), B(value=2)
+    main = Main(model=a)
+    main.initialize()
+    main.view.destroy_old = False
+    view_a = main.children[0]
+    main.model = b
+    view_b = main.children[0]
+    main.view.destroy()
+    assert view_a.is_destroyed
+    assert not view_b.is_destroyed
+    assert view_b.parent is main
@@ -0,0 +1,59 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.compat import exec_
+from enaml.core import operators
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+
+
+SOURCE = dedent("""\
+from enaml.core.declarative import Declarative
+
+enamldef Main(Declarative):
+    attr a : int = 1
+    attr b : int << a + 1
+    attr c : int
+    attr d : int = 0
+    c := b
+    b >> d
+    a ::
+        pass
+
+""")
+
+
+def test_operator_code_precomputed(monkeypatch):
+    """Test that loading compiled code does not rewrite any bytecode.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE), '<test>')
+
+    def fail(code):
+        raise AssertionError('code should have been precomputed')
+
+    monkeypatch.setattr(operators, 'CODE_GENERATORS',
+                        dict.fromkeys(operators.CODE_GENERATORS, fail))
+    namespace = {}
+    exec_(code, namespace)
+    main = namespace['Main']()
+    assert main.a == 1
+    assert main.b == 2
+    assert main.c == 2
+    main.a = 2
+    assert main.d == 3
+
+
+def test_operator_code_fallback():
+    """Test that operators still accept a bare code object.
+
+    """
+    code = compile('a + 1', '<test>', 'eval')
+    func = operators.gen_tracer(code, {})
+    assert func.__code__.co_varnames[0] == '_[tracer]'
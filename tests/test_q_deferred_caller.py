@@ -0,0 +1,64 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import threading
+
+import pytest
+from utils import is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+def test_deferred_calls_are_coalesced(enaml_qtbot):
+    """ Test that the calls from a thread are run in order in batches,
+    and that the keyed calls replace each other.
+
+    """
+    from enaml.qt.q_deferred_caller import (
+        deferredCall, deferredCaller, keyedDeferredCall
+    )
+    caller = deferredCaller()
+    caller.resetCounters()
+    calls = []
+    latest = []
+
+    def worker():
+        for i in range(100):
+            deferredCall(calls.append, i)
+            keyedDeferredCall('price', latest.append, i)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    def check_calls():
+        assert len(calls) == 100
+    enaml_qtbot.wait_until(check_calls, 1000)
+    assert calls == list(range(100))
+    assert latest[-1] == 99
+    assert len(latest) + caller.dropped == 100
+    assert caller.merged > 0
+
+
+def test_main_thread_deferred_calls_are_posted(enaml_qtbot):
+    """ Test that the calls from the main thread are posted as their
+    own events, in order.
+
+    """
+    from enaml.qt.q_deferred_caller import deferredCall, deferredCaller
+    caller = deferredCaller()
+    caller.resetCounters()
+    calls = []
+    for i in range(10):
+        deferredCall(calls.append, i)
+
+    def check_calls():
+        assert len(calls) == 10
+    enaml_qtbot.wait_until(check_calls, 1000)
+    assert calls == list(range(10))
+    assert caller.merged == 0
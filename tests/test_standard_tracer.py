@@ -0,0 +1,201 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013-2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import gc
+import threading
+from textwrap import dedent
+
+import pytest
+from atom.api import atomref
+
+from enaml.core.api import batch_updates
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from atom.api import Int
+from enaml.core.declarative import Declarative
+
+class Model(Declarative):
+    a = Int()
+    b = Int()
+    evaluations = Int()
+
+    def count(self, value):
+        self.evaluations += 1
+        return value
+
+enamldef Main(Declarative):
+    attr model = Model()
+    attr total << model.count(model.a + model.b)
+    attr double << total * 2
+    attr check << model.count(double - total)
+
+""")
+
+
+def test_batch_updates():
+    """ Test that batched expressions are evaluated once, in order.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    model = main.model
+    assert main.check == 0
+    model.evaluations = 0
+
+    with batch_updates():
+        model.a = 1
+        model.b = 2
+        with batch_updates():
+            model.a = 3
+        assert main.total == 0
+        assert model.evaluations == 0
+
+    assert main.total == 5
+    assert main.double == 10
+    assert main.check == 5
+    assert model.evaluations == 2
+
+
+def test_unbatched_updates():
+    """ Test that expressions are updated synchronously by default.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    model = main.model
+    model.a = 1
+    assert main.total == 1
+    model.b = 2
+    assert main.check == 3
+
+
+ERROR_SOURCE = dedent("""\
+from atom.api import Int
+from enaml.core.declarative import Declarative
+
+class Model(Declarative):
+    a = Int(1)
+    b = Int()
+
+enamldef Main(Declarative):
+    attr model = Model()
+    attr inverse << 1 // model.a
+    attr copy << model.b
+
+""")
+
+
+def test_batch_updates_error():
+    """ Test that a failing update does not drop the other updates.
+
+    """
+    main = compile_source(ERROR_SOURCE, 'Main')()
+    model = main.model
+    assert (main.inverse, main.copy) == (1, 0)
+    with pytest.raises(ZeroDivisionError):
+        with batch_updates():
+            model.a = 0
+            model.b = 3
+    assert main.copy == 3
+
+    # The batch is usable after the error.
+    with batch_updates():
+        model.b = 4
+    assert main.copy == 4
+
+
+def test_batch_updates_thread_local():
+    """ Test that a batch only defers the updates of its thread.
+
+    """
+    main = compile_source(ERROR_SOURCE, 'Main')()
+    model = main.model
+    assert main.copy == 0
+
+    def worker():
+        model.b = 2
+
+    with batch_updates():
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert main.copy == 2
+        model.b = 3
+        assert main.copy == 2
+    assert main.copy == 3
+
+
+SWITCH_SOURCE = dedent("""\
+from atom.api import Bool, Int
+from enaml.core.declarative import Declarative
+
+class Model(Declarative):
+    flag = Bool()
+    a = Int()
+    b = Int()
+
+enamldef Main(Declarative):
+    attr model = Model()
+    attr value << model.a if model.flag else model.b
+
+""")
+
+
+def test_incremental_subscription():
+    """ Test that the observer is reused and follows the dependencies.
+
+    """
+    main = compile_source(SWITCH_SOURCE, 'Main')()
+    model = main.model
+    assert main.value == 0
+    observer = main._d_storage['_[value|trace]']
+    assert (model, 'b') in set(observer.dependencies())
+    assert model.has_observer('b', observer)
+
+    model.flag = True
+    assert main._d_storage['_[value|trace]'] is observer
+    assert (model, 'a') in set(observer.dependencies())
+    assert not model.has_observer('b', observer)
+
+    model.b = 2
+    assert main.value == 0
+    model.a = 1
+    assert main.value == 1
+
+
+PAIR_SOURCE = dedent("""\
+from atom.api import Atom, Int
+from enaml.core.declarative import Declarative
+
+class Model(Atom):
+    a = Int()
+
+enamldef Pair(Declarative):
+    attr left
+    attr right
+    attr total << left.a + right.a
+
+""")
+
+
+def test_subscription_items_are_weak():
+    """ Test that an observer does not keep the observed items alive.
+
+    """
+    Model = compile_source(PAIR_SOURCE, 'Model')
+    Pair = compile_source(PAIR_SOURCE, 'Pair')
+    left = Model()
+    right = Model(a=2)
+    pair = Pair(left=left, right=right)
+    assert pair.total == 2
+
+    # The long lived model holds the observer, which must not keep the
+    # other model alive once the pair is gone.
+    ref = atomref(right)
+    del pair, right
+    gc.collect()
+    assert not ref
@@ -488,6 +488,8 @@ def _clear_cache():
     StyleCache._style_items.clear()
     StyleCache._queried_items.clear()
     StyleCache._toolkit_setters.clear()
+    StyleCache._toolkit_styles.clear()
+    StyleCache._style_sheet_indices.clear()
 
 
 def _cache_items_empty():
@@ -594,3 +596,249 @@ def test_cache_2():
     sheet.destroy()
     assert _cache_styles_empty()
     assert app.style_sheet is None
+
+
+def test_style_index(monkeypatch):
+    from enaml.styling import StyleCache
+    source = dedent("""\
+    from enaml.widgets.api import Window, Container, PushButton, Field
+    from enaml.styling import StyleSheet, Style, Setter
+
+    enamldef Sheet(StyleSheet):
+        Style:
+            element = 'PushButton, Field'
+        Style:
+            style_class = 'yellow'
+        Style:
+            object_name = 'field'
+        Style:
+            pass
+
+    enamldef Main(Window):
+        alias button
+        alias field
+        Sheet:
+            pass
+        Container:
+            PushButton: button:
+                style_class = 'yellow red'
+            Field: field:
+                name = 'field'
+
+    """)
+    _clear_cache()
+    restyled = set()
+    monkeypatch.setattr(StyleCache, '_request_restyle',
+                        classmethod(lambda cls, items: restyled.update(items)))
+    main = compile_source(source, 'Main')()
+    main.initialize()
+    sheet = main.style_sheet()
+    first, second, third, fourth = sheet.styles()
+    index = StyleCache._style_index(sheet)
+    assert index.candidates(main.button) == [first, second, fourth]
+    assert index.candidates(main.field) == [first, third, fourth]
+    assert StyleCache.styles(main.button) == (fourth, first, second)
+    assert StyleCache.styles(main.field) == (fourth, first, third)
+
+    # Only the items matching the old or new selector are restyled.
+    second.style_class = 'red'
+    assert restyled == set([main.button])
+    assert StyleCache.styles(main.button) == (fourth, first, second)
+
+    restyled.clear()
+    third.set_parent(None)
+    assert restyled == set([main.field])
+    assert StyleCache.styles(main.field) == (fourth, first)
+    assert StyleCache.styles(main.button) == (fourth, first, second)
+
+    # The window was never shown, it cannot be closed by the fixtures.
+    main.destroy()
+
+
+def test_shared_style_sheet(enaml_qtbot):
+    from enaml.qt.styleutil import SHARED_STYLE_PROPERTY, SharedStyleSheet
+    source = dedent("""\
+    from enaml.widgets.api import Window, Container, PushButton
+    from enaml.styling import StyleSheet, Style, Setter
+
+    enamldef Sheet(StyleSheet):
+        Style:
+            element = 'PushButton'
+            Setter:
+                field = 'background'
+                value = 'blue'
+        Style:
+            style_class = 'red'
+            Setter:
+                field = 'color'
+                value = 'red'
+
+    enamldef Main(Window):
+        alias button
+        Sheet:
+            pass
+        Container:
+            PushButton: button:
+                pass
+
+    """)
+    _clear_cache()
+    app = enaml_qtbot.enaml_app
+    user_sheet = u'QLabel { color: green; }'
+    app._qapp.setStyleSheet(user_sheet)
+    app.shared_style_sheet = True
+    try:
+        main = compile_source(source, 'Main')()
+        main.show()
+        widget = main.button.proxy.widget
+        SharedStyleSheet.flush()
+        assert widget.styleSheet() == u''
+        ids = widget.property(SHARED_STYLE_PROPERTY).split()
+        assert len(ids) == 1
+        assert 'background: blue' in app._qapp.styleSheet()
+        assert ids[0] in app._qapp.styleSheet()
+
+        main.button.style_class = 'red'
+        main.button.proxy.restyle()
+        SharedStyleSheet.flush()
+        assert len(widget.property(SHARED_STYLE_PROPERTY).split()) == 2
+        assert 'color: red' in app._qapp.styleSheet()
+
+        # The style sheet set by the user is preserved.
+        app_sheet = app._qapp.styleSheet()
+        assert app_sheet.startswith(user_sheet)
+        assert app_sheet.count(u'enaml shared styles') == 1
+
+        # A new user style sheet is preserved even if it contains the
+        # generated rules.
+        generated = app_sheet[len(user_sheet):]
+        new_user_sheet = generated + u'\nQLabel { color: black; }'
+        app._qapp.setStyleSheet(new_user_sheet)
+        SharedStyleSheet.flush()
+        app_sheet = app._qapp.styleSheet()
+        assert app_sheet.startswith(new_user_sheet)
+        assert app_sheet.count(u'enaml shared styles') == 2
+        main.close()
+    finally:
+        app.shared_style_sheet = False
+        app._qapp.setStyleSheet(u'')
+        SharedStyleSheet._user_style_sheet = u''
+        SharedStyleSheet._applied_style_sheet = None
+
+
+def test_cached_style_translation(enaml_qtbot):
+    from enaml.styling import StyleCache
+    from enaml.qt.styleutil import cached_style
+    source = dedent("""\
+    from enaml.widgets.api import Window, Container, PushButton
+    from enaml.styling import StyleSheet, Style, Setter
+
+    enamldef Sheet(StyleSheet):
+        Style:
+            element = 'PushButton'
+            pseudo_class = 'hover, pressed'
+            Setter:
+                field = 'background'
+                value = 'blue'
+
+    enamldef Main(Window):
+        alias button
+        Sheet:
+            pass
+        Container:
+            PushButton: button:
+                pass
+
+    """)
+    _clear_cache()
+    main = compile_source(source, 'Main')()
+    main.show()
+    widget = main.button.proxy.widget
+    style, = StyleCache.styles(main.button)
+    translated = cached_style(style)
+    assert translated[0] == (':hover', ':pressed')
+    assert 'background: blue' in widget.styleSheet()
+
+    # An unchanged restyle reuses the translation.
+    main.button.proxy.restyle()
+    assert cached_style(style) is translated
+
+    style.setters()[0].value = 'red'
+    main.button.proxy.restyle()
+    assert cached_style(style) is not translated
+    assert 'background: red' in widget.styleSheet()
+    main.close()
+
+
+def test_restyle_order_and_budget(monkeypatch):
+    from atom.api import Bool
+    import enaml.styling
+    from enaml.styling import StyleCache, Stylable
+
+    restyled = []
+
+    class Item(Stylable):
+        visible = Bool(True)
+
+        def restyle(self):
+            restyled.append(self)
+
+    calls = []
+    monkeypatch.setattr(enaml.styling, 'deferred_call', calls.append)
+    monkeypatch.setattr(StyleCache, 'restyle_budget', 0)
+    monkeypatch.setattr(StyleCache, '_restyle_task', None)
+    stats = StyleCache.restyle_stats
+    stats.reset()
+
+    root = Item()
+    hidden = Item(root, visible=False)
+    shown = Item(root)
+    child = Item(shown)
+    hidden_child = Item(hidden)
+    items = [hidden_child, child, hidden, shown, root]
+
+    StyleCache._request_restyle(items)
+    assert len(calls) == 1
+    calls.pop()()
+    assert restyled == [root, shown, child, hidden, hidden_child]
+    assert stats.passes == 1 and stats.last_items == 5
+
+    # With a tiny budget, a single item is restyled per slice.
+    del restyled[:]
+    stats.reset()
+    monkeypatch.setattr(StyleCache, 'restyle_budget', 1e-9)
+    StyleCache._request_restyle(items)
+    while calls:
+        calls.pop()()
+    assert restyled == [root, shown, child, hidden, hidden_child]
+    assert stats.slices == 5
+    assert stats.passes == 1
+    assert StyleCache._restyle_task is None
+
+
+def test_restyle_order_toolkit_visibility(enaml_qtbot):
+    from enaml.styling import _restyle_order
+    source = dedent("""\
+    from enaml.widgets.api import Window, Notebook, Page, PushButton
+
+    enamldef Main(Window):
+        alias first
+        alias second
+        Notebook:
+            Page: first:
+                PushButton:
+                    pass
+            Page: second:
+                PushButton:
+                    pass
+
+    """)
+    main = compile_source(source, 'Main')()
+    main.show()
+    first, = main.first.children
+    second, = main.second.children
+    # The second page is not current, so the toolkit hides its button
+    # even though it is declared visible.
+    assert second.visible
+    assert _restyle_order([second, first]) == [first, second]
+    main.close()